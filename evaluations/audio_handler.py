@@ -1,18 +1,18 @@
 """Audio processing utilities for evaluation system."""
 
 import base64
-import wave
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator, Optional
 
 from models import DEFAULT_PARTICIPANT_ID
+from vt_voice_translation_poc.wav import WavFile, read_wav_format
 
 
 DEFAULT_CHUNK_DURATION_MS = 100
 
 
-def read_wav_chunks(wav_path: Path, chunk_duration_ms: int = DEFAULT_CHUNK_DURATION_MS) -> Iterator[bytes]:
+def read_wav_chunks(wav_path: Path, chunk_duration_ms: int = DEFAULT_CHUNK_DURATION_MS) -> Iterator[memoryview]:
     """
     Read WAV file and yield raw PCM chunks of specified duration.
 
@@ -26,32 +26,22 @@ def read_wav_chunks(wav_path: Path, chunk_duration_ms: int = DEFAULT_CHUNK_DURAT
         chunk_duration_ms: Duration of each chunk in milliseconds
 
     Yields:
-        Raw PCM audio bytes as stored in the WAV file
+        Raw PCM audio as stored in the WAV file (zero-copy views of the mapped file)
     """
-    with wave.open(str(wav_path), "rb") as wav_file:
-        sample_rate = wav_file.getframerate()
-        sample_width = wav_file.getsampwidth()
-        channels = wav_file.getnchannels()
+    with WavFile(wav_path) as wav_file:
+        wav_format = wav_file.format
 
-        print(f"  WAV format: {sample_rate}Hz, {sample_width*8}-bit, {channels} channel(s)")
+        print(
+            f"  WAV format: {wav_format.sample_rate}Hz, {wav_format.bits_per_sample}-bit, "
+            f"{wav_format.channels} channel(s)"
+        )
 
         # Calculate frames per chunk based on duration
-        frames_per_chunk = int(sample_rate * chunk_duration_ms / 1000)
+        frames_per_chunk = wav_format.frames_for_ms(chunk_duration_ms)
 
         print(f"  Chunk size: {frames_per_chunk} frames (~{chunk_duration_ms}ms)")
 
-        total_frames = wav_file.getnframes()
-        frames_read = 0
-
-        while frames_read < total_frames:
-            frames_to_read = min(frames_per_chunk, total_frames - frames_read)
-            chunk = wav_file.readframes(frames_to_read)
-
-            if not chunk:
-                break
-
-            frames_read += frames_to_read
-            yield chunk
+        yield from wav_file.chunks(frames_per_chunk)
 
 
 def get_wav_format(wav_path: Path) -> tuple[int, int, int]:
@@ -63,15 +53,12 @@ def get_wav_format(wav_path: Path) -> tuple[int, int, int]:
     and play back audio at the correct speed instead of assuming 16 kHz mono
     for all inputs.
     """
-    with wave.open(str(wav_path), "rb") as wav_file:
-        sample_rate = wav_file.getframerate()
-        channels = wav_file.getnchannels()
-        bits_per_sample = wav_file.getsampwidth() * 8
-    return sample_rate, channels, bits_per_sample
+    wav_format = read_wav_format(wav_path)
+    return wav_format.sample_rate, wav_format.channels, wav_format.bits_per_sample
 
 
 def create_audio_data_message(
-    audio_chunk: bytes,
+    audio_chunk: bytes | memoryview,
     participant_id: str = DEFAULT_PARTICIPANT_ID,
     silent: bool = False,
     *,
@@ -0,0 +1,106 @@
+"""Pre-encoded audio frames for the ACS emulator.
+
+Streaming a scenario used to re-read every WAV, base64-encode every 20 ms frame
+and rebuild identical silence frames for each participant on every tick. The
+encoded form of a frame never changes, so it is computed once per process:
+
+* ``file_frames`` returns the frames of a WAV (per frame duration) with their
+  base64 payloads, keyed by path, size and mtime so edited files are re-encoded.
+* ``silence_frame`` returns the single encoded zero frame of a given size.
+
+``ProtocolAdapter.build_encoded_audio_message`` then assembles the ACS message
+(and its JSON text) from these fragments, so a frame costs a few string joins
+instead of an encode plus ``json.dumps``. The cache is shared by every call the
+emulator process drives.
+"""
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple, Union
+
+from production.acs_emulator.media_engine import FRAME_DURATION_MS, chunk_audio
+from production.acs_emulator.models import _iso_timestamp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILES = 128
+
+
+@dataclass(frozen=True)
+class EncodedFrame:
+    """One PCM frame and its base64 encoding."""
+
+    offset_ms: int
+    pcm: Union[bytes, memoryview]
+    data_b64: str
+
+
+class AudioFrameCache:
+    """LRU of encoded WAV frames plus the encoded silence frames."""
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES) -> None:
+        self.max_files = max_files
+        self._files: OrderedDict[tuple, Tuple[EncodedFrame, ...]] = OrderedDict()
+        self._silence: dict[int, EncodedFrame] = {}
+        self._lock = threading.Lock()
+
+    def file_frames(self, path: Path, frame_duration_ms: int = FRAME_DURATION_MS) -> Tuple[EncodedFrame, ...]:
+        """Encoded frames of a mono 16-bit WAV, encoding it on first use."""
+        stat = os.stat(path)
+        key = (str(Path(path).resolve()), frame_duration_ms, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            frames = self._files.get(key)
+            if frames is not None:
+                self._files.move_to_end(key)
+                return frames
+
+        frames = tuple(
+            EncodedFrame(offset_ms=offset_ms, pcm=pcm, data_b64=base64.b64encode(pcm).decode("ascii"))
+            for offset_ms, pcm in chunk_audio(Path(path), frame_duration_ms)
+        )
+        logger.debug("Encoded %d frames for %s (%d ms)", len(frames), path, frame_duration_ms)
+
+        with self._lock:
+            self._files[key] = frames
+            self._files.move_to_end(key)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+        return frames
+
+    def silence_frame(self, byte_count: int) -> EncodedFrame:
+        """The encoded all-zero frame of ``byte_count`` bytes."""
+        frame = self._silence.get(byte_count)
+        if frame is None:
+            pcm = bytes(byte_count)
+            frame = EncodedFrame(offset_ms=0, pcm=pcm, data_b64=base64.b64encode(pcm).decode("ascii"))
+            self._silence[byte_count] = frame
+        return frame
+
+
+@lru_cache(maxsize=1 << 16)
+def cached_iso_timestamp(timestamp_ms: int) -> str:
+    """``_iso_timestamp`` for scenario-timeline values, which repeat across calls."""
+    return _iso_timestamp(timestamp_ms)
+
+
+_default_cache = AudioFrameCache()
+
+
+def default_frame_cache() -> AudioFrameCache:
+    """Process-wide cache shared by all scenarios."""
+    return _default_cache
+
+
+__all__ = [
+    "AudioFrameCache",
+    "EncodedFrame",
+    "cached_iso_timestamp",
+    "default_frame_cache",
+]
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
-import wave
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Iterator, Tuple
 
+from vt_voice_translation_poc.wav import WavFile
 
 logger = logging.getLogger(__name__)
 
@@ -28,35 +29,32 @@ class MediaFrame:
     is_silence: bool = False
 
 
-def _yield_frames(wav: wave.Wave_read, frame_duration_ms: int) -> Iterator[Tuple[int, bytes]]:
-    sample_rate = wav.getframerate()
-    frame_size = int(sample_rate * (frame_duration_ms / 1000.0))
+def _yield_frames(wav: WavFile, frame_duration_ms: int) -> Iterator[Tuple[int, memoryview]]:
+    frame_size = int(wav.format.sample_rate * (frame_duration_ms / 1000.0))
     timestamp_ms = 0
-    while True:
-        data = wav.readframes(frame_size)
-        if not data:
-            break
+    for data in wav.chunks(frame_size):
         yield timestamp_ms, data
         timestamp_ms += frame_duration_ms
 
 
-def chunk_audio(file_path: Path, frame_duration_ms: int = FRAME_DURATION_MS) -> Iterator[Tuple[int, bytes]]:
+def chunk_audio(file_path: Path, frame_duration_ms: int = FRAME_DURATION_MS) -> Iterator[Tuple[int, memoryview]]:
     """Chunk a WAV file into PCM frames with timestamps.
 
-    This uses only the stdlib ``wave`` module to avoid optional dependencies.
+    Frames are zero-copy views over the memory-mapped file (see
+    ``vt_voice_translation_poc.wav``); they stay valid after iteration ends.
     The function expects mono 16-bit PCM input; callers should normalize audio
     before invoking if different formats are required.
     """
 
-    with wave.open(str(file_path), "rb") as wav:
-        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+    with WavFile(file_path) as wav:
+        if wav.format.channels != 1 or wav.format.sample_width != 2:
             raise ValueError(
-                f"Unsupported audio format: channels={wav.getnchannels()} width={wav.getsampwidth()}"
+                f"Unsupported audio format: channels={wav.format.channels} width={wav.format.sample_width}"
             )
         yield from _yield_frames(wav, frame_duration_ms)
 
 
-async def async_chunk_audio(file_path: Path, frame_duration_ms: int = FRAME_DURATION_MS) -> AsyncIterator[Tuple[int, bytes]]:
+async def async_chunk_audio(file_path: Path, frame_duration_ms: int = FRAME_DURATION_MS) -> AsyncIterator[Tuple[int, memoryview]]:
     for timestamp_ms, data in chunk_audio(file_path, frame_duration_ms):
         yield timestamp_ms, data
 
@@ -92,6 +90,12 @@ def generate_silence_frame(sample_rate: int, channels: int = 1, sample_width: in
     return bytes(frame_size)
 
 
+@lru_cache(maxsize=64)
+def _silence_bytes(size: int) -> bytes:
+    # bytes are immutable, so one zero buffer per size can be shared by every frame
+    return bytes(size)
+
+
 async def async_stream_silence(
     duration_ms: int,
     start_time_ms: int = 0,
@@ -130,7 +134,7 @@ async def async_stream_silence(
         else:
             chunk_size = frame_size
 
-        silence_data = bytes(chunk_size)
+        silence_data = _silence_bytes(chunk_size)
         yield MediaFrame(
             timestamp_ms=current_time,
             data=silence_data
@@ -6,14 +6,15 @@ import logging
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from production.acs_emulator.frame_cache import EncodedFrame, cached_iso_timestamp
 from production.acs_emulator.models import AcsAudioMessage, AcsAudioMetadata, AcsTranscriptMessage, TranslationTextDelta, _iso_timestamp
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolEvent:
     event_type: str
     participant_id: Optional[str]
@@ -33,6 +34,8 @@ class ProtocolAdapter:
         self.subscription_id = str(uuid.uuid4())
         self._transcript_buffers: dict[str, str] = {}
         self._message_handlers: List | None = None
+        # participant id -> JSON fragment following the audio data
+        self._audio_fragments: dict[str, str] = {}
 
     def build_audio_metadata(self, sample_rate: int, channels: int, frame_bytes: int) -> Dict[str, Any]:
         metadata = AcsAudioMetadata(
@@ -63,6 +66,41 @@ class ProtocolAdapter:
         logger.debug("Built ACS AudioData message: %s", json.dumps({**payload, "audioData": {**payload["audioData"], "data": "<omitted>"}}))
         return payload
 
+    def build_encoded_audio_message(
+        self,
+        participant_id: str,
+        frame: EncodedFrame,
+        timestamp_ms: int,
+        silent: bool = False,
+    ) -> Tuple[Dict[str, Any], str]:
+        """Same message as ``build_audio_message`` from a pre-encoded frame.
+
+        Returns the payload and its JSON text, assembled from cached fragments;
+        pass the text to ``send_json(payload, encoded=...)`` to skip ``json.dumps``.
+        """
+        timestamp = cached_iso_timestamp(timestamp_ms)
+        audio_payload: Dict[str, Any] = {"data": frame.data_b64}
+        if participant_id:
+            audio_payload["participantRawID"] = participant_id
+        audio_payload["timestamp"] = timestamp
+        audio_payload["silent"] = silent
+        payload = {"kind": "AudioData", "audioData": audio_payload}
+
+        fragment = self._audio_fragments.get(participant_id)
+        if fragment is None:
+            fragment = f', "participantRawID": {json.dumps(participant_id)}' if participant_id else ""
+            self._audio_fragments[participant_id] = fragment
+        encoded = (
+            '{"kind": "AudioData", "audioData": {"data": "'
+            + frame.data_b64
+            + '"'
+            + fragment
+            + ', "timestamp": "'
+            + timestamp
+            + ('", "silent": true}}' if silent else '", "silent": false}}')
+        )
+        return payload, encoded
+
     def build_outbound_audio(self, pcm_bytes: bytes, play_to: str = "all", silent: bool = False) -> Dict[str, Any]:
         """Construct an outbound AudioData payload for bidirectional scenarios."""
 
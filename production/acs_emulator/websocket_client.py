@@ -58,10 +58,11 @@ class WebSocketClient:
             await self._conn.close()
             self._conn = None
 
-    async def send_json(self, payload: Dict[str, Any]) -> None:
+    async def send_json(self, payload: Dict[str, Any], *, encoded: Optional[str] = None) -> None:
+        """Send ``payload``; ``encoded`` is its JSON text if the caller already has it."""
         if not self._conn:
             raise RuntimeError("WebSocket connection not established")
-        message = json.dumps(payload)
+        message = encoded if encoded is not None else json.dumps(payload)
         if self.debug_wire and self.log_sink:
             self.log_sink.append_message({"direction": "outbound", "message": payload})
         await self._conn.send(message)
@@ -59,8 +59,12 @@ class WebSocketLoopbackClient:
             task.cancel()
         self._pending_tasks.clear()
 
-    async def send_json(self, payload: Dict[str, Any]) -> None:
-        """Send JSON message by echoing it back after simulated latency."""
+    async def send_json(self, payload: Dict[str, Any], *, encoded: Optional[str] = None) -> None:
+        """Send JSON message by echoing it back after simulated latency.
+
+        ``encoded`` is accepted for parity with WebSocketClient; the payload
+        itself is echoed.
+        """
         if not self._connected:
             raise RuntimeError("WebSocket connection not established")
 
@@ -0,0 +1,53 @@
+"""Shared per-session storage for inbound audio payloads."""
+from __future__ import annotations
+
+from typing import List, Union
+
+DEFAULT_BLOCK_SIZE = 256 * 1024
+
+PcmBuffer = Union[bytes, bytearray, memoryview]
+
+
+class AudioArena:
+    """Append-only store that packs one session's audio payloads into large blocks.
+
+    Each decoded audio delta would otherwise be its own ``bytes`` object, held
+    by the collected event and the conversation tape until the session ends.
+    ``store`` copies the payload into the current block and returns a read-only
+    view of it; the event and the tape both keep that view, the decoded
+    ``bytes`` is released right away, and the whole session's audio is freed in
+    a few large blocks when the arena goes away.
+
+    Blocks are never resized or reused, so views stay valid for the arena's
+    lifetime and can be read from other threads.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self.block_size = block_size
+        self.size = 0  # payload bytes stored
+        self._blocks: List[bytearray] = []
+        self._used = 0  # bytes used in the last block
+
+    def store(self, payload: PcmBuffer) -> memoryview:
+        length = len(payload)
+        if not self._blocks or self._used + length > len(self._blocks[-1]):
+            # Payloads larger than a block get a block of their own
+            self._blocks.append(bytearray(max(self.block_size, length)))
+            self._used = 0
+        block = self._blocks[-1]
+        start = self._used
+        block[start : start + length] = payload
+        self._used += length
+        self.size += length
+        return memoryview(block)[start : start + length].toreadonly()
+
+    @property
+    def capacity(self) -> int:
+        """Bytes allocated across all blocks."""
+        return sum(len(block) for block in self._blocks)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+__all__ = ["AudioArena"]
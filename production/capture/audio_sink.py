@@ -1,9 +1,10 @@
 """Persist translated audio to disk."""
 from __future__ import annotations
 
+import struct
 import wave
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Iterable, Optional
 
 from production.capture.collector import CollectedEvent
 from production.capture.conversation_tape import ConversationTape
@@ -26,11 +27,15 @@ class AudioSink:
         for idx, event in enumerate(events):
             if event.audio_payload is None:
                 continue
-            # Create language pair string for filename
-            lang_pair = f"{event.source_language or 'unknown'}_to_{event.target_language or 'unknown'}" if event.source_language or event.target_language else 'unknown'
-            file_path = self.audio_dir / f"{idx:03d}_{lang_pair}_{event.participant_id or 'p'}.wav"
+            file_path = self.audio_dir / self.event_filename(idx, event)
             self._write_wav(file_path, event.audio_payload)
 
+    @staticmethod
+    def event_filename(idx: int, event: CollectedEvent) -> str:
+        # Create language pair string for filename
+        lang_pair = f"{event.source_language or 'unknown'}_to_{event.target_language or 'unknown'}" if event.source_language or event.target_language else 'unknown'
+        return f"{idx:03d}_{lang_pair}_{event.participant_id or 'p'}.wav"
+
     def write_call_mix(self, tape: ConversationTape) -> None:
         """Persist a single WAV containing all audio (inbound + outbound)."""
         file_path = self.audio_dir / "call_mix.wav"
@@ -44,4 +49,68 @@ class AudioSink:
             wav.writeframes(payload)
 
 
-__all__ = ["AudioSink", "AUDIO_EVENT_TYPES"]
+class StreamingWavWriter:
+    """Mono 16-bit PCM WAV that can be appended to while it is being written.
+
+    ``wave`` only writes the RIFF sizes when the file is closed, so a run that
+    dies mid-way leaves a WAV that claims to be empty. This writer patches the
+    sizes on every :meth:`flush`, so the file on disk is always a valid WAV
+    holding everything flushed so far.
+    """
+
+    _HEADER_BYTES = 44
+
+    def __init__(self, path: Path, sample_rate: int = 16000) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.data_bytes = 0
+        self._patched_bytes: Optional[int] = None
+        self._file: Optional[BinaryIO] = path.open("wb")
+        self._file.write(self._header(0))
+
+    def write(self, pcm: bytes) -> None:
+        if self._file is None:
+            raise ValueError(f"{self.path} is closed")
+        self._file.write(pcm)
+        self.data_bytes += len(pcm)
+
+    def flush(self) -> None:
+        """Make everything written so far a readable WAV on disk."""
+        if self._file is None or self._patched_bytes == self.data_bytes:
+            return
+        self._file.seek(0)
+        self._file.write(self._header(self.data_bytes))
+        self._file.seek(0, 2)
+        self._file.flush()
+        self._patched_bytes = self.data_bytes
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        if self.data_bytes % 2:
+            # Keep the data chunk word-aligned as RIFF requires
+            self._file.write(b"\x00")
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def _header(self, data_bytes: int) -> bytes:
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_bytes + (data_bytes & 1),
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,  # PCM
+            1,  # mono
+            self.sample_rate,
+            self.sample_rate * 2,
+            2,
+            16,
+            b"data",
+            data_bytes,
+        )
+
+
+__all__ = ["AudioSink", "AUDIO_EVENT_TYPES", "StreamingWavWriter"]
@@ -2,10 +2,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from enum import Enum
+from typing import Dict, List, Optional, Union
 
 
-@dataclass
+class RawRetention(str, Enum):
+    """Which collected events keep the raw inbound message in ``raw``.
+
+    Audio messages carry the same audio as ``audio_payload``, base64 encoded,
+    and nothing reads their ``raw``; text events' ``raw`` is written to
+    transcripts.json.
+    """
+
+    ALL = "all"
+    NON_AUDIO = "non_audio"
+    NONE = "none"
+
+    def keeps(self, has_audio: bool) -> bool:
+        if self is RawRetention.ALL:
+            return True
+        return self is RawRetention.NON_AUDIO and not has_audio
+
+
+@dataclass(slots=True)
 class CollectedEvent:
     event_type: str
     timestamp_ms: int
@@ -13,7 +32,8 @@ class CollectedEvent:
     source_language: Optional[str] = None
     target_language: Optional[str] = None
     text: Optional[str] = None
-    audio_payload: Optional[bytes] = None
+    # bytes, or a read-only view into the session's AudioArena
+    audio_payload: Optional[Union[bytes, memoryview]] = None
     raw: Dict | None = None
 
 
@@ -28,4 +48,4 @@ class EventCollector:
         return [event for event in self.events if event.event_type == event_type]
 
 
-__all__ = ["CollectedEvent", "EventCollector"]
+__all__ = ["CollectedEvent", "EventCollector", "RawRetention"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional
 
@@ -11,41 +12,182 @@ from production.utils.time_utils import Clock
 
 logger = logging.getLogger(__name__)
 
+AUDIO_EVENT_TYPE = "translated_audio"
+DELTA_EVENT_TYPE = "translated_delta"
+TEXT_EVENT_TYPES = ("translated_delta", "translated_text")
+
+
+def _min(current: Optional[int], value: int) -> int:
+    return value if current is None or value < current else current
+
+
+def _max(current: Optional[int], value: int) -> int:
+    return value if current is None or value > current else current
+
+
+class OutboundRecord:
+    """What was sent, when and how much - without keeping the payload itself.
+
+    One of these is recorded per outbound message (every 20 ms audio frame),
+    so it holds only the fields metrics use. ``message`` is the full payload
+    and stays ``None`` unless payload retention is enabled for debugging.
+    """
+
+    __slots__ = ("timestamp_ms", "participant_id", "kind", "size_bytes", "message")
+
+    def __init__(
+        self,
+        timestamp_ms: int,
+        participant_id: Optional[str],
+        kind: str,
+        size_bytes: int,
+        message: Optional[dict] = None,
+    ) -> None:
+        self.timestamp_ms = timestamp_ms
+        self.participant_id = participant_id
+        self.kind = kind
+        self.size_bytes = size_bytes
+        self.message = message
+
+    @classmethod
+    def from_message(
+        cls, message: dict, timestamp_ms: int, participant_id: Optional[str], retain_payload: bool = False
+    ) -> "OutboundRecord":
+        return cls(
+            timestamp_ms=timestamp_ms,
+            participant_id=participant_id,
+            kind=str(message.get("kind") or message.get("type") or "unknown"),
+            size_bytes=_payload_size(message),
+            message=message if retain_payload else None,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"OutboundRecord(timestamp_ms={self.timestamp_ms}, participant_id={self.participant_id!r}, "
+            f"kind={self.kind!r}, size_bytes={self.size_bytes})"
+        )
+
+
+def _payload_size(message: dict) -> int:
+    """Size of the media a message carries: decoded audio bytes or UTF-8 text bytes."""
+    audio = message.get("audioData")
+    if isinstance(audio, dict):
+        data = audio.get("data") or ""
+        return len(data) // 4 * 3 - (len(data) - len(data.rstrip("=")))
+    for key in ("delta", "text"):
+        text = message.get(key)
+        if isinstance(text, str):
+            return len(text.encode("utf-8"))
+    return 0
+
 
 @dataclass
 class TurnSummary:
-    """Aggregated view of ACS activity for a single scenario event (turn)."""
+    """Aggregated view of ACS activity for a single scenario event (turn).
+
+    First/last timestamps and counts are maintained as events are recorded, so
+    the timing properties are O(1) however many events a turn receives. Record
+    events through ``record_incoming``/``record_outgoing`` rather than appending
+    to the lists directly, or the aggregates go stale.
+    """
 
     turn_id: str
     metadata: Optional[dict] = None
     turn_start_ms: Optional[int] = None
-    outbound_messages: List[dict] = field(default_factory=list)
+    outbound_messages: List[OutboundRecord] = field(default_factory=list)
     inbound_events: List[CollectedEvent] = field(default_factory=list)
     first_outbound_ms: Optional[int] = None
     last_outbound_ms: Optional[int] = None
     turn_end_ms: Optional[int] = None
 
+    # Incremental aggregates over inbound_events
+    _first_response_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _completion_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _first_audio_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _last_audio_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _audio_count: int = field(default=0, init=False, repr=False)
+    _first_text_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _delta_events: List[CollectedEvent] = field(default_factory=list, init=False, repr=False)
+    _first_delta_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _last_delta_ms: Optional[int] = field(default=None, init=False, repr=False)
+    _translation: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for event in self.inbound_events:
+            self._aggregate(event)
+
     def record_outgoing(
-        self, message: dict, timestamp_ms: int, participant_id: str | None = None
+        self,
+        message: dict,
+        timestamp_ms: int,
+        participant_id: str | None = None,
+        *,
+        retain_payload: bool = False,
     ) -> None:
-        """Record an outbound ACS message for this turn."""
-        outbound_entry = {"message": message}
-        outbound_entry["timestamp_ms"] = timestamp_ms
+        """Record an outbound ACS message for this turn.
+
+        Only a compact ``OutboundRecord`` is kept; ``retain_payload`` also keeps
+        the full message (base64 audio included) for debugging.
+        """
         if self.first_outbound_ms is None:
             self.first_outbound_ms = timestamp_ms
         # Always update last outbound to track when audio finished
         self.last_outbound_ms = timestamp_ms
-        if participant_id:
-            outbound_entry["participant_id"] = participant_id
-        self.outbound_messages.append(outbound_entry)
+        self.outbound_messages.append(
+            OutboundRecord.from_message(message, timestamp_ms, participant_id or None, retain_payload)
+        )
 
     def record_incoming(self, event: CollectedEvent) -> None:
         """Record an inbound ACS event for this turn."""
         self.inbound_events.append(event)
+        self._aggregate(event)
+
+    def _aggregate(self, event: CollectedEvent) -> None:
+        timestamp_ms = event.timestamp_ms
+        self._first_response_ms = _min(self._first_response_ms, timestamp_ms)
+        self._completion_ms = _max(self._completion_ms, timestamp_ms)
+        event_type = event.event_type
+        if event_type == AUDIO_EVENT_TYPE:
+            self._audio_count += 1
+            self._first_audio_ms = _min(self._first_audio_ms, timestamp_ms)
+            self._last_audio_ms = _max(self._last_audio_ms, timestamp_ms)
+        elif event_type in TEXT_EVENT_TYPES:
+            self._first_text_ms = _min(self._first_text_ms, timestamp_ms)
+            if event_type == DELTA_EVENT_TYPE:
+                self._delta_events.append(event)
+                self._first_delta_ms = _min(self._first_delta_ms, timestamp_ms)
+                self._last_delta_ms = _max(self._last_delta_ms, timestamp_ms)
+                self._translation = None
 
     @property
     def translated_text_events(self) -> List[CollectedEvent]:
-        return [event for event in self.inbound_events if event.event_type == "translated_delta"]
+        """Text delta events in arrival order (shared list; do not mutate)."""
+        return self._delta_events
+
+    @property
+    def outbound_count(self) -> int:
+        return len(self.outbound_messages)
+
+    @property
+    def audio_event_count(self) -> int:
+        return self._audio_count
+
+    @property
+    def text_event_count(self) -> int:
+        """Number of translated text deltas."""
+        return len(self._delta_events)
+
+    @property
+    def last_audio_response_ms(self) -> Optional[int]:
+        return self._last_audio_ms
+
+    @property
+    def first_delta_ms(self) -> Optional[int]:
+        return self._first_delta_ms
+
+    @property
+    def last_delta_ms(self) -> Optional[int]:
+        return self._last_delta_ms
 
     def translation_text(self) -> str | None:
         """Return the complete translated text for this turn.
@@ -56,12 +198,14 @@ class TurnSummary:
         Returns:
             Complete translated text string (concatenated deltas), or None if no translation events exist
         """
-        events = self.translated_text_events
+        events = self._delta_events
         if not events:
             return None
 
-        # Concatenate all delta texts
-        return "".join(event.text for event in events if event.text)
+        # Concatenate all delta texts (cached until the next delta arrives)
+        if self._translation is None:
+            self._translation = "".join(event.text for event in events if event.text)
+        return self._translation
 
     @property
     def first_response_ms(self) -> Optional[int]:
@@ -70,9 +214,7 @@ class TurnSummary:
         Note: For audio translation services, consider using first_audio_response_ms
         instead, as that measures when audio (what user hears) actually arrives.
         """
-        if not self.inbound_events:
-            return None
-        return min(event.timestamp_ms for event in self.inbound_events)
+        return self._first_response_ms
 
     @property
     def first_audio_response_ms(self) -> Optional[int]:
@@ -81,24 +223,16 @@ class TurnSummary:
         For audio translation services, this is the true latency metric - when the
         user first hears the translation, not when text appears.
         """
-        audio_events = [e for e in self.inbound_events if e.event_type == "translated_audio"]
-        if not audio_events:
-            return None
-        return min(e.timestamp_ms for e in audio_events)
+        return self._first_audio_ms
 
     @property
     def first_text_response_ms(self) -> Optional[int]:
         """Get timestamp of first text event (for comparison with audio)."""
-        text_events = [e for e in self.inbound_events if e.event_type in ("translated_delta", "translated_text")]
-        if not text_events:
-            return None
-        return min(e.timestamp_ms for e in text_events)
+        return self._first_text_ms
 
     @property
     def completion_ms(self) -> Optional[int]:
-        if not self.inbound_events:
-            return None
-        return max(event.timestamp_ms for event in self.inbound_events)
+        return self._completion_ms
 
     @property
     def latency_ms(self) -> Optional[int]:
@@ -154,13 +288,18 @@ class TurnSummary:
 class ConversationManager:
     """Groups inbound/outbound ACS messages by scenario event (turn)."""
 
-    def __init__(self, *, clock: Clock, scenario_started_at_ms: int) -> None:
+    def __init__(
+        self, *, clock: Clock, scenario_started_at_ms: int, retain_outbound_payloads: bool = False
+    ) -> None:
         self._turns: List[TurnSummary] = []
+        self._turn_starts: List[int] = []  # turn_start_ms of _turns, non-decreasing
         self._turn_lookup: Dict[str, TurnSummary] = {}
         self._participant_turn: Dict[str, str] = {}
         self.clock = clock
         self.scenario_started_at_ms = scenario_started_at_ms
         self._last_outgoing_turn_id: Optional[str] = None
+        # Debug only: keep full outbound payloads, not just OutboundRecord fields
+        self.retain_outbound_payloads = retain_outbound_payloads
 
     def now_relative_ms(self) -> int:
         return max(0, self.clock.now_ms() - self.scenario_started_at_ms)
@@ -179,6 +318,7 @@ class ConversationManager:
             self._turns[-1].turn_end_ms = turn_start_ms
 
         self._turns.append(summary)
+        self._turn_starts.append(turn_start_ms)
         self._turn_lookup[turn_id] = summary
 
         logger.info(f"Turn created: '{turn_id}' at {turn_start_ms}ms (type: {metadata.get('type', 'unknown')})")
@@ -216,7 +356,12 @@ class ConversationManager:
         if timestamp_ms is None:
             timestamp_ms = self.now_relative_ms()
 
-        turn.record_outgoing(message, timestamp_ms=timestamp_ms, participant_id=participant_id)
+        turn.record_outgoing(
+            message,
+            timestamp_ms=timestamp_ms,
+            participant_id=participant_id,
+            retain_payload=self.retain_outbound_payloads,
+        )
         self._last_outgoing_turn_id = turn_id
 
     def register_incoming(self, event: CollectedEvent) -> None:
@@ -228,20 +373,16 @@ class ConversationManager:
         turn.record_incoming(event)
 
     def _resolve_turn_id(self, event: CollectedEvent) -> str:
-        timestamp_ms = self.now_relative_ms()
+        """The turn whose [start, next start) window contains the arrival time.
 
-        candidate: Optional[str] = None
-        for turn in self._turns:
-            start_at_ms = turn.turn_start_ms
-            end_at_ms = turn.turn_end_ms
-            if timestamp_ms >= start_at_ms and (end_at_ms is None or timestamp_ms < end_at_ms):
-                return turn.turn_id
-            if timestamp_ms >= start_at_ms:
-                candidate = turn.turn_id
-
-        if candidate:
-            return candidate
-        return self._turns[-1].turn_id if self._turns else "unassigned"
+        Each turn ends where the next one starts, so this is the last turn
+        started at or before now; events before the first turn go to the
+        latest turn.
+        """
+        if not self._turns:
+            return "unassigned"
+        index = bisect_right(self._turn_starts, self.now_relative_ms()) - 1
+        return self._turns[index].turn_id
 
     def get_turn_summary(self, turn_id: str) -> Optional[TurnSummary]:
         return self._turn_lookup.get(turn_id)
@@ -267,8 +408,8 @@ class ConversationManager:
             text_latency = turn.text_latency_ms  # Text latency for comparison
             first_chunk_latency = turn.first_chunk_latency_ms  # Total: from first audio chunk
             audio_duration = (turn.last_outbound_ms - turn.first_outbound_ms) if turn.last_outbound_ms and turn.first_outbound_ms else None
-            audio_events = [e for e in turn.inbound_events if e.event_type == "translated_audio"]
-            text_events = [e for e in turn.inbound_events if e.event_type == "translated_delta"]
+            audio_count = turn.audio_event_count
+            text_count = turn.text_event_count
 
             logger.info(
                 f"  Turn '{turn.turn_id}' ({turn.turn_start_ms}ms): {translation}"
@@ -295,31 +436,30 @@ class ConversationManager:
                         f"(includes {audio_duration}ms speaking + {latency}ms processing)"
                     )
 
-            if audio_events:
-                first_audio = min(e.timestamp_ms for e in audio_events)
-                last_audio = max(e.timestamp_ms for e in audio_events)
+            if audio_count:
+                first_audio = turn.first_audio_response_ms
+                last_audio = turn.last_audio_response_ms
                 logger.info(
-                    f"    🔊 Audio: {len(audio_events)} events, "
+                    f"    🔊 Audio: {audio_count} events, "
                     f"first={first_audio}ms, last={last_audio}ms, "
                     f"duration={last_audio - first_audio}ms"
                 )
 
-            if text_events:
-                first_text = min(e.timestamp_ms for e in text_events)
-                last_text = max(e.timestamp_ms for e in text_events)
+            if text_count:
+                first_text = turn.first_delta_ms
+                last_text = turn.last_delta_ms
                 logger.info(
-                    f"    📝 Text: {len(text_events)} events, "
+                    f"    📝 Text: {text_count} events, "
                     f"first={first_text}ms, last={last_text}ms"
                 )
 
             # Calculate gap from previous turn
             if i > 0:
                 prev_turn = self._turns[i - 1]
-                prev_audio_events = [e for e in prev_turn.inbound_events if e.event_type == "translated_audio"]
 
-                if prev_audio_events and audio_events:
-                    prev_last_audio = max(e.timestamp_ms for e in prev_audio_events)
-                    curr_first_audio = min(e.timestamp_ms for e in audio_events)
+                if prev_turn.audio_event_count and audio_count:
+                    prev_last_audio = prev_turn.last_audio_response_ms
+                    curr_first_audio = turn.first_audio_response_ms
                     gap = curr_first_audio - prev_last_audio
 
                     logger.info(
@@ -334,4 +474,4 @@ class ConversationManager:
                         )
 
 
-__all__ = ["ConversationManager", "TurnSummary"]
+__all__ = ["ConversationManager", "OutboundRecord", "TurnSummary"]
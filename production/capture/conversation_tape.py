@@ -1,35 +1,100 @@
 """Build a full-call audio mix for manual verification."""
 from __future__ import annotations
 
-from array import array
 import contextlib
 import io
+import logging
 import wave
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PcmBuffer = Union[bytes, bytearray, memoryview]
+
+# Incremental timelines grow geometrically, starting at this many seconds
+_INITIAL_TIMELINE_S = 30
+# Streaming tapes hand out mixed audio in blocks of at least this many seconds
+_STREAM_BLOCK_S = 1
+DEFAULT_STREAM_HORIZON_MS = 5000
 
 
 def _samples_from_ms(start_ms: int, sample_rate: int) -> int:
     return int(round(start_ms * sample_rate / 1000))
 
 
+def _pcm16(pcm: PcmBuffer) -> np.ndarray:
+    """Zero-copy int16 view of little-endian PCM (a trailing odd byte is ignored)."""
+    return np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+
+
+def _clip16(block: np.ndarray) -> bytes:
+    return np.clip(block, -32768, 32767).astype("<i2").tobytes()
+
+
 class ConversationTape:
     """Accumulates PCM frames with timestamps and renders a mixed WAV payload.
 
     Audio is mixed in the order it arrives—no synthetic silence is injected—so
     the resulting tape mirrors what a continuous phone line would capture when
     silence frames are streamed during idle periods.
+
+    By default segments are kept (zero-copy) and mixed when the WAV is written,
+    using a start-sorted index so each mix window only touches the segments
+    that overlap it. With ``incremental=True`` every segment is added into a
+    growing int32 timeline as it arrives, so writing is only clip-and-write;
+    this trades memory for the whole call up front for no work at the end.
+
+    Passing ``on_flush`` streams the mix instead (implies incremental): once the
+    newest segment starts ``horizon_ms`` past some audio, that audio is final,
+    so it is clipped, handed to ``on_flush`` and dropped from memory. Memory
+    stays bounded by the horizon however long the call runs; segments that
+    arrive for already-flushed time only contribute their unflushed part.
+    Call :meth:`flush` at the end to emit the remainder.
     """
 
-    def __init__(self, sample_rate: int = 16000) -> None:
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        *,
+        incremental: bool = False,
+        on_flush: Optional[Callable[[bytes], None]] = None,
+        horizon_ms: int = DEFAULT_STREAM_HORIZON_MS,
+    ) -> None:
         self.sample_rate = sample_rate
-        self._segments: List[Tuple[int, bytes]] = []  # (start_ms, pcm_bytes)
+        self.incremental = incremental or on_flush is not None
+        self.on_flush = on_flush
+        self.late_samples = 0  # streaming: samples dropped for already-flushed time
+        self._horizon = _samples_from_ms(horizon_ms, sample_rate)
+        self._flushed = 0  # streaming: samples already handed to on_flush
+        self._latest_offset = 0
+        self._segments: List[Tuple[int, PcmBuffer]] = []  # (start_ms, pcm_bytes)
+        self._segment_count = 0
+        self._min_start_ms: Optional[int] = None
+        self._max_end_ms = 0.0
 
-    def add_pcm(self, start_ms: int, pcm_bytes: bytes) -> None:
+        # Incremental mode: int32 sums, sample 0 at _origin_ms
+        self._timeline = np.zeros(0, dtype=np.int32)
+        self._origin_ms: Optional[int] = None
+        self._length = 0
+
+    def add_pcm(self, start_ms: int, pcm_bytes: PcmBuffer) -> None:
         if not pcm_bytes:
             return
         safe_start = max(0, start_ms)
-        self._segments.append((safe_start, pcm_bytes))
+        self._segment_count += 1
+        if self._min_start_ms is None or safe_start < self._min_start_ms:
+            self._min_start_ms = safe_start
+        self._max_end_ms = max(self._max_end_ms, safe_start + len(pcm_bytes) / 2 / self.sample_rate * 1000)
+
+        if self.incremental:
+            self._mix_in(safe_start, _pcm16(pcm_bytes))
+            if self.on_flush is not None:
+                self._stream_ready()
+        else:
+            self._segments.append((safe_start, pcm_bytes))
 
     def render(self) -> bytes:
         """Return a mono 16-bit PCM mix of all recorded segments.
@@ -55,37 +120,29 @@ class ConversationTape:
                 system.
         """
 
-        if not self._segments:
+        if not self._segment_count:
             return
+        if self.on_flush is not None:
+            raise RuntimeError("A streaming tape hands its mix to on_flush; use flush() instead of write_wav()")
 
-        sample_width = 2
-        segments: List[Tuple[int, array]] = []
-        min_start_ms = min(start for start, _ in self._segments)
-        max_end_ms = max(start + len(pcm) / 2 / self.sample_rate * 1000 for start, pcm in self._segments)
-
-        import logging
-        logger = logging.getLogger(__name__)
-
+        min_start_ms = self._min_start_ms or 0
         logger.info(
             f"🎵 CONVERSATION TAPE: "
-            f"total_segments={len(self._segments)}, "
-            f"timeline_span={min_start_ms}ms-{int(max_end_ms)}ms, "
-            f"duration={int(max_end_ms - min_start_ms)}ms"
+            f"total_segments={self._segment_count}, "
+            f"timeline_span={min_start_ms}ms-{int(self._max_end_ms)}ms, "
+            f"duration={int(self._max_end_ms - min_start_ms)}ms"
         )
 
-        for start_ms, pcm in sorted(self._segments, key=lambda seg: seg[0]):
-            samples = array("h")
-            samples.frombytes(pcm)
-            # Normalize timestamps so the earliest audio begins at t=0. This
-            # prevents enormous leading silence if callers pass absolute wall
-            # clock timestamps (e.g., ISO-8601 parsed values), which could
-            # otherwise expand the WAV header beyond 4 GiB and fail to write.
-            normalized_start = _samples_from_ms(start_ms - min_start_ms, self.sample_rate)
-            segments.append((normalized_start, samples))
-
-        total_samples = max(start + len(samples) for start, samples in segments)
-        total_duration_s = total_samples / self.sample_rate
+        if self.incremental:
+            # The timeline origin is the earliest start, i.e. already normalized
+            total_samples = self._length
+            blocks = self._timeline_blocks
+        else:
+            index = _SegmentIndex(self._segments, min_start_ms, self.sample_rate)
+            total_samples = index.total_samples
+            blocks = index.mix_blocks
 
+        total_duration_s = total_samples / self.sample_rate
         logger.info(
             f"🎵 MIXED WAV: "
             f"total_samples={total_samples}, "
@@ -101,37 +158,112 @@ class ConversationTape:
 
             with wave.open(wav_io, "wb") as wav:
                 wav.setnchannels(1)
-                wav.setsampwidth(sample_width)
+                wav.setsampwidth(2)
                 wav.setframerate(self.sample_rate)
 
-                for block_start in range(0, total_samples, chunk_samples):
-                    block_end = min(total_samples, block_start + chunk_samples)
-                    block_len = block_end - block_start
-                    accumulator = array("i", [0] * block_len)
-
-                    for seg_start, samples in segments:
-                        seg_end = seg_start + len(samples)
-                        if seg_end <= block_start or seg_start >= block_end:
-                            continue
-
-                        overlap_start = max(block_start, seg_start)
-                        overlap_end = min(block_end, seg_end)
-                        seg_offset = overlap_start - seg_start
-                        acc_offset = overlap_start - block_start
-                        overlap_len = overlap_end - overlap_start
-
-                        for idx in range(overlap_len):
-                            accumulator[acc_offset + idx] += samples[seg_offset + idx]
-
-                    mixed_block = array("h", [0] * block_len)
-                    for idx, value in enumerate(accumulator):
-                        if value > 32767:
-                            value = 32767
-                        elif value < -32768:
-                            value = -32768
-                        mixed_block[idx] = int(value)
-
-                    wav.writeframes(mixed_block.tobytes())
+                for block in blocks(chunk_samples):
+                    wav.writeframes(_clip16(block))
+
+    def flush(self) -> None:
+        """Streaming: emit everything mixed so far (e.g. at the end of the call)."""
+        if self.on_flush is not None:
+            self._emit(self._length)
+
+    def _stream_ready(self) -> None:
+        ready = self._latest_offset - self._horizon - self._flushed
+        if ready >= _STREAM_BLOCK_S * self.sample_rate:
+            self._emit(ready)
+
+    def _emit(self, count: int) -> None:
+        count = min(count, self._length)
+        if count <= 0:
+            return
+        self.on_flush(_clip16(self._timeline[:count]))
+        # Keep the unflushed tail at the front of the (reused) buffer
+        remaining = self._length - count
+        self._timeline[:remaining] = self._timeline[count : self._length]
+        self._timeline[remaining : self._length] = 0
+        self._length = remaining
+        self._flushed += count
+
+    def _mix_in(self, start_ms: int, samples: np.ndarray) -> None:
+        if self._origin_ms is None:
+            self._origin_ms = start_ms
+        elif start_ms < self._origin_ms and self.on_flush is None:
+            # Rare: audio timestamped before everything seen so far
+            shift = _samples_from_ms(self._origin_ms - start_ms, self.sample_rate)
+            self._timeline = np.concatenate(
+                (np.zeros(shift, dtype=np.int32), self._timeline[: self._length])
+            )
+            self._length += shift
+            self._origin_ms = start_ms
+
+        offset = _samples_from_ms(start_ms - self._origin_ms, self.sample_rate) - self._flushed
+        self._latest_offset = max(self._latest_offset, offset + self._flushed)
+        if offset < 0:
+            # Streaming: this part of the timeline was already written out
+            late = min(-offset, len(samples))
+            self.late_samples += late
+            samples = samples[late:]
+            offset = 0
+        end = offset + len(samples)
+        if end > len(self._timeline):
+            capacity = max(end, 2 * len(self._timeline), _INITIAL_TIMELINE_S * self.sample_rate)
+            grown = np.zeros(capacity, dtype=np.int32)
+            grown[: self._length] = self._timeline[: self._length]
+            self._timeline = grown
+        self._timeline[offset:end] += samples
+        self._length = max(self._length, end)
+
+    def _timeline_blocks(self, chunk_samples: int):
+        for block_start in range(0, self._length, chunk_samples):
+            yield self._timeline[block_start : min(self._length, block_start + chunk_samples)]
+
+
+class _SegmentIndex:
+    """Segments sorted by start sample, for per-window interval lookups."""
+
+    def __init__(self, segments: List[Tuple[int, PcmBuffer]], min_start_ms: int, sample_rate: int) -> None:
+        ordered = sorted(segments, key=lambda seg: seg[0])
+        # Normalize timestamps so the earliest audio begins at t=0. This
+        # prevents enormous leading silence if callers pass absolute wall
+        # clock timestamps (e.g., ISO-8601 parsed values), which could
+        # otherwise expand the WAV header beyond 4 GiB and fail to write.
+        self.starts = np.fromiter(
+            (_samples_from_ms(start_ms - min_start_ms, sample_rate) for start_ms, _ in ordered),
+            dtype=np.int64,
+            count=len(ordered),
+        )
+        self.samples = [_pcm16(pcm) for _, pcm in ordered]
+        lengths = np.fromiter((len(s) for s in self.samples), dtype=np.int64, count=len(ordered))
+        self.ends = self.starts + lengths
+        self.max_length = int(lengths.max()) if len(lengths) else 0
+        self.total_samples = int(self.ends.max()) if len(lengths) else 0
+        self._starts = self.starts.tolist()
+        self._ends = self.ends.tolist()
+
+    def mix_blocks(self, chunk_samples: int):
+        accumulator = np.zeros(chunk_samples, dtype=np.int32)
+        for block_start in range(0, self.total_samples, chunk_samples):
+            block_end = min(self.total_samples, block_start + chunk_samples)
+            block = accumulator[: block_end - block_start]
+            block.fill(0)
+
+            # Only segments starting within max_length before the window can
+            # reach into it
+            first = int(np.searchsorted(self.starts, block_start - self.max_length, side="right"))
+            last = int(np.searchsorted(self.starts, block_end, side="left"))
+            for idx in range(first, last):
+                seg_start = self._starts[idx]
+                seg_end = self._ends[idx]
+                if seg_end <= block_start:
+                    continue
+                overlap_start = max(block_start, seg_start)
+                overlap_end = min(block_end, seg_end)
+                block[overlap_start - block_start : overlap_end - block_start] += self.samples[idx][
+                    overlap_start - seg_start : overlap_end - seg_start
+                ]
+            yield block
 
 
 __all__ = ["ConversationTape"]
@@ -1,10 +1,11 @@
 """Service to manage persisting scenario results to disk."""
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from bson import ObjectId
 
@@ -12,6 +13,7 @@ from production.capture.audio_sink import AudioSink, AUDIO_EVENT_TYPES
 from production.capture.collector import EventCollector
 from production.capture.conversation_tape import ConversationTape
 from production.capture.raw_log_sink import RawLogSink
+from production.capture.streaming_results_writer import StreamingResultsWriter
 from production.capture.transcript_sink import TranscriptSink, TEXT_EVENT_TYPES
 
 logger = logging.getLogger(__name__)
@@ -61,7 +63,8 @@ class ResultsPersistenceService:
         self,
         collector: EventCollector,
         raw_messages: List[dict],
-        tape: ConversationTape
+        tape: ConversationTape,
+        pacing: Optional[dict] = None,
     ) -> None:
         """Persist all scenario results to disk.
 
@@ -70,11 +73,13 @@ class ResultsPersistenceService:
         - Mixed call audio (audio/call_mix.wav)
         - Transcript events (transcripts.json)
         - Raw WebSocket messages (sut_messages.log)
+        - Frame pacing jitter statistics (pacing.json)
 
         Args:
             collector: Event collector with all collected events
             raw_messages: List of raw WebSocket messages
             tape: Conversation tape with mixed audio
+            pacing: Optional pacing summary from the run's PacingScheduler
         """
         logger.info(
             f"Starting results persistence to {self.output_root} "
@@ -102,7 +107,33 @@ class ResultsPersistenceService:
         logger.debug(f"Writing {len(raw_messages)} raw WebSocket messages")
         raw_sink.append_messages(raw_messages)
 
+        if pacing is not None:
+            (self.output_root / "pacing.json").write_text(json.dumps(pacing, indent=2), encoding="utf-8")
+
         logger.info(f"Results persistence completed successfully to {self.output_root}")
 
+    def open_stream(self, sample_rate: int) -> StreamingResultsWriter:
+        """Start streaming artifacts to disk as they arrive (see StreamingResultsWriter)."""
+        logger.info(f"Streaming results to {self.output_root}")
+        return StreamingResultsWriter(self.output_root, sample_rate=sample_rate).start()
+
+    def finish_stream(
+        self,
+        writer: StreamingResultsWriter,
+        tape: ConversationTape,
+        pacing: Optional[dict] = None,
+    ) -> None:
+        """Flush the streaming tape, finalise every streamed file and write pacing.json."""
+        if tape.on_flush is None:
+            AudioSink(self.output_root, sample_rate=tape.sample_rate).write_call_mix(tape)
+        tape.flush()
+        if tape.late_samples:
+            logger.warning(
+                f"{tape.late_samples} samples arrived after their part of call_mix.wav was written and were dropped"
+            )
+        writer.close()
+        if pacing is not None:
+            (self.output_root / "pacing.json").write_text(json.dumps(pacing, indent=2), encoding="utf-8")
+
 
 __all__ = ["ResultsPersistenceService"]
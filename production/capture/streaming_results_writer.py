@@ -0,0 +1,168 @@
+"""Append scenario artifacts to disk while the scenario runs.
+
+The default persistence path keeps every raw message and collected event
+(including decoded audio) in memory and writes them once the scenario ends.
+In streaming mode the engine hands each item to a ``StreamingResultsWriter``
+instead. A background thread appends it to its artifact, so memory stays flat
+for long soak scenarios and a crashed run still leaves everything received up
+to the last flush:
+
+* ``sut_messages.log`` - raw messages as JSON lines
+* ``transcripts.jsonl`` - text events as they arrive; ``transcripts.json`` (the
+  same format as the batch path) is generated from it on close
+* ``audio/NNN_<langs>_<turn>.wav`` - one growing WAV per turn, instead of one
+  file per audio event
+* ``audio/call_mix.wav`` - blocks from a streaming ``ConversationTape``
+
+Files are flushed (and WAV headers patched) every ``flush_interval_s``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, TextIO
+
+from production.capture.audio_sink import AUDIO_EVENT_TYPES, AudioSink, StreamingWavWriter
+from production.capture.collector import CollectedEvent
+from production.capture.transcript_sink import TEXT_EVENT_TYPES, TranscriptSink
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+
+_STOP = object()
+
+
+class StreamingResultsWriter:
+    """Background writer for one scenario's artifacts; methods are thread-safe."""
+
+    def __init__(
+        self,
+        output_root: Path,
+        sample_rate: int = 16000,
+        *,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+    ) -> None:
+        self.output_root = output_root
+        self.sample_rate = sample_rate
+        self.flush_interval_s = flush_interval_s
+        self.audio_sink = AudioSink(output_root, sample_rate=sample_rate)
+        self.transcript_sink = TranscriptSink(output_root)
+        self.transcripts_jsonl = output_root / "transcripts.jsonl"
+        self.counts: Dict[str, int] = {"raw": 0, "text": 0, "audio": 0, "mix_bytes": 0}
+
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._raw: Optional[TextIO] = None
+        self._transcripts: Optional[TextIO] = None
+        self._turn_audio: Dict[str, StreamingWavWriter] = {}
+        self._call_mix: Optional[StreamingWavWriter] = None
+
+    def start(self) -> "StreamingResultsWriter":
+        self._raw = (self.output_root / "sut_messages.log").open("a", encoding="utf-8")
+        self._transcripts = self.transcripts_jsonl.open("a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._run, name=f"results-writer-{self.output_root.name}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    # ------------------------------------------------------------------ producers
+
+    def write_raw(self, message: Mapping) -> None:
+        self._queue.put(("raw", message))
+
+    def write_event(self, event: CollectedEvent) -> None:
+        if event.event_type in AUDIO_EVENT_TYPES and event.audio_payload:
+            self._queue.put(("audio", event))
+        elif event.event_type in TEXT_EVENT_TYPES and event.text is not None:
+            self._queue.put(("text", event))
+
+    def write_mix(self, pcm: bytes) -> None:
+        self._queue.put(("mix", pcm))
+
+    def close(self) -> None:
+        """Drain pending items, finalise every file and stop the thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        logger.info(
+            "Streamed results to %s (raw=%d, text=%d, audio=%d, call_mix=%d bytes)",
+            self.output_root,
+            self.counts["raw"],
+            self.counts["text"],
+            self.counts["audio"],
+            self.counts["mix_bytes"],
+        )
+
+    # ------------------------------------------------------------------ writer thread
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval_s)
+            except queue.Empty:
+                self._flush()
+                continue
+            if item is _STOP:
+                break
+            try:
+                self._handle(*item)
+            except Exception:  # keep writing the remaining artifacts
+                logger.exception("Failed to stream %s item to %s", item[0], self.output_root)
+            if self._queue.empty():
+                self._flush()
+        self._finalise()
+
+    def _handle(self, kind: str, payload: Any) -> None:
+        if kind == "raw":
+            self._raw.write(json.dumps(payload))
+            self._raw.write("\n")
+            self.counts["raw"] += 1
+        elif kind == "text":
+            self._transcripts.write(json.dumps(TranscriptSink.serialize(payload)))
+            self._transcripts.write("\n")
+            self.counts["text"] += 1
+        elif kind == "audio":
+            self._turn_writer(payload).write(payload.audio_payload)
+            self.counts["audio"] += 1
+        elif kind == "mix":
+            if self._call_mix is None:
+                self._call_mix = StreamingWavWriter(self.audio_sink.audio_dir / "call_mix.wav", self.sample_rate)
+            self._call_mix.write(payload)
+            self.counts["mix_bytes"] += len(payload)
+
+    def _turn_writer(self, event: CollectedEvent) -> StreamingWavWriter:
+        key = event.participant_id or "p"
+        writer = self._turn_audio.get(key)
+        if writer is None:
+            path = self.audio_sink.audio_dir / AudioSink.event_filename(len(self._turn_audio), event)
+            writer = self._turn_audio[key] = StreamingWavWriter(path, self.sample_rate)
+        return writer
+
+    def _flush(self) -> None:
+        for handle in (self._raw, self._transcripts):
+            if handle is not None:
+                handle.flush()
+        for writer in self._turn_audio.values():
+            writer.flush()
+        if self._call_mix is not None:
+            self._call_mix.flush()
+
+    def _finalise(self) -> None:
+        for handle in (self._raw, self._transcripts):
+            if handle is not None:
+                handle.close()
+        for writer in self._turn_audio.values():
+            writer.close()
+        if self._call_mix is not None:
+            self._call_mix.close()
+        self.transcript_sink.write_from_jsonl(self.transcripts_jsonl)
+
+
+__all__ = ["StreamingResultsWriter"]
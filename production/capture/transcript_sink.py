@@ -20,21 +20,35 @@ class TranscriptSink:
         self.path = base_dir / "transcripts.json"
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def serialize(event: CollectedEvent) -> dict:
+        return {
+            "event_type": event.event_type,
+            "timestamp_ms": event.timestamp_ms,
+            "participant_id": event.participant_id,
+            "source_language": event.source_language,
+            "target_language": event.target_language,
+            "text": event.text,
+            "raw": event.raw,
+        }
+
     def write_transcripts(self, events: Iterable[CollectedEvent]) -> None:
-        serializable = [
-            {
-                "event_type": event.event_type,
-                "timestamp_ms": event.timestamp_ms,
-                "participant_id": event.participant_id,
-                "source_language": event.source_language,
-                "target_language": event.target_language,
-                "text": event.text,
-                "raw": event.raw,
-            }
-            for event in events
-            if event.text is not None
-        ]
+        serializable = [self.serialize(event) for event in events if event.text is not None]
         self.path.write_text(json.dumps(serializable, indent=2), encoding="utf-8")
 
+    def write_from_jsonl(self, jsonl_path: Path) -> None:
+        """Write transcripts.json from streamed JSON lines, one entry at a time."""
+        with jsonl_path.open(encoding="utf-8") as source, self.path.open("w", encoding="utf-8") as target:
+            target.write("[")
+            first = True
+            for line in source:
+                if not line.strip():
+                    continue
+                entry = json.dumps(json.loads(line), indent=2)
+                target.write("\n" if first else ",\n")
+                target.write("  " + entry.replace("\n", "\n  "))
+                first = False
+            target.write("\n]" if not first else "]")
+
 
 __all__ = ["TranscriptSink", "TEXT_EVENT_TYPES"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,7 @@ import typer
 
 from production.cli.calibrate import calibrate_async
 from production.cli.generate_report import generate_report_async
+from production.cli.load import LoadProfile, load_async
 from production.cli.run_test import run_test_async
 from production.cli.run_suite import run_suite_async
 from production.cli.reset_db import reset_db_async
@@ -39,6 +41,39 @@ def run_suite(
     asyncio.run(run_suite_async(folder, pattern, log_level))
 
 
+@app.command("load")
+def load(
+    path: Path = typer.Argument(
+        Path("production/tests/scenarios/"),
+        help="Scenario file, or folder of scenarios to rotate through"
+    ),
+    users: int = typer.Option(100, "--users", "-u", help="Number of simulated callers"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes to spread callers over"),
+    profile: LoadProfile = typer.Option(LoadProfile.CONSTANT, "--profile", help="Caller arrival profile"),
+    ramp: float = typer.Option(30.0, "--ramp", "-r", help="Ramp-up window in seconds"),
+    steps: int = typer.Option(5, "--steps", help="Number of batches for the step profile"),
+    pattern: str = typer.Option("*.yaml", "--pattern", "-p", help="Glob for scenario files"),
+    metrics: bool = typer.Option(False, "--metrics/--no-metrics", help="Evaluate (and store) metrics per call"),
+    persist: bool = typer.Option(False, "--persist/--no-persist", help="Write per-call results to disk"),
+    log_level: str = typer.Option("WARNING", help="Logging level")
+) -> None:
+    """Simulate many concurrent callers in-process with a live readout."""
+    stats = asyncio.run(load_async(
+        path=path,
+        pattern=pattern,
+        users=users,
+        workers=workers,
+        profile=profile,
+        ramp_s=ramp,
+        steps=steps,
+        persist_results=persist,
+        run_metrics=metrics,
+        log_level=log_level,
+    ))
+    if stats.failed:
+        sys.exit(1)
+
+
 @app.command("reset-db")
 def reset_db(
     log_level: str = typer.Option("INFO", help="Logging level"),
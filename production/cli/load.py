@@ -0,0 +1,484 @@
+"""In-process load generator: many simulated callers per process.
+
+``prod parallel simulate-*`` starts one ``poetry run prod run-test`` subprocess
+per user, so every caller pays for a Python interpreter, its imports, a MongoDB
+client and an LLM client. ``prod load`` instead runs each caller as an asyncio
+task driving its own ``ScenarioEngine``. Callers in a process share the scenario
+definitions, the encoded audio frames, one storage client and one LLM client,
+which is what makes hundreds of callers per box practical.
+
+Callers arrive according to a ramp-up profile:
+
+* ``constant`` - arrivals spread evenly over ``--ramp``
+* ``step`` - ``--steps`` equal batches, one every ``ramp / steps`` seconds
+* ``spike`` - a fifth of the callers ramp up over ``--ramp``, then the rest
+  arrive at once
+
+With ``--workers N`` the arrivals are split across N worker processes (to use
+more than one core); workers report progress to the parent, which renders the
+live readout and the final summary.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from production.metrics import MetricsSummary
+from production.scenario_engine.engine import ScenarioEngine
+from production.scenario_engine.models import Scenario
+from production.scenarios.loader import ScenarioLoader
+from production.storage import MetricsStorageService
+from production.utils.config import FrameworkConfig, load_config
+from production.utils.logging_setup import configure_logging
+
+from .run_parallel import discover_test_files
+from .shared import create_evaluation_run, finalize_evaluation_run, setup_storage
+
+console = Console()
+
+logger = logging.getLogger(__name__)
+
+SPIKE_BASELINE_FRACTION = 0.2
+READOUT_INTERVAL_S = 1.0
+
+
+class LoadProfile(str, Enum):
+    """How simulated callers arrive over the ramp-up window."""
+
+    CONSTANT = "constant"
+    STEP = "step"
+    SPIKE = "spike"
+
+
+@dataclass(frozen=True)
+class LoadOptions:
+    """Settings shared by every caller (picklable for worker processes)."""
+
+    persist_results: bool = False
+    run_metrics: bool = False
+    log_level: str = "WARNING"
+
+
+@dataclass
+class CallResult:
+    """Outcome of one simulated call."""
+
+    caller: int
+    scenario_id: str
+    ok: bool
+    duration_s: float
+    latencies_ms: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+    summary: Optional[MetricsSummary] = None
+    pacing: Optional[dict] = None
+
+
+def arrival_offsets(
+    profile: LoadProfile,
+    users: int,
+    ramp_s: float,
+    steps: int = 5,
+) -> List[float]:
+    """Start offset in seconds for each of ``users`` callers, in caller order."""
+    if users <= 0:
+        return []
+    if ramp_s <= 0:
+        return [0.0] * users
+
+    if profile is LoadProfile.CONSTANT:
+        return [ramp_s * index / users for index in range(users)]
+
+    if profile is LoadProfile.STEP:
+        steps = max(1, min(steps, users))
+        interval = ramp_s / steps
+        return [interval * (index * steps // users) for index in range(users)]
+
+    baseline = max(1, int(users * SPIKE_BASELINE_FRACTION))
+    return [
+        ramp_s * index / baseline if index < baseline else float(ramp_s)
+        for index in range(users)
+    ]
+
+
+class LoadStats:
+    """Running counters and latency samples for the live readout."""
+
+    def __init__(self, users: int) -> None:
+        self.users = users
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.turns = 0
+        self.frames = 0
+        self.late_frames = 0
+        self.resyncs = 0
+        self.worst_frame_lateness_ms = 0.0
+        self.latencies_ms: List[int] = []
+        self.durations_s: List[float] = []
+        self.summaries: List[Tuple[str, MetricsSummary]] = []
+        self.errors: List[str] = []
+        self.started_at = time.monotonic()
+
+    @property
+    def active(self) -> int:
+        return self.started - self.completed - self.failed
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def call_started(self) -> None:
+        self.started += 1
+
+    def call_finished(self, result: CallResult) -> None:
+        if result.ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+            if result.error:
+                self.errors.append(f"caller {result.caller} ({result.scenario_id}): {result.error}")
+        self.durations_s.append(result.duration_s)
+        self.turns += len(result.latencies_ms)
+        self.latencies_ms.extend(result.latencies_ms)
+        if result.pacing:
+            self.frames += result.pacing["frames"]
+            self.late_frames += result.pacing["late_frames"]
+            self.resyncs += result.pacing["resyncs"]
+            self.worst_frame_lateness_ms = max(self.worst_frame_lateness_ms, result.pacing["p99_lateness_ms"])
+        if result.summary is not None:
+            self.summaries.append((result.scenario_id, result.summary))
+
+    def percentile(self, pct: float) -> Optional[int]:
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def render(self, title: str = "Load") -> Table:
+        elapsed = max(self.elapsed_s, 1e-6)
+        finished = self.completed + self.failed
+
+        def fmt_ms(value: Optional[int]) -> str:
+            return "-" if value is None else f"{value} ms"
+
+        table = Table(title=title, show_header=False, box=None)
+        table.add_column(style="bold")
+        table.add_column(justify="right")
+        table.add_row("Elapsed", f"{elapsed:.1f}s")
+        table.add_row("Callers", f"{self.started}/{self.users} started, {self.active} active")
+        table.add_row("Completed", f"[green]{self.completed}[/green]")
+        table.add_row("Failed", f"[red]{self.failed}[/red]" if self.failed else "0")
+        table.add_row("Throughput", f"{finished / elapsed:.2f} calls/s, {self.turns / elapsed:.2f} turns/s")
+        table.add_row(
+            "Turn latency",
+            f"p50 {fmt_ms(self.percentile(50))}  p95 {fmt_ms(self.percentile(95))}  "
+            f"p99 {fmt_ms(self.percentile(99))}  max {fmt_ms(max(self.latencies_ms, default=None))}",
+        )
+        table.add_row(
+            "Frame pacing",
+            f"{self.late_frames}/{self.frames} late, worst call p99 {self.worst_frame_lateness_ms:.1f} ms, "
+            f"{self.resyncs} resync(s)",
+        )
+        return table
+
+
+def _load_config_for_load() -> FrameworkConfig:
+    # With --persist, hundreds of callers must not each hold their whole call
+    # in memory: artifacts are streamed to disk as they arrive
+    return replace(load_config(), stream_results=True)
+
+
+def load_scenarios(paths: Sequence[Path]) -> List[Scenario]:
+    """Parse each scenario file once; callers share the parsed definitions."""
+    return [ScenarioLoader(base_path=path.parent).load(path) for path in paths]
+
+
+async def _run_caller(
+    caller: int,
+    scenario: Scenario,
+    config: FrameworkConfig,
+    storage_service: Optional[MetricsStorageService],
+    evaluation_run_id: Optional[ObjectId],
+    options: LoadOptions,
+) -> CallResult:
+    engine = ScenarioEngine(
+        config,
+        storage_service,
+        evaluation_run_id,
+        persist_results=options.persist_results,
+        run_metrics=options.run_metrics,
+    )
+    started = time.monotonic()
+    try:
+        summary, conversation_manager = await engine.run(
+            scenario,
+            started_at=datetime.utcnow(),
+            output_name=f"{scenario.id}-caller{caller:04d}",
+        )
+    except Exception as exc:
+        logger.debug("Caller %d failed", caller, exc_info=True)
+        return CallResult(
+            caller=caller,
+            scenario_id=scenario.id,
+            ok=False,
+            duration_s=time.monotonic() - started,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+    latencies = [turn.latency_ms for turn in conversation_manager.iter_turns() if turn.latency_ms is not None]
+    return CallResult(
+        caller=caller,
+        scenario_id=scenario.id,
+        ok=True,
+        duration_s=time.monotonic() - started,
+        latencies_ms=latencies,
+        summary=summary if options.run_metrics else None,
+        pacing=engine.last_pacing,
+    )
+
+
+async def run_callers(
+    scenarios: Sequence[Scenario],
+    arrivals: Sequence[Tuple[int, float]],
+    config: FrameworkConfig,
+    storage_service: Optional[MetricsStorageService],
+    evaluation_run_id: Optional[ObjectId],
+    options: LoadOptions,
+    on_start: Callable[[int], None],
+    on_finish: Callable[[CallResult], None],
+) -> None:
+    """Run one task per ``(caller, offset)`` arrival, round-robin over scenarios."""
+    loop = asyncio.get_running_loop()
+    origin = loop.time()
+
+    async def caller_task(caller: int, offset_s: float) -> None:
+        delay = origin + offset_s - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        on_start(caller)
+        scenario = scenarios[caller % len(scenarios)]
+        result = await _run_caller(caller, scenario, config, storage_service, evaluation_run_id, options)
+        on_finish(result)
+
+    await asyncio.gather(*(caller_task(caller, offset) for caller, offset in arrivals))
+
+
+def _worker_main(
+    worker: int,
+    scenario_paths: List[Path],
+    arrivals: List[Tuple[int, float]],
+    evaluation_run_id: Optional[str],
+    options: LoadOptions,
+    events: multiprocessing.Queue,
+) -> None:
+    """Entry point of a worker process; reports ("start"|"finish", payload) events."""
+    configure_logging(options.log_level)
+
+    async def main() -> None:
+        config = _load_config_for_load()
+        scenarios = load_scenarios(scenario_paths)
+        client = storage_service = None
+        run_id = ObjectId(evaluation_run_id) if evaluation_run_id else None
+        if run_id is not None:
+            storage_tuple = await setup_storage(config)
+            if storage_tuple:
+                client, storage_service = storage_tuple
+
+        def on_finish(result: CallResult) -> None:
+            try:
+                events.put(("finish", result))
+            except Exception:  # e.g. an unpicklable metric detail
+                result.summary = None
+                events.put(("finish", result))
+
+        try:
+            await run_callers(
+                scenarios,
+                arrivals,
+                config,
+                storage_service,
+                run_id,
+                options,
+                on_start=lambda caller: events.put(("start", caller)),
+                on_finish=on_finish,
+            )
+        finally:
+            if client:
+                await client.close()
+
+    try:
+        asyncio.run(main())
+    finally:
+        events.put(("done", worker))
+
+
+async def _run_in_workers(
+    workers: int,
+    scenario_paths: List[Path],
+    arrivals: List[Tuple[int, float]],
+    evaluation_run_id: Optional[ObjectId],
+    options: LoadOptions,
+    stats: LoadStats,
+) -> None:
+    context = multiprocessing.get_context("spawn")
+    events = context.Queue()
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(
+                worker,
+                scenario_paths,
+                arrivals[worker::workers],
+                str(evaluation_run_id) if evaluation_run_id else None,
+                options,
+                events,
+            ),
+            daemon=True,
+        )
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    running = workers
+    try:
+        while running:
+            try:
+                kind, payload = await asyncio.to_thread(events.get, True, READOUT_INTERVAL_S)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            if kind == "start":
+                stats.call_started()
+            elif kind == "finish":
+                stats.call_finished(payload)
+            elif kind == "done":
+                running -= 1
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+
+async def load_async(
+    path: Path,
+    pattern: str,
+    users: int,
+    workers: int,
+    profile: LoadProfile,
+    ramp_s: float,
+    steps: int,
+    persist_results: bool,
+    run_metrics: bool,
+    log_level: str,
+) -> LoadStats:
+    """Simulate ``users`` concurrent callers and print a live readout.
+
+    Args:
+        path: Scenario file, or folder searched with ``pattern``
+        pattern: Glob for scenario files when ``path`` is a folder
+        users: Total number of simulated callers
+        workers: Processes to spread callers over (1 = this process only)
+        profile: Arrival profile over the ramp-up window
+        ramp_s: Ramp-up window in seconds
+        steps: Number of batches for the step profile
+        persist_results: Write per-call results under the output directory
+        run_metrics: Evaluate (and store, if MongoDB is enabled) each call's metrics
+        log_level: Logging level for the engine (kept quiet by default)
+    """
+    configure_logging(log_level)
+    config = _load_config_for_load()
+
+    scenario_paths = discover_test_files(path, pattern)
+    if not scenario_paths:
+        console.print(f"[red]No scenario files found in {path}[/red]")
+        raise SystemExit(1)
+    scenarios = load_scenarios(scenario_paths)
+
+    client = storage_service = None
+    evaluation_run_id: Optional[ObjectId] = None
+    if run_metrics:
+        storage_tuple = await setup_storage(config)
+        if storage_tuple:
+            client, storage_service = storage_tuple
+            evaluation_run_id = await create_evaluation_run(storage_service, config)
+
+    options = LoadOptions(persist_results=persist_results, run_metrics=run_metrics, log_level=log_level)
+    arrivals = list(enumerate(arrival_offsets(profile, users, ramp_s, steps)))
+    workers = max(1, min(workers, users))
+    stats = LoadStats(users)
+    title = (
+        f"Load: {users} callers, {len(scenarios)} scenario(s), {profile.value} ramp over {ramp_s:g}s, "
+        f"{workers} worker(s)"
+    )
+
+    try:
+        with Live(stats.render(title), console=console, refresh_per_second=4) as live:
+
+            async def refresh() -> None:
+                while True:
+                    await asyncio.sleep(READOUT_INTERVAL_S)
+                    live.update(stats.render(title))
+
+            refresher = asyncio.create_task(refresh())
+            try:
+                if workers == 1:
+                    await run_callers(
+                        scenarios,
+                        arrivals,
+                        config,
+                        storage_service,
+                        evaluation_run_id,
+                        options,
+                        on_start=lambda caller: stats.call_started(),
+                        on_finish=stats.call_finished,
+                    )
+                else:
+                    await _run_in_workers(workers, scenario_paths, arrivals, evaluation_run_id, options, stats)
+            finally:
+                refresher.cancel()
+                live.update(stats.render(title))
+
+        if storage_service and evaluation_run_id:
+            await finalize_evaluation_run(storage_service, evaluation_run_id, stats.summaries)
+    finally:
+        if client:
+            await client.close()
+
+    for error in stats.errors[:10]:
+        console.print(f"[red]✗[/red] {error}")
+    if len(stats.errors) > 10:
+        console.print(f"[red]... and {len(stats.errors) - 10} more failures[/red]")
+    if stats.durations_s:
+        console.print(
+            f"Call duration: avg {sum(stats.durations_s) / len(stats.durations_s):.2f}s, "
+            f"min {min(stats.durations_s):.2f}s, max {max(stats.durations_s):.2f}s"
+        )
+    return stats
+
+
+__all__ = [
+    "CallResult",
+    "LoadOptions",
+    "LoadProfile",
+    "LoadStats",
+    "arrival_offsets",
+    "load_async",
+    "run_callers",
+]
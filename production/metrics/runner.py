@@ -1,6 +1,7 @@
 """Metrics runner for executing and reporting metrics results."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -177,8 +178,8 @@ class MetricsRunner:
             ... )
             >>> summary = await runner.run_and_persist(tags=["medical"], participants=["doctor"])
         """
-        # Run metrics (existing synchronous logic)
-        summary = self.run()
+        # Run metrics (synchronous, LLM-bound) without blocking the event loop
+        summary = await asyncio.to_thread(self.run)
 
         # Persist if storage is configured
         if self.storage_service and self.evaluation_run_id and self.test_id:
@@ -200,19 +201,16 @@ class MetricsRunner:
         """
         from production.storage.models import LatencyMetrics
 
-        # Count events
-        audio_events = [e for e in turn_summary.inbound_events if e.event_type == "translated_audio"]
-        text_events = [e for e in turn_summary.inbound_events if e.event_type == "translated_delta"]
+        # Counts and first/last timestamps are maintained by TurnSummary
+        audio_event_count = turn_summary.audio_event_count
+        text_event_count = turn_summary.text_event_count
 
         # Calculate audio duration
         audio_duration = None
         if turn_summary.first_outbound_ms is not None and turn_summary.last_outbound_ms is not None:
             audio_duration = turn_summary.last_outbound_ms - turn_summary.first_outbound_ms
 
-        # Calculate last audio response timestamp
-        last_audio_response = None
-        if audio_events:
-            last_audio_response = max(e.timestamp_ms for e in audio_events)
+        last_audio_response = turn_summary.last_audio_response_ms
 
         # Create latency metrics (all fields optional - only set if data available)
         return LatencyMetrics(
@@ -233,8 +231,8 @@ class MetricsRunner:
             audio_duration_ms=audio_duration,
 
             # Event counts
-            audio_event_count=len(audio_events) if audio_events else None,
-            text_event_count=len(text_events) if text_events else None,
+            audio_event_count=audio_event_count or None,
+            text_event_count=text_event_count or None,
         )
 
     async def _persist_test_result(
@@ -4,25 +4,29 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-import wave
+from dataclasses import replace
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from bson import ObjectId
+from vt_voice_translation_poc.wav import read_wav_format
 
+from production.acs_emulator.frame_cache import default_frame_cache
 from production.acs_emulator.media_engine import FRAME_DURATION_MS, async_stream_silence
 from production.acs_emulator.protocol_adapter import ProtocolAdapter
 from production.acs_emulator.websocket_client import WebSocketClient
 from production.acs_emulator.websocket_client_factory import create_websocket_client
 from production.metrics import MetricsRunner, MetricsSummary
-from production.capture.collector import CollectedEvent, EventCollector
+from production.capture.audio_arena import AudioArena
+from production.capture.collector import CollectedEvent, EventCollector, RawRetention
 from production.capture.conversation_manager import ConversationManager
 from production.capture.conversation_tape import ConversationTape
 from production.capture.results_persistence_service import ResultsPersistenceService
+from production.capture.streaming_results_writer import StreamingResultsWriter
 from production.scenario_engine.turn_processors import create_turn_processor
 from production.scenario_engine.models import Participant, Scenario
 from production.utils.config import FrameworkConfig
-from production.utils.time_utils import Clock
+from production.utils.time_utils import Clock, PacingScheduler
 
 if TYPE_CHECKING:
     from production.storage.service import MetricsStorageService
@@ -35,7 +39,10 @@ class ScenarioEngine:
         self,
         config: FrameworkConfig,
         storage_service: Optional[MetricsStorageService] = None,
-        evaluation_run_id: Optional[ObjectId] = None
+        evaluation_run_id: Optional[ObjectId] = None,
+        *,
+        persist_results: bool = True,
+        run_metrics: bool = True,
     ) -> None:
         """Initialize scenario engine.
 
@@ -43,73 +50,144 @@ class ScenarioEngine:
             config: Framework configuration
             storage_service: Optional storage service for metrics persistence
             evaluation_run_id: Optional evaluation run ID for linking test results
+            persist_results: Write audio, transcripts and wire logs to disk
+            run_metrics: Evaluate metrics after the call (skipped for pure load runs)
         """
         self.config = config
         self.clock = Clock(acceleration=config.time_acceleration)
         self.storage_service = storage_service
         self.evaluation_run_id = evaluation_run_id
+        self.persist_results = persist_results
+        self.run_metrics = run_metrics
+        # Pacing summary of the most recent run (also written to pacing.json)
+        self.last_pacing: Optional[dict] = None
 
     async def run(
         self,
         scenario: Scenario,
-        started_at: Optional[datetime] = None
+        started_at: Optional[datetime] = None,
+        output_name: Optional[str] = None,
     ) -> tuple[MetricsSummary, ConversationManager]:
+        """Play ``scenario`` against the service and evaluate it.
+
+        ``output_name`` overrides the results folder name (defaults to the
+        scenario id) so concurrent runs of one scenario do not share a folder.
+        """
         # Create persistence service to manage all result storage
-        persistence_service = ResultsPersistenceService(
-            base_output_dir=self.config.ensure_output_dir(),
-            scenario_id=scenario.id,
-            evaluation_run_id=self.evaluation_run_id
-        )
+        persistence_service: Optional[ResultsPersistenceService] = None
+        if self.persist_results:
+            persistence_service = ResultsPersistenceService(
+                base_output_dir=self.config.ensure_output_dir(),
+                scenario_id=output_name or scenario.id,
+                evaluation_run_id=self.evaluation_run_id
+            )
 
-        collector = EventCollector()
         started_at_ms = self.clock.now_ms()
         conversation_manager = ConversationManager(
-            clock=self.clock, scenario_started_at_ms=started_at_ms
+            clock=self.clock,
+            scenario_started_at_ms=started_at_ms,
+            retain_outbound_payloads=self.config.retain_outbound_payloads,
         )
-        raw_messages: List[dict] = []
         adapter = ProtocolAdapter(call_id=scenario.id)
         metadata, sample_rate, channels = self._build_audio_metadata(adapter, scenario)
         effective_sample_rate = sample_rate or 16000
         effective_channels = channels or 1
-        tape = ConversationTape(sample_rate=effective_sample_rate)
 
         # Create appropriate WebSocket client based on scenario configuration
         ws_client = create_websocket_client(
             scenario=scenario,
             config=self.config,
-            log_sink=persistence_service.get_websocket_sink(),
+            log_sink=persistence_service.get_websocket_sink() if persistence_service else None,
         )
 
-        async with ws_client as ws:
-            listener = asyncio.create_task(
-                self._listen(
+        # Streaming mode appends artifacts as they arrive, so nothing is kept
+        # in memory for the end-of-run persistence (nor without persistence)
+        stream: Optional[StreamingResultsWriter] = None
+        collector: Optional[EventCollector] = None
+        raw_messages: Optional[List[dict]] = None
+        arena: Optional[AudioArena] = None
+        if persistence_service is not None and self.config.stream_results:
+            stream = persistence_service.open_stream(effective_sample_rate)
+        elif persistence_service is not None:
+            collector = EventCollector()
+            raw_messages = []
+            # Inbound audio is written at the end; pack it into one arena shared
+            # by the collected events and the tape
+            arena = AudioArena()
+        raw_retention = self.config.raw_event_retention
+
+        # Only runs that write call_mix.wav benefit from mixing as audio arrives.
+        # Inbound audio is placed at wall-clock arrival time, which lags the
+        # accelerated outbound timeline without bound, so the mix is only
+        # streamed (and its memory bounded) in real-time runs
+        stream_mix = stream is not None and self.clock.acceleration <= 1
+        tape = ConversationTape(
+            sample_rate=effective_sample_rate,
+            incremental=self.persist_results and self.config.tape_incremental,
+            on_flush=stream.write_mix if stream_mix else None,
+        )
+        pacer = PacingScheduler(self.clock, max_catch_up_ms=self.config.pacing_max_catch_up_ms)
+
+        try:
+            async with ws_client as ws:
+                listener = asyncio.create_task(
+                    self._listen(
+                        ws,
+                        adapter,
+                        collector,
+                        conversation_manager,
+                        raw_messages,
+                        tape,
+                        started_at_ms,
+                        stream,
+                        arena,
+                        raw_retention,
+                    )
+                )
+                if metadata:
+                    await ws.send_json(metadata)
+                await self._play_scenario(
                     ws,
                     adapter,
-                    collector,
-                    conversation_manager,
-                    raw_messages,
+                    scenario,
                     tape,
-                    started_at_ms,
+                    effective_sample_rate,
+                    effective_channels,
+                    conversation_manager,
+                    pacer,
                 )
-            )
-            if metadata:
-                await ws.send_json(metadata)
-            await self._play_scenario(
-                ws,
-                adapter,
-                scenario,
-                tape,
-                effective_sample_rate,
-                effective_channels,
-                conversation_manager,
-            )
-            await asyncio.sleep(1 / self.clock.acceleration)
-            listener.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await listener
+                await asyncio.sleep(1 / self.clock.acceleration)
+                listener.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await listener
+        except BaseException:
+            if stream is not None:
+                # Close the streamed files so a failed run leaves usable artifacts
+                persistence_service.finish_stream(stream, tape)
+            raise
+
+        pacing = pacer.stats.summary()
+        logger.info(
+            "Pacing for '%s': %d frames, %d late (>%.0f ms), p95 lateness %.1f ms, max %.1f ms, %d resync(s)",
+            scenario.id,
+            pacing["frames"],
+            pacing["late_frames"],
+            pacing["late_threshold_ms"],
+            pacing["p95_lateness_ms"],
+            pacing["max_lateness_ms"],
+            pacing["resyncs"],
+        )
+        self.last_pacing = pacing
+
+        # Persist results using the service; file writing and the call mix run
+        # off the event loop so concurrent calls keep streaming meanwhile
+        if stream is not None:
+            await asyncio.to_thread(persistence_service.finish_stream, stream, tape, pacing)
+        elif persistence_service is not None:
+            await asyncio.to_thread(persistence_service.persist_results, collector, raw_messages, tape, pacing)
 
-        # Persist results using the service
-        persistence_service.persist_results(collector, raw_messages, tape)
+        if not self.run_metrics:
+            return MetricsSummary(status="skipped"), conversation_manager
 
         # Create MetricsRunner with storage integration
         test_started_at = started_at or datetime.utcnow()
@@ -132,7 +210,7 @@ class ScenarioEngine:
                 participants=list(scenario.participants.keys())
             )
         else:
-            summary = runner.run()
+            summary = await asyncio.to_thread(runner.run)
 
         return summary, conversation_manager
 
@@ -145,6 +223,7 @@ class ScenarioEngine:
         sample_rate: int,
         channels: int,
         conversation_manager: ConversationManager,
+        pacer: PacingScheduler,
     ) -> None:
         """Play a scenario by processing turns in timeline order.
 
@@ -153,6 +232,10 @@ class ScenarioEngine:
         2. Delegating turn-specific logic to processors
         3. Tracking current playback position
 
+        Every frame, from the engine or a processor, is paced by ``pacer``
+        against its absolute scenario time, so send time does not accumulate
+        as drift over the call.
+
         Processors focus purely on turn execution, not timing orchestration.
 
         Args:
@@ -162,10 +245,13 @@ class ScenarioEngine:
             tape: Conversation tape for recording audio
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels
+            conversation_manager: Tracks per-turn timing
+            pacer: Deadline scheduler for frame pacing
         """
         timeline = sorted(scenario.turns, key=lambda turn: turn.start_at_ms)
         current_time = 0
         participants = list(scenario.participants.values())
+        pacer.start(current_time)
 
         # Process each turn with orchestrated timing
         for turn in timeline:
@@ -175,7 +261,7 @@ class ScenarioEngine:
             )
             # Orchestration: Stream silence until turn start time
             current_time = await self._stream_silence_until(
-                ws, adapter, participants, current_time, turn.start_at_ms, sample_rate, channels, tape
+                ws, adapter, participants, current_time, turn.start_at_ms, sample_rate, channels, tape, pacer
             )
 
             conversation_manager.start_turn(turn.id, {"type": turn.type, "start_at_ms": turn.start_at_ms})
@@ -190,6 +276,7 @@ class ScenarioEngine:
                 sample_rate=sample_rate,
                 channels=channels,
                 conversation_manager=conversation_manager,
+                pacer=pacer,
             )
             current_time = await processor.process(turn, scenario, participants, current_time)
 
@@ -202,7 +289,7 @@ class ScenarioEngine:
             f"current_time={current_time}ms, tail_silence_needed={tail_target - current_time}ms"
         )
         current_time = await self._stream_silence_until(
-            ws, adapter, participants, current_time, tail_target, sample_rate, channels, tape
+            ws, adapter, participants, current_time, tail_target, sample_rate, channels, tape, pacer
         )
 
     async def _stream_silence_until(
@@ -215,6 +302,7 @@ class ScenarioEngine:
         sample_rate: int,
         channels: int,
         tape: ConversationTape,
+        pacer: PacingScheduler,
     ) -> int:
         """Stream silence frames from current_time to target_ms.
 
@@ -231,6 +319,7 @@ class ScenarioEngine:
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels
             tape: Conversation tape for recording
+            pacer: Deadline scheduler for frame pacing
 
         Returns:
             Updated current time position
@@ -239,6 +328,7 @@ class ScenarioEngine:
             return current_time
 
         duration_ms = target_ms - current_time
+        frame_cache = default_frame_cache()
 
         async for frame in async_stream_silence(
             duration_ms=duration_ms,
@@ -248,17 +338,19 @@ class ScenarioEngine:
             sample_width=2,  # 16-bit PCM
             frame_duration_ms=FRAME_DURATION_MS
         ):
+            # The same encoded zero frame serves every participant and tick
+            encoded_frame = frame_cache.silence_frame(len(frame.data))
             for participant in participants:
-                payload = adapter.build_audio_message(
+                payload, encoded = adapter.build_encoded_audio_message(
                     participant_id=participant.name,
-                    pcm_bytes=frame.data,
+                    frame=encoded_frame,
                     timestamp_ms=frame.timestamp_ms,
                     silent=frame.is_silence,
                 )
-                await ws.send_json(payload)
-                tape.add_pcm(frame.timestamp_ms, frame.data)
+                await ws.send_json(payload, encoded=encoded)
+                tape.add_pcm(frame.timestamp_ms, encoded_frame.pcm)
 
-            await self.clock.sleep(FRAME_DURATION_MS)
+            await pacer.wait_until(min(frame.timestamp_ms + FRAME_DURATION_MS, target_ms))
 
         return target_ms
 
@@ -266,17 +358,23 @@ class ScenarioEngine:
         self,
         ws: WebSocketClient,
         adapter: ProtocolAdapter,
-        collector: EventCollector,
+        collector: Optional[EventCollector],
         conversation_manager: ConversationManager,
-        raw_messages: List[dict],
+        raw_messages: Optional[List[dict]],
         tape: ConversationTape,
         started_at_ms: int,
+        stream: Optional[StreamingResultsWriter] = None,
+        arena: Optional[AudioArena] = None,
+        raw_retention: RawRetention = RawRetention.NON_AUDIO,
     ) -> None:
         # Track first/last audio per turn for gap calculation
         turn_audio_tracking = {}  # turn_id -> (first_ms, last_ms)
 
         async for message in ws.iter_messages():
-            raw_messages.append(message)
+            if stream is not None:
+                stream.write_raw(message)
+            elif raw_messages is not None:
+                raw_messages.append(message)
             protocol_event = adapter.decode_inbound(message)
             if protocol_event is None:
                 continue
@@ -287,6 +385,10 @@ class ScenarioEngine:
             arrival_ms = self.clock.now_ms() - started_at_ms
             wall_clock_ms = self.clock.now_ms()
 
+            audio_payload = protocol_event.audio_payload
+            if audio_payload and arena is not None:
+                audio_payload = arena.store(audio_payload)
+
             collected = CollectedEvent(
                 event_type=protocol_event.event_type,
                 timestamp_ms=arrival_ms,  # Always use arrival time - simple and accurate!
@@ -294,14 +396,21 @@ class ScenarioEngine:
                 source_language=protocol_event.source_language,
                 target_language=protocol_event.target_language,
                 text=protocol_event.text,
-                audio_payload=protocol_event.audio_payload,
-                raw=protocol_event.raw,
+                audio_payload=audio_payload,
+                raw=protocol_event.raw if raw_retention.keeps(audio_payload is not None) else None,
             )
-            collector.add(collected)
+            if stream is not None:
+                stream.write_event(collected)
+            elif collector is not None:
+                collector.add(collected)
+            if collector is None and collected.audio_payload is not None:
+                # The stream writer owns the audio (or nothing persists it);
+                # metrics only need the timing
+                collected = replace(collected, audio_payload=None)
             conversation_manager.register_incoming(collected)
 
-            if protocol_event.event_type == "translated_audio" and protocol_event.audio_payload:
-                tape.add_pcm(arrival_ms, protocol_event.audio_payload)
+            if protocol_event.event_type == "translated_audio" and audio_payload:
+                tape.add_pcm(arrival_ms, audio_payload)
 
                 # Track for logging
                 turn_id = protocol_event.participant_id
@@ -310,7 +419,7 @@ class ScenarioEngine:
                     logger.info(
                         f"🔊 INCOMING AUDIO START: turn='{turn_id}', "
                         f"arrival_ms={arrival_ms}ms, wall_clock={wall_clock_ms}ms, "
-                        f"payload_size={len(protocol_event.audio_payload)} bytes"
+                        f"payload_size={len(audio_payload)} bytes"
                     )
                 else:
                     first_ms, _ = turn_audio_tracking[turn_id]
@@ -341,10 +450,10 @@ class ScenarioEngine:
                 continue
             participant = scenario.participants[turn.participant]
             audio_path = participant.audio_files[turn.audio_file]  # type: ignore[index]
-            with wave.open(str(audio_path), "rb") as wav:
-                channels = wav.getnchannels()
-                sample_width = wav.getsampwidth()
-                sample_rate = wav.getframerate()
+            wav_format = read_wav_format(audio_path)
+            channels = wav_format.channels
+            sample_width = wav_format.sample_width
+            sample_rate = wav_format.sample_rate
 
             if sample_width != 2:
                 raise ValueError(
@@ -68,7 +68,7 @@ class RecordingStartProcessor(TurnProcessor):
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from production.scenario_engine.turn_processors.audio import AudioTurnProcessor
 from production.scenario_engine.turn_processors.base import TurnProcessor
@@ -81,7 +81,7 @@ if TYPE_CHECKING:
     from production.acs_emulator.websocket_client import WebSocketClient
     from production.capture.conversation_manager import ConversationManager
     from production.capture.conversation_tape import ConversationTape
-    from production.utils.time_utils import Clock
+    from production.utils.time_utils import Clock, PacingScheduler
 
 
 def create_turn_processor(
@@ -93,6 +93,7 @@ def create_turn_processor(
     sample_rate: int,
     channels: int,
     conversation_manager: "ConversationManager",
+    pacer: Optional["PacingScheduler"] = None,
 ) -> TurnProcessor:
     """Factory method to create the appropriate turn processor.
 
@@ -115,6 +116,7 @@ def create_turn_processor(
         tape: Conversation tape for recording audio
         sample_rate: Audio sample rate in Hz
         channels: Number of audio channels
+        pacer: Deadline scheduler shared by every turn of the run
 
     Returns:
         TurnProcessor instance for the specified turn type
@@ -156,6 +158,7 @@ def create_turn_processor(
         sample_rate=sample_rate,
         channels=channels,
         conversation_manager=conversation_manager,
+        pacer=pacer,
     )
 
 
@@ -7,7 +7,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from production.acs_emulator.media_engine import FRAME_DURATION_MS, async_chunk_audio
+from production.acs_emulator.frame_cache import default_frame_cache
+from production.acs_emulator.media_engine import FRAME_DURATION_MS
 from production.scenario_engine.turn_processors.base import TurnProcessor
 
 if TYPE_CHECKING:
@@ -65,8 +66,9 @@ class AudioTurnProcessor(TurnProcessor):
         first_chunk_wall_clock = None
         last_chunk_wall_clock = None
 
-        async for offset_ms, data in async_chunk_audio(audio_path, FRAME_DURATION_MS):
-            send_at = turn.start_at_ms + offset_ms
+        # Frames are read and base64-encoded once per process and file
+        for frame in default_frame_cache().file_frames(audio_path, FRAME_DURATION_MS):
+            send_at = turn.start_at_ms + frame.offset_ms
             chunk_count += 1
             wall_clock_ms = self.clock.now_ms()
 
@@ -79,13 +81,13 @@ class AudioTurnProcessor(TurnProcessor):
 
             logger.debug(
                 f"Sending audio chunk #{chunk_count} for '{turn.id}': "
-                f"offset={offset_ms}ms, send_at={send_at}ms, size={len(data)} bytes"
+                f"offset={frame.offset_ms}ms, send_at={send_at}ms, size={len(frame.pcm)} bytes"
             )
 
             # Send audio data
-            payload = self.adapter.build_audio_message(
+            payload, encoded = self.adapter.build_encoded_audio_message(
                 participant_id=turn.id,
-                pcm_bytes=data,
+                frame=frame,
                 timestamp_ms=send_at,
             )
             # Register with scenario timeline timestamp (send_at), not wall-clock
@@ -96,10 +98,10 @@ class AudioTurnProcessor(TurnProcessor):
                 participant_id=turn.id,
                 timestamp_ms=send_at,  # Use scenario timeline!
             )
-            await self.ws.send_json(payload)
-            self.tape.add_pcm(send_at, data)
-            await self.clock.sleep(FRAME_DURATION_MS)
+            await self.ws.send_json(payload, encoded=encoded)
+            self.tape.add_pcm(send_at, frame.pcm)
             current_time = send_at + FRAME_DURATION_MS
+            await self.pacer.wait_until(current_time)
             last_chunk_wall_clock = wall_clock_ms
 
         logger.info(
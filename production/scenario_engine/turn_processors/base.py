@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from production.utils.time_utils import PacingScheduler
 
 if TYPE_CHECKING:
     from production.acs_emulator.protocol_adapter import ProtocolAdapter
@@ -42,6 +44,7 @@ class TurnProcessor(ABC):
         sample_rate: int,
         channels: int,
         conversation_manager: "ConversationManager",
+        pacer: Optional["PacingScheduler"] = None,
     ) -> None:
         """Initialize the turn processor.
 
@@ -52,6 +55,8 @@ class TurnProcessor(ABC):
             tape: Conversation tape for recording audio
             sample_rate: Audio sample rate in Hz
             channels: Number of audio channels
+            pacer: Deadline scheduler shared by the whole run (frames wait for
+                their scenario time instead of sleeping a fixed duration)
         """
         self.ws = ws
         self.adapter = adapter
@@ -60,6 +65,7 @@ class TurnProcessor(ABC):
         self.sample_rate = sample_rate
         self.channels = channels
         self.conversation_manager = conversation_manager
+        self.pacer = pacer or PacingScheduler(clock)
 
     @abstractmethod
     async def process(
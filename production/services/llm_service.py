@@ -5,6 +5,7 @@ Individual metrics implement their own prompts and logic.
 """
 
 import os
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Dict, Any
 import json
@@ -179,8 +180,10 @@ class LLMService:
             )
 
 
-# Global singleton for easy access
+# Global singleton for easy access; metrics run in worker threads, so creation
+# is locked to keep a single client (and connection pool) per process
 _default_service: Optional[LLMService] = None
+_default_service_lock = threading.Lock()
 
 
 def get_llm_service(config: Optional["FrameworkConfig"] = None) -> LLMService:
@@ -200,8 +203,9 @@ def get_llm_service(config: Optional["FrameworkConfig"] = None) -> LLMService:
 
     # Otherwise, return the global singleton
     global _default_service
-    if _default_service is None:
-        _default_service = LLMService()
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = LLMService()
     return _default_service
 
 
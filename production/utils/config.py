@@ -8,6 +8,8 @@ from typing import List, Optional
 
 from dotenv import load_dotenv
 
+from production.capture.collector import RawRetention
+
 
 @dataclass
 class FrameworkConfig:
@@ -35,6 +37,21 @@ class FrameworkConfig:
     tail_silence_ms: int = field(
         default_factory=lambda: int(os.getenv("TRANSLATION_TAIL_SILENCE_MS", "10000"))
     )
+    pacing_max_catch_up_ms: int = field(
+        default_factory=lambda: int(os.getenv("TRANSLATION_PACING_MAX_CATCH_UP_MS", "200"))
+    )
+    tape_incremental: bool = field(
+        default_factory=lambda: os.getenv("TRANSLATION_TAPE_INCREMENTAL", "true").lower() == "true"
+    )
+    stream_results: bool = field(
+        default_factory=lambda: os.getenv("TRANSLATION_STREAM_RESULTS", "false").lower() == "true"
+    )
+    raw_event_retention: RawRetention = field(
+        default_factory=lambda: os.getenv("TRANSLATION_RAW_EVENT_RETENTION", "non_audio").lower()
+    )
+    retain_outbound_payloads: bool = field(
+        default_factory=lambda: os.getenv("TRANSLATION_RETAIN_OUTBOUND_PAYLOADS", "false").lower() == "true"
+    )
     calibration_tolerance: float = field(
         default_factory=lambda: float(os.getenv("CALIBRATION_TOLERANCE", "10"))
     )
@@ -95,6 +112,9 @@ class FrameworkConfig:
         default_factory=lambda: os.getenv("LLM_MODEL", "gpt-4o-mini")
     )
 
+    def __post_init__(self) -> None:
+        self.raw_event_retention = _parse_raw_retention(self.raw_event_retention)
+
     def ensure_output_dir(self) -> Path:
         """Create the output directory if it does not exist."""
 
@@ -102,6 +122,17 @@ class FrameworkConfig:
         return self.output_dir
 
 
+def _parse_raw_retention(value: str) -> RawRetention:
+    """Validate TRANSLATION_RAW_EVENT_RETENTION so a typo fails at load, not mid-run."""
+    try:
+        return RawRetention(value)
+    except ValueError:
+        available = ", ".join(option.value for option in RawRetention)
+        raise ValueError(
+            f"Invalid TRANSLATION_RAW_EVENT_RETENTION '{value}'. Available: {available}"
+        ) from None
+
+
 def _parse_tags(tags_str: str) -> List[str]:
     """Parse comma-separated tags string.
 
@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
-from dataclasses import dataclass
-from typing import Callable
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CATCH_UP_MS = 200
+DEFAULT_LATE_THRESHOLD_MS = 5.0
 
 
 @dataclass
@@ -21,4 +28,106 @@ class Clock:
         await asyncio.sleep(duration_ms / 1000.0 / self.acceleration)
 
 
-__all__ = ["Clock"]
+@dataclass
+class PacingStats:
+    """How far behind its deadline each paced frame woke up (wall-clock ms)."""
+
+    late_threshold_ms: float = DEFAULT_LATE_THRESHOLD_MS
+    frames: int = 0
+    late_frames: int = 0
+    resyncs: int = 0
+    slipped_ms: int = 0  # scenario time lost to resyncs
+    lateness_ms: array = field(default_factory=lambda: array("f"), repr=False)
+
+    def record(self, lateness_ms: float) -> None:
+        self.frames += 1
+        self.lateness_ms.append(lateness_ms)
+        if lateness_ms > self.late_threshold_ms:
+            self.late_frames += 1
+
+    def summary(self) -> dict:
+        samples = self.lateness_ms
+        ordered = sorted(samples)
+
+        def percentile(pct: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+        return {
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "late_threshold_ms": self.late_threshold_ms,
+            "resyncs": self.resyncs,
+            "slipped_ms": self.slipped_ms,
+            "mean_lateness_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            "p50_lateness_ms": round(percentile(50), 3),
+            "p95_lateness_ms": round(percentile(95), 3),
+            "p99_lateness_ms": round(percentile(99), 3),
+            "max_lateness_ms": round(ordered[-1] if ordered else 0.0, 3),
+        }
+
+
+class PacingScheduler:
+    """Paces playback against absolute deadlines measured from scenario start.
+
+    Sleeping a fixed frame duration after each send lets send and encode time
+    accumulate as drift. Here every frame waits for ``origin + scenario_ms``
+    instead, so a late wake-up is absorbed by shorter sleeps (or none) on the
+    following frames and playback stays on the scenario timeline.
+
+    Frames behind by up to ``max_catch_up_ms`` of scenario time are sent
+    back-to-back to catch up. Beyond that (e.g. a stalled event loop) bursting
+    would flood the service, so the timeline is re-anchored to now and the gap
+    is recorded as a resync.
+    """
+
+    def __init__(
+        self,
+        clock: Clock,
+        *,
+        max_catch_up_ms: int = DEFAULT_MAX_CATCH_UP_MS,
+        late_threshold_ms: float = DEFAULT_LATE_THRESHOLD_MS,
+    ) -> None:
+        self.clock = clock
+        self.max_catch_up_ms = max_catch_up_ms
+        self.stats = PacingStats(late_threshold_ms=late_threshold_ms)
+        self._origin: Optional[float] = None
+
+    def start(self, scenario_ms: int = 0) -> None:
+        """Anchor ``scenario_ms`` of the scenario timeline to now."""
+        self._origin = self.clock.time_fn() - self._to_wall_s(scenario_ms)
+
+    def deadline(self, scenario_ms: int) -> float:
+        """Clock time (``clock.time_fn`` seconds) at which ``scenario_ms`` is due."""
+        if self._origin is None:
+            self.start(scenario_ms)
+        return self._origin + self._to_wall_s(scenario_ms)
+
+    async def wait_until(self, scenario_ms: int) -> None:
+        """Sleep until ``scenario_ms`` is due and record how late we woke up."""
+        deadline = self.deadline(scenario_ms)
+        delay = deadline - self.clock.time_fn()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        lateness_s = self.clock.time_fn() - deadline
+        self.stats.record(lateness_s * 1000.0)
+
+        behind_ms = int(lateness_s * 1000.0 * self.clock.acceleration)
+        if behind_ms > self.max_catch_up_ms:
+            self._origin += lateness_s
+            self.stats.resyncs += 1
+            self.stats.slipped_ms += behind_ms
+            log = logger.warning if self.stats.resyncs == 1 else logger.debug
+            log(
+                "Playback fell %d ms behind at scenario_time=%dms; re-anchoring the pacing timeline",
+                behind_ms,
+                scenario_ms,
+            )
+
+    def _to_wall_s(self, scenario_ms: int) -> float:
+        return scenario_ms / 1000.0 / self.clock.acceleration
+
+
+__all__ = ["Clock", "PacingScheduler", "PacingStats"]
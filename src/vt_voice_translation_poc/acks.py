@@ -0,0 +1,78 @@
+"""Acknowledgement policy for inbound audio frames.
+
+ACS does not need (or read) per-frame acknowledgements, and acking every 20 ms
+frame doubles the WebSocket message rate. Each session gets an `AckTracker` that
+decides which frames are acknowledged:
+
+* none: never acknowledge audio frames;
+* every: acknowledge every N-th frame (N=1 reproduces the old per-frame acks);
+* interval: acknowledge at most once per interval;
+* gaps: acknowledge only frames that reveal a sequence gap or reordering.
+
+Sequence gaps are reported under every policy except none.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+
+class AckPolicy(str, Enum):
+    """When inbound audio frames are acknowledged."""
+
+    NONE = "none"
+    EVERY = "every"
+    INTERVAL = "interval"
+    GAPS = "gaps"
+
+
+DEFAULT_ACK_POLICY = AckPolicy.GAPS
+DEFAULT_ACK_EVERY = 50  # ~1 s of 20 ms ACS frames
+DEFAULT_ACK_INTERVAL_MS = 1000
+
+
+@dataclass(frozen=True)
+class AckSettings:
+    policy: AckPolicy = DEFAULT_ACK_POLICY
+    every: int = DEFAULT_ACK_EVERY
+    interval_ms: int = DEFAULT_ACK_INTERVAL_MS
+
+    def __post_init__(self) -> None:
+        if self.every < 1:
+            raise ValueError(f"Ack frame interval must be at least 1 (got {self.every}).")
+        if self.interval_ms < 1:
+            raise ValueError(f"Ack time interval must be at least 1 ms (got {self.interval_ms}).")
+
+
+class AckTracker:
+    """Per-session state for an `AckSettings` policy."""
+
+    def __init__(self, settings: AckSettings) -> None:
+        self.settings = settings
+        self.sent = 0
+        self._frames_since_ack = 0
+        self._last_ack = time.monotonic()
+
+    def should_ack(self, *, gap: bool = False) -> bool:
+        """Record one frame and return whether it should be acknowledged."""
+        policy = self.settings.policy
+        if policy is AckPolicy.NONE:
+            return False
+
+        self._frames_since_ack += 1
+        if gap:
+            due = True
+        elif policy is AckPolicy.EVERY:
+            due = self._frames_since_ack >= self.settings.every
+        elif policy is AckPolicy.INTERVAL:
+            due = (time.monotonic() - self._last_ack) * 1000 >= self.settings.interval_ms
+        else:
+            due = False
+
+        if due:
+            self._frames_since_ack = 0
+            self._last_ack = time.monotonic()
+            self.sent += 1
+        return due
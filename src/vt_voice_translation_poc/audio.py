@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
 import threading
-import os
-import subprocess
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Deque, Iterator, Optional
+from typing import AsyncIterator, Deque, Iterator, Optional, Union
 
 import azure.cognitiveservices.speech as speechsdk
 from rich.console import Console
 
+from .conversion_cache import default_conversion_cache
+from .wav import WavFile, read_wav_format
+
 try:
     import pyaudio
 except Exception:  # pragma: no cover
@@ -31,6 +34,14 @@ DEFAULT_SAMPLE_RATE = 16000
 DEFAULT_CHANNELS = 1
 DEFAULT_CHUNK_SIZE = 3200  # ~100ms @ 16kHz mono 16-bit
 DEFAULT_SAMPLE_WIDTH = 2  # 16-bit PCM
+# Upper bound on how long a consumer can miss a stop signal that was set without close()
+STOP_CHECK_INTERVAL_S = 1.0
+# Duration of the chunks fed to translators from streamed (WebSocket) audio
+DEFAULT_CHUNK_DURATION_MS = 100
+# Chunks held by a PcmRingBuffer before its oldest slot is reused
+DEFAULT_RING_SLOTS = 256
+
+AudioChunk = Union[bytes, memoryview]
 
 
 class AudioSourceType(Enum):
@@ -40,6 +51,239 @@ class AudioSourceType(Enum):
     STREAM = auto()
 
 
+class _EndOfStream:
+    """Sentinel type returned by AudioChunkChannel once it is closed and drained."""
+
+    def __repr__(self) -> str:
+        return "END_OF_STREAM"
+
+
+END_OF_STREAM = _EndOfStream()
+
+
+class AudioChunkChannel:
+    """
+    Bounded FIFO of audio chunks shared between producer threads and consumers.
+
+    Producers (the WebSocket server, microphone capture thread) call put() from any
+    thread; consumers block in get() or await get_async() and are woken when data
+    arrives, so idle streams cost nothing between chunks. When the ring is full the
+    oldest chunk is discarded, matching the previous deque(maxlen=...) behaviour.
+    close() marks end of stream: consumers drain what is left and then receive
+    END_OF_STREAM, which also ends both iterators.
+    """
+
+    def __init__(self, maxlen: int = 512) -> None:
+        self._chunks: Deque[AudioChunk] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._close_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, chunk: AudioChunk) -> None:
+        """Append a chunk and wake any waiting consumer. Ignored after close()."""
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._chunks) == self._chunks.maxlen:
+                self.dropped += 1
+            self._chunks.append(chunk)
+            self._not_empty.notify()
+            self._wake_async_waiters()
+
+    def close(self) -> None:
+        """Signal end of stream; pending chunks can still be drained."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._async_waiters.extend(self._close_waiters)
+            self._close_waiters.clear()
+            self._wake_async_waiters()
+
+    def get(self, timeout: Optional[float] = None) -> Union[AudioChunk, _EndOfStream, None]:
+        """Block until a chunk is available. Returns None on timeout, END_OF_STREAM once closed."""
+        with self._not_empty:
+            if not self._chunks and not self._closed:
+                self._not_empty.wait(timeout)
+            if self._chunks:
+                return self._chunks.popleft()
+            if self._closed:
+                return END_OF_STREAM
+            return None
+
+    async def get_async(self, timeout: Optional[float] = None) -> Union[AudioChunk, _EndOfStream, None]:
+        """Await the next chunk. Returns None on timeout, END_OF_STREAM once closed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._chunks:
+                return self._chunks.popleft()
+            if self._closed:
+                return END_OF_STREAM
+            waiter = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                if (loop, waiter) in self._async_waiters:
+                    self._async_waiters.remove((loop, waiter))
+
+        with self._lock:
+            if self._chunks:
+                return self._chunks.popleft()
+            if self._closed:
+                return END_OF_STREAM
+            return None
+
+    async def wait_closed(self) -> None:
+        """Wait until close() has been called (does not consume chunks)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                return
+            waiter = loop.create_future()
+            self._close_waiters.append((loop, waiter))
+        try:
+            await waiter
+        finally:
+            with self._lock:
+                if (loop, waiter) in self._close_waiters:
+                    self._close_waiters.remove((loop, waiter))
+
+    def __iter__(self) -> Iterator[AudioChunk]:
+        while True:
+            chunk = self.get()
+            if chunk is END_OF_STREAM:
+                return
+            if chunk:
+                yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[AudioChunk]:
+        while True:
+            chunk = await self.get_async()
+            if chunk is END_OF_STREAM:
+                return
+            if chunk:
+                yield chunk
+
+    def _wake_async_waiters(self) -> None:
+        # Caller holds self._lock
+        if not self._async_waiters:
+            return
+        try:
+            current_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, waiter in self._async_waiters:
+            if loop is current_loop:
+                _resolve_waiter(waiter)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
+        self._async_waiters.clear()
+
+
+class PcmRingBuffer:
+    """
+    Fixed-capacity byte ring that regroups PCM frames into equal-sized chunks.
+
+    Incoming frames are copied once into a preallocated buffer; complete chunks are
+    handed out as memoryviews over that buffer, so there is no shifting of pending
+    bytes and no per-chunk bytes object. Capacity is a whole number of chunks and
+    chunks always start on a slot boundary, so a chunk never wraps around the end.
+
+    A returned view stays valid until `slots - 1` further chunks have been written;
+    consumers that keep chunks around (e.g. in an AudioChunkChannel) must hold at
+    most `max_outstanding_chunks` of them. Not thread-safe: one producer per ring.
+    """
+
+    def __init__(self, chunk_bytes: int, slots: int = DEFAULT_RING_SLOTS) -> None:
+        if chunk_bytes <= 0:
+            raise ValueError(f"chunk_bytes must be positive (got {chunk_bytes}).")
+        if slots < 3:
+            raise ValueError(f"A PCM ring needs at least 3 slots (got {slots}).")
+        self.chunk_bytes = chunk_bytes
+        self.slots = slots
+        self.capacity = chunk_bytes * slots
+        self._view = memoryview(bytearray(self.capacity))
+        # Monotonic byte counters; positions in the ring are taken modulo capacity
+        self._write_pos = 0
+        self._read_pos = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes written but not yet handed out as a chunk."""
+        return self._write_pos - self._read_pos
+
+    @property
+    def max_outstanding_chunks(self) -> int:
+        """How many handed-out chunks may be held before their memory is reused."""
+        return self.slots - 2
+
+    def write(self, data) -> list[memoryview]:
+        """Copy a frame into the ring and return the chunks it completed."""
+        src = memoryview(data).cast("B")
+        if len(src) > self.capacity - self.chunk_bytes:
+            raise ValueError(
+                f"Frame of {len(src)} bytes does not fit a ring of {self.capacity} bytes."
+            )
+
+        offset = 0
+        while offset < len(src):
+            start = self._write_pos % self.capacity
+            count = min(len(src) - offset, self.capacity - start)
+            self._view[start : start + count] = src[offset : offset + count]
+            self._write_pos += count
+            offset += count
+
+        chunks = []
+        while self.pending >= self.chunk_bytes:
+            start = self._read_pos % self.capacity
+            self._read_pos += self.chunk_bytes
+            chunks.append(self._view[start : start + self.chunk_bytes])
+        return chunks
+
+    def drain_partial(self) -> Optional[memoryview]:
+        """Hand out the incomplete tail (shorter than a chunk), e.g. at end of stream."""
+        if not self.pending:
+            return None
+        start = self._read_pos % self.capacity
+        tail = self._view[start : start + self.pending]
+        self._read_pos = self._write_pos
+        return tail
+
+
+def _sdk_buffer(chunk: AudioChunk):
+    """Adapt a chunk for PushAudioInputStream.write, which copies the data itself.
+
+    The SDK's ctypes binding rejects memoryviews, so writable views (PcmRingBuffer
+    chunks) are wrapped in a ctypes array sharing their memory instead of copied.
+    """
+    if isinstance(chunk, bytes):
+        return chunk
+    if isinstance(chunk, memoryview) and not chunk.readonly:
+        return (ctypes.c_char * len(chunk)).from_buffer(chunk)
+    return bytes(chunk)
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 @dataclass
 class AudioInput:
     """Represents an audio source for the Speech SDK."""
@@ -53,7 +297,7 @@ class AudioInput:
     _microphone_stream: Optional[object] = None  # pyaudio.Stream
     _microphone_pyaudio: Optional[object] = None  # pyaudio.PyAudio instance
     _microphone_thread: Optional[threading.Thread] = None
-    _audio_queue: Deque[bytes] = field(default_factory=lambda: deque(maxlen=512))
+    _audio_queue: AudioChunkChannel = field(default_factory=AudioChunkChannel)
     _stop_capture: Optional[threading.Event] = None
     _custom_format: Optional[tuple[int, int, int]] = None  # (sample_rate, channels, sample_width)
 
@@ -72,23 +316,25 @@ class AudioInput:
         """Check if this is a generic stream input."""
         return self.source_type == AudioSourceType.STREAM
 
-    def write(self, chunk: bytes) -> None:
+    def write(self, chunk: AudioChunk) -> None:
         """
         Write audio data to the input.
         Only valid for STREAM source type.
         Feeds both the internal queue (for get_audio_chunks) and the SDK stream (if present).
+        Accepts memoryview chunks from a PcmRingBuffer without copying them; the
+        queue must then be no longer than the ring's max_outstanding_chunks.
         """
         if self.source_type != AudioSourceType.STREAM:
             raise RuntimeError(f"Cannot write to AudioInput of type {self.source_type}")
 
         # Feed internal queue for manual consumers (like Voice Live)
-        self._audio_queue.append(chunk)
+        self._audio_queue.put(chunk)
 
         # Feed SDK stream if configured (for Live Interpreter)
         if self.stream:
-            self.stream.write(chunk)
+            self.stream.write(_sdk_buffer(chunk))
 
-    def get_audio_chunks(self) -> Iterator[bytes]:
+    def get_audio_chunks(self) -> Iterator[AudioChunk]:
         """
         Get audio chunks for streaming providers (e.g., Voice Live).
         For microphone/stream input, yields chunks in real-time.
@@ -98,35 +344,23 @@ class AudioInput:
             while True:
                 if self._stop_capture and self._stop_capture.is_set():
                     break
-                
-                # Check if queue has items before trying to pop
-                if len(self._audio_queue) > 0:
-                    chunk = self._audio_queue.popleft()
-                    if chunk:
-                        yield chunk
-                else:
-                    import time
-                    time.sleep(0.002)  # Small delay to avoid busy waiting
+
+                # Sleeps until a chunk arrives or the channel is closed; the timeout
+                # only bounds how long a bare _stop_capture.set() goes unnoticed
+                chunk = self._audio_queue.get(timeout=STOP_CHECK_INTERVAL_S)
+                if chunk is END_OF_STREAM:
+                    break
+                if chunk:
+                    yield chunk
 
         elif self.source_type == AudioSourceType.FILE:
             if self.source_path is None:
                 raise RuntimeError("File path not set")
             if self.source_path.suffix.lower() == ".wav":
-                # Use wave module to properly read WAV files
-                import wave
-                with wave.open(str(self.source_path), "rb") as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    # Calculate frames for ~100ms chunks
-                    frames_per_chunk = max(1, sample_rate // 10)  # ~100ms
-                    total_frames = wav_file.getnframes()
-                    frames_read = 0
-                    while frames_read < total_frames:
-                        frames_to_read = min(frames_per_chunk, total_frames - frames_read)
-                        chunk = wav_file.readframes(frames_to_read)
-                        if not chunk:
-                            break
-                        yield chunk
-                        frames_read += frames_to_read
+                # ~100ms zero-copy views over the memory-mapped file
+                with WavFile(self.source_path) as wav_file:
+                    frames_per_chunk = max(1, wav_file.format.sample_rate // 10)
+                    yield from wav_file.chunks(frames_per_chunk)
             else:
                 # For other formats, read raw bytes
                 with self.source_path.open("rb") as f:
@@ -137,6 +371,27 @@ class AudioInput:
         else:
             raise RuntimeError(f"Unknown audio source type: {self.source_type}")
 
+    async def get_audio_chunks_async(self) -> AsyncIterator[AudioChunk]:
+        """
+        Async counterpart of get_audio_chunks() for providers running on an event loop.
+        Waiting for microphone/stream data yields to the loop instead of blocking it,
+        so many sessions can share one loop.
+        """
+        if self.source_type in (AudioSourceType.MICROPHONE, AudioSourceType.STREAM):
+            while True:
+                if self._stop_capture and self._stop_capture.is_set():
+                    break
+
+                chunk = await self._audio_queue.get_async(timeout=STOP_CHECK_INTERVAL_S)
+                if chunk is END_OF_STREAM:
+                    break
+                if chunk:
+                    yield chunk
+        else:
+            # File chunks are read from disk without waiting on a producer
+            for chunk in self.get_audio_chunks():
+                yield chunk
+
     def get_audio_format(self) -> tuple[int, int, int]:
         """
         Get audio format (sample_rate, channels, sample_width).
@@ -151,13 +406,8 @@ class AudioInput:
             
         elif self.source_type == AudioSourceType.FILE and self.source_path:
             if self.source_path.suffix.lower() == ".wav":
-                import wave
-                with wave.open(str(self.source_path), "rb") as wav_file:
-                    return (
-                        wav_file.getframerate(),
-                        wav_file.getnchannels(),
-                        wav_file.getsampwidth(),
-                    )
+                wav_format = read_wav_format(self.source_path)
+                return (wav_format.sample_rate, wav_format.channels, wav_format.sample_width)
             # Default for other formats
             return (DEFAULT_SAMPLE_RATE, DEFAULT_CHANNELS, DEFAULT_SAMPLE_WIDTH)
             
@@ -167,6 +417,8 @@ class AudioInput:
         """Close any underlying audio stream."""
         if self._stop_capture:
             self._stop_capture.set()
+        # Wake chunk consumers so they observe end of stream immediately
+        self._audio_queue.close()
         if self._microphone_stream:
             try:
                 if hasattr(self._microphone_stream, 'stop_stream'):
@@ -193,7 +445,12 @@ class AudioInput:
         self.close()
 
 
-def build_audio_input(source_path: Optional[Path], use_streaming_microphone: bool = False) -> AudioInput:
+def build_audio_input(
+    source_path: Optional[Path],
+    use_streaming_microphone: bool = False,
+    *,
+    quiet: bool = False,
+) -> AudioInput:
     """
     Create an `AudioInput` from a file path or microphone.
     
@@ -202,7 +459,9 @@ def build_audio_input(source_path: Optional[Path], use_streaming_microphone: boo
         use_streaming_microphone: If True and source_path is None, creates a streaming
             microphone input suitable for Voice Live. If False, uses Azure SDK's default
             microphone (for Live Interpreter).
+        quiet: If True, file inputs are built without printing progress.
     """
+    out = Console(quiet=True) if quiet else console
     if source_path is None:
         if use_streaming_microphone:
             return _build_streaming_microphone_input()
@@ -217,7 +476,7 @@ def build_audio_input(source_path: Optional[Path], use_streaming_microphone: boo
 
     suffix = source_path.suffix.lower()
     if suffix == ".wav":
-        console.print(f"[bold green]Using WAV file:[/bold green] {source_path}")
+        out.print(f"[bold green]Using WAV file:[/bold green] {source_path}")
         return AudioInput(
             source_type=AudioSourceType.FILE,
             config=speechsdk.audio.AudioConfig(filename=str(source_path)),
@@ -225,7 +484,7 @@ def build_audio_input(source_path: Optional[Path], use_streaming_microphone: boo
         )
 
     if suffix == ".mp3":
-        console.print(f"[bold green]Using MP3 file (converted in-memory):[/bold green] {source_path}")
+        out.print(f"[bold green]Using MP3 file (converted in-memory):[/bold green] {source_path}")
         stream_format = speechsdk.audio.AudioStreamFormat(
             compressed_stream_format=speechsdk.AudioStreamContainerFormat.MP3
         )
@@ -245,8 +504,8 @@ def build_audio_input(source_path: Optional[Path], use_streaming_microphone: boo
         )
 
     if suffix in {".m4a", ".aac"}:
-        converted_path = _convert_audio_to_wav(source_path)
-        console.print(
+        converted_path = _convert_audio_to_wav(source_path, quiet=quiet)
+        out.print(
             f"[bold green]Converted {source_path.name} to WAV:[/bold green] {converted_path}"
         )
         return AudioInput(
@@ -266,56 +525,20 @@ def _convert_audio_to_wav(
     *,
     target_sample_rate: int = DEFAULT_SAMPLE_RATE,
     target_channels: int = DEFAULT_CHANNELS,
+    quiet: bool = False,
 ) -> Path:
     """
-    Convert compressed audio (e.g., M4A/AAC) to a WAV file using ffmpeg.
-    The converted file is written into the project samples directory so it can be reviewed.
+    Convert compressed audio (e.g., M4A/AAC) to a WAV file.
+    Conversions are cached by content under samples/converted (see conversion_cache),
+    so unchanged sources are only converted once and stay available for review.
     """
-    project_root = Path(__file__).resolve().parents[2]
-    samples_dir = project_root / "samples"
-    samples_dir.mkdir(parents=True, exist_ok=True)
-
-    target_path = samples_dir / f"{source_path.stem}_converted.wav"
-    if target_path.exists():
-        target_path.unlink()
-
-    ffmpeg_path = os.getenv("FFMPEG_PATH", "ffmpeg")
-
-    command = [
-        ffmpeg_path,
-        "-y",
-        "-i",
-        str(source_path),
-        "-ac",
-        str(target_channels),
-        "-ar",
-        str(target_sample_rate),
-        "-sample_fmt",
-        "s16",
-        str(target_path),
-    ]
-
-    try:
-        subprocess.run(
-            command,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-    except FileNotFoundError as exc:
-        raise RuntimeError(
-            "ffmpeg not found. Install ffmpeg or set the FFMPEG_PATH environment variable."
-        ) from exc
-    except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.decode("utf-8", errors="ignore").strip()
-        raise RuntimeError(f"ffmpeg failed to convert {source_path.name}: {stderr}") from exc
-
-    console.print(
-        f"[bold blue]Converted audio saved to samples:[/bold blue] {target_path}"
+    return default_conversion_cache().get_or_convert(
+        source_path,
+        sample_rate=target_sample_rate,
+        channels=target_channels,
+        quiet=quiet,
     )
 
-    return target_path
-
 
 def _build_streaming_microphone_input() -> AudioInput:
     """Create a streaming microphone input using pyaudio or sounddevice for Voice Live."""
@@ -330,7 +553,7 @@ def _build_streaming_microphone_input() -> AudioInput:
 
     console.print("[bold green]Using streaming microphone input[/bold green]")
     
-    audio_queue: Deque[bytes] = deque(maxlen=512)
+    audio_queue = AudioChunkChannel(maxlen=512)
     stop_capture = threading.Event()
     
     def _capture_audio():
@@ -355,7 +578,7 @@ def _build_streaming_microphone_input() -> AudioInput:
                                     # Only log overflow every 10 occurrences to reduce noise
                                     if overflow_count % 10 == 0:
                                         console.print(f"[yellow]Audio buffer overflow (x{overflow_count})[/yellow]")
-                                audio_queue.append(data.tobytes())
+                                audio_queue.put(data.tobytes())
                             except Exception:  # pragma: no cover
                                 break
                 except Exception as e:  # pragma: no cover
@@ -375,7 +598,7 @@ def _build_streaming_microphone_input() -> AudioInput:
                 while not stop_capture.is_set():
                     try:
                         data = pyaudio_stream.read(DEFAULT_CHUNK_SIZE, exception_on_overflow=False)
-                        audio_queue.append(data)
+                        audio_queue.put(data)
                     except Exception:  # pragma: no cover
                         break
                 
@@ -384,6 +607,9 @@ def _build_streaming_microphone_input() -> AudioInput:
                 pyaudio_instance.terminate()
         except Exception as e:  # pragma: no cover
             console.print(f"[bold red]Microphone capture error: {e}[/bold red]")
+        finally:
+            # No more audio will arrive; let consumers finish instead of waiting
+            audio_queue.close()
     
     capture_thread = threading.Thread(target=_capture_audio, daemon=True)
     capture_thread.start()
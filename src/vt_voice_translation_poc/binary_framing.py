@@ -0,0 +1,151 @@
+"""Binary PCM framing for the WebSocket ingest path.
+
+ACS JSON messages carry base64 audio inside a JSON document, which inflates the
+payload by a third and costs a JSON parse per 20 ms frame. Clients that negotiate
+the `vt-pcm.v1` WebSocket subprotocol may instead send each frame as a binary
+message: a fixed little-endian header, the participant ID, then raw PCM.
+
+    offset  size  field
+    0       1     version (1)
+    1       1     flags (bit 0: silent, bit 1: end of stream)
+    2       1     channels
+    3       1     bits per sample
+    4       4     sample rate (Hz, uint32)
+    8       4     sequence number (uint32)
+    12      8     timestamp (microseconds since the Unix epoch, uint64; 0 = unknown)
+    20      1     participant ID length N (bytes)
+    21      N     participant ID (UTF-8)
+    21 + N  ...   PCM samples (little-endian)
+
+Control messages (e.g. EndOfStream) may still be sent as ACS JSON text frames on a
+binary session.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+BINARY_SUBPROTOCOL = "vt-pcm.v1"
+FRAME_VERSION = 1
+
+FLAG_SILENT = 0x01
+FLAG_END_OF_STREAM = 0x02
+
+_HEADER = struct.Struct("<BBBBIIQB")
+HEADER_SIZE = _HEADER.size
+MAX_PARTICIPANT_ID_BYTES = 255
+
+
+class FrameDecodeError(ValueError):
+    """Raised when a binary message is not a valid audio frame."""
+
+
+@dataclass
+class BinaryAudioFrame:
+    """One decoded binary audio frame; `pcm` is a view into the received message."""
+
+    participant_id: str
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    sequence: int
+    timestamp_us: int
+    silent: bool
+    end_of_stream: bool
+    pcm: memoryview
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        if not self.timestamp_us:
+            return None
+        return datetime.fromtimestamp(self.timestamp_us / 1_000_000, tz=timezone.utc)
+
+
+def decode_frame(message: bytes) -> BinaryAudioFrame:
+    """Parse a binary message without copying its PCM payload.
+
+    Raises FrameDecodeError for a malformed header, an invalid audio format or a
+    payload that is not a whole number of sample frames.
+    """
+    if len(message) < HEADER_SIZE:
+        raise FrameDecodeError(f"Frame too short: {len(message)} bytes (header is {HEADER_SIZE}).")
+
+    (
+        version,
+        flags,
+        channels,
+        bits_per_sample,
+        sample_rate,
+        sequence,
+        timestamp_us,
+        participant_len,
+    ) = _HEADER.unpack_from(message)
+    if version != FRAME_VERSION:
+        raise FrameDecodeError(f"Unsupported frame version {version} (expected {FRAME_VERSION}).")
+
+    if sample_rate <= 0:
+        raise FrameDecodeError(f"Invalid sample rate {sample_rate} Hz.")
+    if channels <= 0:
+        raise FrameDecodeError(f"Invalid channel count {channels}.")
+    if bits_per_sample <= 0 or bits_per_sample % 8:
+        raise FrameDecodeError(f"Invalid bits per sample {bits_per_sample}.")
+
+    pcm_offset = HEADER_SIZE + participant_len
+    if len(message) < pcm_offset:
+        raise FrameDecodeError("Frame truncated inside the participant ID.")
+    frame_width = bits_per_sample // 8 * channels
+    pcm_bytes = len(message) - pcm_offset
+    if pcm_bytes % frame_width:
+        raise FrameDecodeError(
+            f"PCM payload of {pcm_bytes} bytes is not a whole number of "
+            f"{frame_width}-byte sample frames."
+        )
+    try:
+        participant_id = bytes(message[HEADER_SIZE:pcm_offset]).decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise FrameDecodeError(f"Participant ID is not valid UTF-8: {exc}") from exc
+
+    return BinaryAudioFrame(
+        participant_id=participant_id,
+        sample_rate=sample_rate,
+        channels=channels,
+        bits_per_sample=bits_per_sample,
+        sequence=sequence,
+        timestamp_us=timestamp_us,
+        silent=bool(flags & FLAG_SILENT),
+        end_of_stream=bool(flags & FLAG_END_OF_STREAM),
+        pcm=memoryview(message)[pcm_offset:],
+    )
+
+
+def encode_frame(
+    pcm: bytes,
+    *,
+    participant_id: str,
+    sample_rate: int,
+    channels: int = 1,
+    bits_per_sample: int = 16,
+    sequence: int = 0,
+    timestamp_us: int = 0,
+    silent: bool = False,
+    end_of_stream: bool = False,
+) -> bytes:
+    """Build a binary audio frame (used by clients and tests)."""
+    participant = participant_id.encode("utf-8")
+    if len(participant) > MAX_PARTICIPANT_ID_BYTES:
+        raise ValueError(f"Participant ID longer than {MAX_PARTICIPANT_ID_BYTES} bytes.")
+    flags = (FLAG_SILENT if silent else 0) | (FLAG_END_OF_STREAM if end_of_stream else 0)
+    header = _HEADER.pack(
+        FRAME_VERSION,
+        flags,
+        channels,
+        bits_per_sample,
+        sample_rate,
+        sequence & 0xFFFFFFFF,
+        timestamp_us,
+        len(participant),
+    )
+    return b"".join((header, participant, pcm))
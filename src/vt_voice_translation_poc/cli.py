@@ -4,19 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 import typer
 from rich.console import Console
 from rich.traceback import install as install_rich_traceback
 from rich.panel import Panel
+from rich.table import Table
 
 
-from .audio import build_audio_input
+from .acks import DEFAULT_ACK_EVERY, DEFAULT_ACK_INTERVAL_MS, DEFAULT_ACK_POLICY, AckPolicy
+from .audio import DEFAULT_CHUNK_DURATION_MS, build_audio_input
 from .config import SpeechProvider, SpeechServiceSettings
+from .models import DEFAULT_SESSION_HISTORY_TURNS
+from .outbound import DEFAULT_HIGH_WATERMARK, DEFAULT_LOW_WATERMARK, OutboundDropPolicy
 from .providers import create_translator
+from .voice_live import DEFAULT_AUDIO_DELTA_COALESCE_MS, AudioDeltaMode
+from .wav import WavFile, WavFormatError
 from .websocket_server import WebSocketServer
+from .voice_live_pool import DEFAULT_IDLE_TIMEOUT_S, DEFAULT_POOL_SIZE
+from .workers import DEFAULT_GRACEFUL_TIMEOUT_S, DEFAULT_HEALTH_PORT, WorkerSupervisor
 
 install_rich_traceback(suppress=[typer])
 
@@ -74,36 +85,28 @@ def _play_audio_preview(audio_path: Path) -> None:
 
     try:
         import sounddevice as sd
-        import numpy as np
-        import wave
     except Exception as exc:  # pragma: no cover - playback dependency missing
         console.print(f"[yellow]Audio preview unavailable ({exc}); continuing without playback.[/yellow]")
         return
 
     try:
-        with wave.open(str(audio_path), "rb") as wav_file:
-            sample_width = wav_file.getsampwidth()
-            if sample_width == 2:
-                dtype = np.int16
-            elif sample_width == 1:
-                dtype = np.uint8
-            else:
+        with WavFile(audio_path) as wav_file:
+            sample_width = wav_file.format.sample_width
+            if sample_width not in (1, 2):
                 console.print(
                     f"[yellow]Unsupported sample width ({sample_width} bytes) for preview: {audio_path.name}[/yellow]"
                 )
                 return
 
-            frames = wav_file.readframes(wav_file.getnframes())
-            if not frames:
+            if not wav_file.num_frames:
                 console.print(f"[yellow]No audio frames to preview in {audio_path.name}[/yellow]")
                 return
 
-            audio_array = np.frombuffer(frames, dtype=dtype)
-            channels = wav_file.getnchannels()
-            if channels > 1:
-                audio_array = audio_array.reshape(-1, channels)
+            audio_array = wav_file.samples()
+            if wav_file.format.channels == 1:
+                audio_array = audio_array.reshape(-1)
 
-            sd.play(audio_array, samplerate=wav_file.getframerate())
+            sd.play(audio_array, samplerate=wav_file.format.sample_rate)
             sd.wait()
     except Exception as exc:  # pragma: no cover - playback failure
         console.print(f"[yellow]Failed to play preview for {audio_path.name}: {exc}[/yellow]")
@@ -150,6 +153,114 @@ def _translate_single(
         raise typer.Exit(code=1)
 
 
+@dataclass
+class _BatchResult:
+    """Outcome of translating one batch file."""
+
+    path: Path
+    success: bool
+    error_details: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    wall_seconds: float = 0.0
+
+
+def _wav_duration_seconds(audio_path: Optional[Path]) -> Optional[float]:
+    """Length of a WAV file in seconds, or None if it cannot be determined."""
+    if audio_path is None or audio_path.suffix.lower() != ".wav":
+        return None
+    try:
+        with WavFile(audio_path) as wav_file:
+            return wav_file.duration_s
+    except (OSError, WavFormatError):
+        return None
+
+
+def _translate_batch_file(
+    file_path: Path,
+    *,
+    settings: SpeechServiceSettings,
+    from_language: str,
+    to_language: List[str],
+    voice: Optional[str],
+    preview_inputs: bool,
+    quiet: bool = False,
+) -> _BatchResult:
+    """Translate one batch file; the output (if any) is written next to it.
+
+    ``quiet`` silences the translator and input setup so concurrent files do not
+    interleave their progress output.
+    """
+    started = time.perf_counter()
+    per_file_output: Optional[Path] = None
+    if voice:
+        per_file_output = file_path.with_name(f"{file_path.stem}-translation.wav")
+
+    translator = create_translator(
+        settings,
+        from_language=from_language,
+        to_languages=to_language,
+        voice_name=voice,
+        output_audio_path=per_file_output,
+        terminate_on_completion=True,
+        quiet=quiet,
+    )
+
+    with build_audio_input(file_path, use_streaming_microphone=False, quiet=quiet) as audio_input:
+        audio_seconds = _wav_duration_seconds(audio_input.source_path)
+        if preview_inputs and audio_input.source_path:
+            console.print(
+                Panel.fit(
+                    f"Playing input preview for {audio_input.source_path}",
+                    title="Input preview",
+                    style="bold blue",
+                )
+            )
+            _play_audio_preview(audio_input.source_path)
+
+        outcome = translator.translate(audio_input)
+
+    return _BatchResult(
+        path=file_path,
+        success=outcome.success,
+        error_details=None if outcome.success else (outcome.error_details or "Translation failed."),
+        audio_seconds=audio_seconds,
+        wall_seconds=time.perf_counter() - started,
+    )
+
+
+def _print_batch_summary(results: List[_BatchResult], folder: Path, wall_seconds: float) -> None:
+    """Print per-file timings and overall throughput for a batch run."""
+    table = Table(title="Batch summary")
+    table.add_column("File")
+    table.add_column("Status")
+    table.add_column("Audio (s)", justify="right")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("x realtime", justify="right")
+
+    for result in results:
+        try:
+            name = str(result.path.relative_to(folder))
+        except ValueError:
+            name = result.path.name
+        audio = f"{result.audio_seconds:.1f}" if result.audio_seconds is not None else "-"
+        speed = (
+            f"{result.audio_seconds / result.wall_seconds:.2f}"
+            if result.audio_seconds is not None and result.wall_seconds > 0
+            else "-"
+        )
+        status = "[green]ok[/green]" if result.success else "[red]failed[/red]"
+        table.add_row(name, status, audio, f"{result.wall_seconds:.1f}", speed)
+
+    audio_total = sum(result.audio_seconds or 0.0 for result in results)
+    succeeded = sum(1 for result in results if result.success)
+    console.print(table)
+    console.print(
+        f"[bold cyan]{succeeded}/{len(results)} file(s) succeeded; "
+        f"{audio_total:.1f}s of audio in {wall_seconds:.1f}s wall "
+        f"({audio_total / wall_seconds if wall_seconds > 0 else 0.0:.2f} audio s per wall s).[/bold cyan]"
+    )
+
+
 def _translate_folder(
     *,
     folder: Path,
@@ -157,8 +268,18 @@ def _translate_folder(
     from_language: str,
     to_language: List[str],
     voice: Optional[str],
+    concurrency: int = 1,
 ) -> None:
-    """Run translations for each supported file inside a folder."""
+    """Run translations for each supported file inside a folder.
+
+    With concurrency > 1 up to that many files are translated at once on a thread
+    pool; each translator owns its own connection and event loop. Input previews
+    are skipped in that mode since playback would overlap, and translators run
+    quietly so only one status line per finished file is printed.
+    """
+    if concurrency < 1:
+        raise typer.BadParameter("--concurrency must be at least 1.")
+
     files = _discover_audio_files(folder)
     if not files:
         raise typer.BadParameter(
@@ -176,76 +297,98 @@ def _translate_folder(
     total = len(files)
     console.print(f"[bold green]Discovered {total} eligible audio file(s) under {folder}.[/bold green]")
 
-    failures: list[Tuple[Path, Optional[str]]] = []
     preview_inputs = raw_testing_limit is not None
+    if preview_inputs and concurrency > 1:
+        console.print("[yellow]Input previews are disabled when --concurrency is above 1.[/yellow]")
+        preview_inputs = False
 
-    for index, file_path in enumerate(files, start=1):
+    def relative(path: Path) -> Path:
         try:
-            relative_name = file_path.relative_to(folder)
+            return path.relative_to(folder)
         except ValueError:
-            relative_name = file_path.name
+            return Path(path.name)
 
-        console.rule(f"[bold magenta]Session {index}/{total}[/bold magenta] • {relative_name}")
-        console.print(
-            Panel.fit(
-                f"Starting batch translation for {file_path}",
-                title="Batch file",
-                style="bold cyan",
+    def run_file(file_path: Path) -> _BatchResult:
+        started = time.perf_counter()
+        try:
+            return _translate_batch_file(
+                file_path,
+                settings=settings,
+                from_language=from_language,
+                to_language=to_language,
+                voice=voice,
+                preview_inputs=preview_inputs,
+                quiet=concurrency > 1,
+            )
+        except NotImplementedError:
+            raise
+        except Exception as exc:  # one bad file must not abort the batch
+            return _BatchResult(
+                path=file_path,
+                success=False,
+                error_details=f"{type(exc).__name__}: {exc}",
+                wall_seconds=time.perf_counter() - started,
             )
-        )
-
-        per_file_output: Optional[Path] = None
-        if voice:
-            per_file_output = file_path.with_name(f"{file_path.stem}-translation.wav")
 
-        translator = create_translator(
-            settings,
-            from_language=from_language,
-            to_languages=to_language,
-            voice_name=voice,
-            output_audio_path=per_file_output,
-            terminate_on_completion=True,
-        )
+    results: dict[Path, _BatchResult] = {}
+    batch_started = time.perf_counter()
 
-        with build_audio_input(file_path, use_streaming_microphone=False) as audio_input:
-            if preview_inputs and audio_input.source_path:
+    try:
+        if concurrency == 1:
+            for index, file_path in enumerate(files, start=1):
+                console.rule(f"[bold magenta]Session {index}/{total}[/bold magenta] • {relative(file_path)}")
                 console.print(
                     Panel.fit(
-                        f"Playing input preview for {audio_input.source_path}",
-                        title="Input preview",
-                        style="bold blue",
+                        f"Starting batch translation for {file_path}",
+                        title="Batch file",
+                        style="bold cyan",
                     )
                 )
-                _play_audio_preview(audio_input.source_path)
-
-            try:
-                outcome = translator.translate(audio_input)
-            except NotImplementedError as exc:
-                console.print(f"[bold red]{exc}[/bold red]")
-                raise typer.Exit(code=3) from exc
-
-        if outcome.success:
-            console.print(
-                Panel.fit(
-                    "Translation completed successfully.",
-                    title="Batch file",
-                    style="bold green",
-                )
-            )
+                result = results[file_path] = run_file(file_path)
+                if result.success:
+                    console.print(
+                        Panel.fit(
+                            "Translation completed successfully.",
+                            title="Batch file",
+                            style="bold green",
+                        )
+                    )
+                else:
+                    console.print(
+                        Panel.fit(
+                            result.error_details or "Translation failed.",
+                            title="Batch failure",
+                            style="bold red",
+                        )
+                    )
         else:
-            message = outcome.error_details or "Translation failed."
-            console.print(
-                Panel.fit(
-                    message,
-                    title="Batch failure",
-                    style="bold red",
-                )
-            )
-            failures.append((file_path, outcome.error_details))
-
+            console.print(f"[bold cyan]Translating with up to {concurrency} concurrent session(s).[/bold cyan]")
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch") as executor:
+                futures = {executor.submit(run_file, file_path): file_path for file_path in files}
+                try:
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        file_path = futures[future]
+                        result = results[file_path] = future.result()
+                        status = "[green]ok[/green]" if result.success else f"[red]failed[/red] ({result.error_details})"
+                        console.print(
+                            f"[bold magenta][{done}/{total}][/bold magenta] {relative(file_path)}: "
+                            f"{status} in {result.wall_seconds:.1f}s"
+                        )
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+    except NotImplementedError as exc:
+        console.print(f"[bold red]{exc}[/bold red]")
+        raise typer.Exit(code=3) from exc
+
+    # Report in discovery order regardless of completion order
+    ordered = [results[file_path] for file_path in files if file_path in results]
+    _print_batch_summary(ordered, folder, time.perf_counter() - batch_started)
+
+    failures = [result for result in ordered if not result.success]
     if failures:
         summary_lines = [
-            f"{path}: {details or 'No details provided'}" for path, details in failures
+            f"{result.path}: {result.error_details or 'No details provided'}" for result in failures
         ]
         console.print(
             Panel.fit(
@@ -277,7 +420,7 @@ def main_callback(
         file_okay=False,
         dir_okay=True,
         readable=True,
-        help="Directory containing audio files (.wav, .m4a) to translate sequentially.",
+        help="Directory containing audio files (.wav, .m4a) to translate in batch.",
     ),
     from_language: str = typer.Option(
         "en-US",
@@ -310,6 +453,13 @@ def main_callback(
         "--dotenv-path",
         help="Optional path to a .env file containing Azure Speech credentials.",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of --input-folder files to translate at once.",
+    ),
 ) -> None:
     """
     Translate speech from microphone or audio file using Azure's Live Interpreter preview or Voice Live.
@@ -347,6 +497,7 @@ def main_callback(
             from_language=from_language,
             to_language=to_language,
             voice=voice,
+            concurrency=concurrency,
         )
         return
 
@@ -379,7 +530,7 @@ def translate(  # noqa: D401 - typer generates help text
         file_okay=False,
         dir_okay=True,
         readable=True,
-        help="Directory containing audio files (.wav, .m4a) to translate sequentially.",
+        help="Directory containing audio files (.wav, .m4a) to translate in batch.",
     ),
     from_language: str = typer.Option(
         "en-US",
@@ -412,6 +563,13 @@ def translate(  # noqa: D401 - typer generates help text
         "--dotenv-path",
         help="Optional path to a .env file containing Azure Speech credentials.",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of --input-folder files to translate at once.",
+    ),
 ) -> None:
     """
     Translate speech from microphone or audio file using Azure's Live Interpreter preview or Voice Live.
@@ -449,6 +607,7 @@ def translate(  # noqa: D401 - typer generates help text
             from_language=from_language,
             to_language=to_language,
             voice=voice,
+            concurrency=concurrency,
         )
         return
 
@@ -509,6 +668,97 @@ def serve(  # noqa: D401 - typer generates help text
         "--testing",
         help="Enable testing mode: sends recognized text transcript back via WebSocket.",
     ),
+    outbound_high_watermark: int = typer.Option(
+        DEFAULT_HIGH_WATERMARK,
+        "--outbound-high-watermark",
+        min=1,
+        help="Per-session outbound queue depth (messages) at which droppable events start being shed.",
+    ),
+    outbound_low_watermark: int = typer.Option(
+        DEFAULT_LOW_WATERMARK,
+        "--outbound-low-watermark",
+        min=0,
+        help="Outbound queue depth (messages) below which shedding stops.",
+    ),
+    outbound_drop_policy: OutboundDropPolicy = typer.Option(
+        OutboundDropPolicy.TEXT.value,
+        "--outbound-drop-policy",
+        case_sensitive=False,
+        help="Messages that may be shed above the high watermark: 'text' (text deltas) or 'none'. Audio is never shed.",
+    ),
+    chunk_duration_ms: int = typer.Option(
+        DEFAULT_CHUNK_DURATION_MS,
+        "--chunk-duration-ms",
+        min=10,
+        max=1000,
+        help="Duration of the audio chunks fed to the translator. Clients can override it per connection with ?chunk_ms=<n>.",
+    ),
+    ack_policy: AckPolicy = typer.Option(
+        DEFAULT_ACK_POLICY.value,
+        "--ack-policy",
+        case_sensitive=False,
+        help="Which inbound audio frames are acknowledged: 'none', 'every' (every N frames), 'interval' or 'gaps' (sequence gaps only).",
+    ),
+    ack_every: int = typer.Option(
+        DEFAULT_ACK_EVERY,
+        "--ack-every",
+        min=1,
+        help="Frames between acknowledgements with --ack-policy every (1 acks every frame).",
+    ),
+    ack_interval_ms: int = typer.Option(
+        DEFAULT_ACK_INTERVAL_MS,
+        "--ack-interval-ms",
+        min=1,
+        help="Minimum time between acknowledgements with --ack-policy interval.",
+    ),
+    audio_delta_mode: AudioDeltaMode = typer.Option(
+        AudioDeltaMode.COALESCED.value,
+        "--audio-delta-mode",
+        case_sensitive=False,
+        help="How translated audio is forwarded to the client: 'coalesced' (~--audio-delta-coalesce-ms blocks), 'delta' (each Voice Live delta) or 'response' (once per completed response).",
+    ),
+    audio_delta_coalesce_ms: int = typer.Option(
+        DEFAULT_AUDIO_DELTA_COALESCE_MS,
+        "--audio-delta-coalesce-ms",
+        min=10,
+        max=1000,
+        help="Block size for --audio-delta-mode coalesced.",
+    ),
+    session_history_turns: int = typer.Option(
+        DEFAULT_SESSION_HISTORY_TURNS,
+        "--session-history-turns",
+        min=0,
+        help="Turns each session keeps for its end-of-stream summary; older turns are released once delivered.",
+    ),
+    voice_live_pool_size: int = typer.Option(
+        DEFAULT_POOL_SIZE,
+        "--voice-live-pool-size",
+        min=0,
+        help="Pre-connected, pre-configured Voice Live sessions kept ready for new calls (0 disables the pool).",
+    ),
+    voice_live_pool_idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT_S,
+        "--voice-live-pool-idle-timeout",
+        min=1,
+        help="Seconds a warm Voice Live session may sit unused before it is replaced.",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Number of server processes sharing the port (SO_REUSEPORT). Send SIGHUP to the supervisor to restart them one at a time.",
+    ),
+    health_port: int = typer.Option(
+        DEFAULT_HEALTH_PORT,
+        "--health-port",
+        help="Port for the aggregated /health endpoint when --workers is above 1.",
+    ),
+    graceful_timeout: float = typer.Option(
+        DEFAULT_GRACEFUL_TIMEOUT_S,
+        "--graceful-timeout",
+        min=0,
+        help="Seconds a stopping worker waits for active calls to finish.",
+    ),
     dotenv_path: Optional[Path] = typer.Option(
         None,
         "--dotenv-path",
@@ -528,14 +778,16 @@ def serve(  # noqa: D401 - typer generates help text
     if not to_language:
         raise typer.BadParameter("Please specify at least one --to-language.")
 
+    if outbound_low_watermark >= outbound_high_watermark:
+        raise typer.BadParameter("--outbound-low-watermark must be below --outbound-high-watermark.")
+
     try:
         settings = SpeechServiceSettings.from_env(dotenv_path=str(dotenv_path) if dotenv_path else None)
     except RuntimeError as exc:  # pragma: no cover - runtime configuration loading
         print(exc)
         raise typer.Exit(code=2) from exc
 
-    server = WebSocketServer(
-        settings,
+    server_options = dict(
         host=host,
         port=port,
         from_language=from_language,
@@ -544,8 +796,36 @@ def serve(  # noqa: D401 - typer generates help text
         play_input_audio=play_input,
         play_azure_audio=play_azure,
         testing_mode=testing,
+        outbound_high_watermark=outbound_high_watermark,
+        outbound_low_watermark=outbound_low_watermark,
+        outbound_drop_policy=outbound_drop_policy,
+        chunk_duration_ms=chunk_duration_ms,
+        ack_policy=ack_policy,
+        ack_every=ack_every,
+        ack_interval_ms=ack_interval_ms,
+        audio_delta_mode=audio_delta_mode,
+        audio_delta_coalesce_ms=audio_delta_coalesce_ms,
+        session_history_turns=session_history_turns,
+        voice_live_pool_size=voice_live_pool_size,
+        voice_live_pool_idle_timeout_s=voice_live_pool_idle_timeout,
     )
 
+    if workers > 1:
+        try:
+            supervisor = WorkerSupervisor(
+                settings,
+                server_options,
+                workers=workers,
+                health_port=health_port,
+                graceful_timeout=graceful_timeout,
+            )
+        except RuntimeError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        supervisor.run()
+        return
+
+    server = WebSocketServer(settings, **server_options)
+
     try:
         asyncio.run(server.start())
     except KeyboardInterrupt:
@@ -0,0 +1,263 @@
+"""Content-addressed cache for compressed audio converted to WAV.
+
+Converting an M4A/AAC clip means spawning ffmpeg, which dominated repeated batch
+runs over the same corpus. Conversions are now stored under a key made of the
+SHA-256 of the source bytes plus the target format, so an unchanged file is never
+converted twice, copies of a clip under different names share one entry, and two
+files that share a stem no longer overwrite each other.
+
+* Writes are atomic: the decoder writes a temporary file in the cache directory
+  and it is renamed into place, so readers never see a partial WAV.
+* Concurrent runs (threads or processes) converting the same clip serialise on a
+  per-entry lock file where `fcntl` is available; the loser reuses the winner's
+  output. Without locking the worst case is a duplicate conversion.
+* Cache hits refresh the entry's mtime, and after every conversion the oldest
+  entries are evicted until the directory fits in `max_bytes`.
+* When PyAV (`av`) is installed the clip is decoded in-process instead of through
+  an ffmpeg subprocess. Set `AUDIO_DECODER=ffmpeg` to force the subprocess.
+
+Environment: `AUDIO_CACHE_DIR` (default `samples/converted`), `AUDIO_CACHE_MAX_MB`
+(default 2048), `AUDIO_DECODER` (`auto`, `pyav` or `ffmpeg`) and `FFMPEG_PATH`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+import wave
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import av
+except Exception:  # pragma: no cover - optional in-process decoder
+    av = None
+
+console = Console()
+
+DEFAULT_CACHE_MAX_MB = 2048
+HASH_BLOCK_BYTES = 1 << 20
+# Bump when the conversion output changes so stale entries are not reused
+CONVERTER_VERSION = 1
+
+
+class ConversionCache:
+    """Directory of converted WAV files keyed by source content and target format."""
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (path, size, mtime_ns) -> digest, so a run hashes each source once
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+    @classmethod
+    def from_env(cls) -> "ConversionCache":
+        project_root = Path(__file__).resolve().parents[2]
+        directory = Path(os.getenv("AUDIO_CACHE_DIR") or project_root / "samples" / "converted")
+        raw_max_mb = os.getenv("AUDIO_CACHE_MAX_MB", "").strip()
+        max_mb = DEFAULT_CACHE_MAX_MB
+        if raw_max_mb:
+            try:
+                max_mb = int(raw_max_mb)
+            except ValueError:
+                max_mb = -1
+            if max_mb < 0:
+                raise RuntimeError(
+                    f"Invalid value for AUDIO_CACHE_MAX_MB: {raw_max_mb} (expected a non-negative number of megabytes)"
+                )
+        return cls(directory, max_bytes=max_mb * 1024 * 1024)
+
+    def entry_path(self, source_path: Path, *, sample_rate: int, channels: int) -> Path:
+        digest = self._digest(source_path)[:16]
+        return self.directory / f"{digest}-{sample_rate}hz-{channels}ch-v{CONVERTER_VERSION}.wav"
+
+    def get_or_convert(
+        self, source_path: Path, *, sample_rate: int, channels: int, quiet: bool = False
+    ) -> Path:
+        """Return a cached WAV for `source_path`, converting it on a miss."""
+        out = Console(quiet=True) if quiet else console
+        target_path = self.entry_path(source_path, sample_rate=sample_rate, channels=channels)
+        if self._touch(target_path):
+            out.print(f"[dim]Reusing cached conversion: {target_path}[/dim]")
+            return target_path
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._entry_lock(target_path):
+            # Another run may have produced it while we waited for the lock
+            if self._touch(target_path):
+                return target_path
+            fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", suffix=".wav", dir=self.directory)
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            try:
+                _decode_to_wav(source_path, tmp_path, sample_rate=sample_rate, channels=channels)
+                os.replace(tmp_path, target_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+        out.print(f"[bold blue]Converted audio cached at:[/bold blue] {target_path}")
+        self.evict(keep=target_path)
+        return target_path
+
+    def evict(self, *, keep: Optional[Path] = None) -> int:
+        """Delete least recently used entries until the cache fits; return bytes freed."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.wav"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        freed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total - freed <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            # Worst case a concurrent converter of this entry duplicates work
+            path.with_name(f".{path.name}.lock").unlink(missing_ok=True)
+            freed += size
+        return freed
+
+    def _digest(self, source_path: Path) -> str:
+        stat = source_path.stat()
+        memo_key = (str(source_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with source_path.open("rb") as source:
+                while block := source.read(HASH_BLOCK_BYTES):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+            with self._lock:
+                self._digests[memo_key] = digest
+        return digest
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """Mark an entry as recently used; False if it does not exist."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _entry_lock(self, target_path: Path) -> "_FileLock":
+        return _FileLock(target_path.with_name(f".{target_path.name}.lock"))
+
+
+class _FileLock:
+    """Exclusive advisory lock on a side file; a no-op where fcntl is unavailable."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "_FileLock":
+        if fcntl is not None:
+            self._file = self.path.open("a+b")
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+def _decode_to_wav(source_path: Path, target_path: Path, *, sample_rate: int, channels: int) -> None:
+    decoder = os.getenv("AUDIO_DECODER", "auto").strip().lower()
+    if decoder == "pyav" and av is None:
+        raise RuntimeError("AUDIO_DECODER=pyav requires PyAV. Install it with: pip install av")
+    if av is not None and decoder in {"auto", "pyav"}:
+        _decode_with_pyav(source_path, target_path, sample_rate=sample_rate, channels=channels)
+    else:
+        _decode_with_ffmpeg(source_path, target_path, sample_rate=sample_rate, channels=channels)
+
+
+def _decode_with_pyav(source_path: Path, target_path: Path, *, sample_rate: int, channels: int) -> None:
+    """Decode and resample in-process to 16-bit PCM WAV."""
+    resampler = av.AudioResampler(
+        format="s16",
+        layout="mono" if channels == 1 else "stereo",
+        rate=sample_rate,
+    )
+    try:
+        with av.open(str(source_path)) as container, wave.open(str(target_path), "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    wav_file.writeframes(resampled.to_ndarray().tobytes())
+            for resampled in resampler.resample(None):
+                wav_file.writeframes(resampled.to_ndarray().tobytes())
+    except av.error.FFmpegError as exc:
+        raise RuntimeError(f"PyAV failed to convert {source_path.name}: {exc}") from exc
+
+
+def _decode_with_ffmpeg(source_path: Path, target_path: Path, *, sample_rate: int, channels: int) -> None:
+    ffmpeg_path = os.getenv("FFMPEG_PATH", "ffmpeg")
+
+    command = [
+        ffmpeg_path,
+        "-y",
+        "-i",
+        str(source_path),
+        "-ac",
+        str(channels),
+        "-ar",
+        str(sample_rate),
+        "-sample_fmt",
+        "s16",
+        "-f",
+        "wav",
+        str(target_path),
+    ]
+
+    try:
+        subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError(
+            "ffmpeg not found. Install ffmpeg or set the FFMPEG_PATH environment variable."
+        ) from exc
+    except subprocess.CalledProcessError as exc:
+        stderr = exc.stderr.decode("utf-8", errors="ignore").strip()
+        raise RuntimeError(f"ffmpeg failed to convert {source_path.name}: {stderr}") from exc
+
+
+_default_cache: Optional[ConversionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_conversion_cache() -> ConversionCache:
+    """Process-wide cache configured from the environment."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ConversionCache.from_env()
+        return _default_cache
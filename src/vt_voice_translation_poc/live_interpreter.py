@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import threading
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable, Optional
 
 import azure.cognitiveservices.speech as speechsdk
@@ -13,12 +18,144 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .audio import AudioInput
+from .audio import STOP_CHECK_INTERVAL_S, AudioInput
 from .config import SpeechServiceSettings
 from .models import TranslationOutcome
 
 console = Console()
 
+# Default neural voice per target language, built once at import
+_DEFAULT_VOICES = MappingProxyType({
+    "es": "es-ES-ElviraNeural",  # Spanish (Spain)
+    "es-ES": "es-ES-ElviraNeural",
+    "es-MX": "es-MX-DaliaNeural",  # Spanish (Mexico)
+    "fr": "fr-FR-DeniseNeural",  # French
+    "fr-FR": "fr-FR-DeniseNeural",
+    "de": "de-DE-KatjaNeural",  # German
+    "de-DE": "de-DE-KatjaNeural",
+    "en": "en-US-JennyNeural",  # English
+    "en-US": "en-US-JennyNeural",
+    "it": "it-IT-ElsaNeural",  # Italian
+    "it-IT": "it-IT-ElsaNeural",
+    "pt": "pt-BR-FranciscaNeural",  # Portuguese
+    "pt-BR": "pt-BR-FranciscaNeural",
+})
+
+
+def default_voice_for_language(language: str) -> str:
+    """Get a default neural voice for the target language."""
+    return _DEFAULT_VOICES.get(language) or f"{language}-JennyNeural"  # Fallback pattern
+
+
+@lru_cache(maxsize=16)
+def _translation_configs(
+    settings: SpeechServiceSettings,
+    supported_languages: tuple[str, ...],
+    voice_name: Optional[str],
+) -> tuple[
+    speechsdk.translation.SpeechTranslationConfig,
+    Optional[speechsdk.languageconfig.AutoDetectSourceLanguageConfig],
+    tuple[str, ...],
+]:
+    """Build translation config with optional automatic language detection.
+
+    Recognizers copy their configuration when they are created, so the result is
+    shared by every session with the same settings, languages and voice (server
+    calls and batch files alike) instead of being rebuilt per call. Nothing is
+    printed here, since a cache miss happens in whichever session comes first;
+    the returned notes are printed by the caller's console.
+    """
+    notes: list[str] = []
+    # Try to use from_endpoint if available (newer SDK versions)
+    # Otherwise fall back to standard constructor with subscription and region
+    try:
+        config = speechsdk.translation.SpeechTranslationConfig(
+            speech_key=settings.subscription_key,
+            endpoint=settings.endpoint,
+        )
+    except Exception as exc:
+        # Fall back to standard constructor if from_endpoint fails
+        notes.append(f"[bold red]Exception building translation config from endpoint: {exc}[/bold red]")
+        config = speechsdk.translation.SpeechTranslationConfig(
+            subscription=settings.subscription_key,
+            region=settings.service_region,
+        )
+    
+    config.set_property(
+        property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
+        value="Continuous"
+    )
+            
+    auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+        languages=supported_languages
+    )
+    notes.append(f"[bold cyan]Auto language detection enabled for: {', '.join(supported_languages)}[/bold cyan]")
+
+    # Add target languages
+    # For bidirectional translation, add both languages as targets
+    target_languages_to_add = list(supported_languages)
+    
+    for lang in supported_languages:
+        # Use full locale code (e.g., "en-US", "es-ES") for consistency
+        # Check if this language (by base code) is already in the target list
+        lang_base = lang.split("-")[0].lower()
+        already_added = any(
+            (l.split("-")[0].lower() if "-" in l else l.lower()) == lang_base
+            for l in target_languages_to_add
+        )
+        if not already_added:
+            target_languages_to_add.append(lang)
+            notes.append(f"[dim]Added {lang} as target language for bidirectional translation[/dim]")
+    
+    notes.append(f"[dim]Target languages: {target_languages_to_add}[/dim]")
+    for language in target_languages_to_add:
+        config.add_target_language(language)
+
+    # Voice selection for bidirectional translation
+    # Note: Azure SDK only supports one voice_name, so for bidirectional we use a default
+    # The voice will match one direction; the other direction will use Azure's default
+    
+    # For bidirectional, don't set voice_name - let Azure use default
+    # Or use the primary target language's voice
+    if not voice_name:
+        # Use the original target language's voice as default
+        primary_target = supported_languages[0]
+        default_voice = default_voice_for_language(primary_target)
+        config.voice_name = default_voice
+        notes.append(
+            f"[dim]Auto-selected voice for bidirectional translation: {default_voice} "
+            f"(primary target: {primary_target})[/dim]"
+        )
+    else:
+        config.voice_name = voice_name
+
+    return config, auto_detect_config, tuple(notes)
+
+
+
+@dataclass
+class _RecognitionSession:
+    """Results accumulated by SDK callbacks during one recognition session."""
+
+    recognizer: speechsdk.translation.TranslationRecognizer
+    # Per-turn history for the final outcome; bounded when the translator has a
+    # history_turns limit
+    all_translations: dict[str, deque[str]]
+    all_recognized_text: deque[str]
+    # Synthesized audio of completed turns, and of the turn being synthesized
+    synthesized_turns: deque[bytes]
+    synthesized_chunks: list[bytes] = field(default_factory=list)
+    final_reason: speechsdk.ResultReason = speechsdk.ResultReason.NoMatch
+    error_details: Optional[str] = None
+    recognition_done: threading.Event = field(default_factory=threading.Event)
+    on_done: Optional[Callable[[], None]] = None
+
+    def mark_done(self) -> None:
+        """Signal completion to both blocking and async waiters."""
+        self.recognition_done.set()
+        if self.on_done is not None:
+            self.on_done()
+
 
 class LiveInterpreterTranslator:
     """High-level orchestrator for running a single translation session via Live Interpreter."""
@@ -28,118 +165,55 @@ class LiveInterpreterTranslator:
         settings: SpeechServiceSettings,
         voice_name: Optional[str] = None,
         output_audio_path: Optional[Path] = None,
+        history_turns: Optional[int] = None,
+        quiet: bool = False,
     ) -> None:
+        # Quiet translators drop their progress output (concurrent batch runs)
+        self.console = Console(quiet=True) if quiet else console
         self.settings = settings
         self.supported_languages = ("en-US", "es-ES")
         self.voice_name = voice_name
         self.output_audio_path = output_audio_path
+        # None keeps every turn for the final outcome; a number keeps only the most
+        # recent turns (streaming sessions deliver results through on_event)
+        if history_turns is not None and history_turns < 0:
+            raise ValueError(f"History turns must not be negative (got {history_turns}).")
+        self.history_turns = history_turns
 
         if self.voice_name:
-            console.print(
+            self.console.print(
                 "[yellow]Voice synthesis will use a single voice while translating "
                 "bidirectionally between English and Spanish.[/yellow]"
             )
 
-    def _get_default_voice_for_language(self, language: str) -> str:
-        """Get a default neural voice for the target language."""
-        # Map common language codes to default neural voices
-        voice_map = {
-            "es": "es-ES-ElviraNeural",  # Spanish (Spain)
-            "es-ES": "es-ES-ElviraNeural",
-            "es-MX": "es-MX-DaliaNeural",  # Spanish (Mexico)
-            "fr": "fr-FR-DeniseNeural",  # French
-            "fr-FR": "fr-FR-DeniseNeural",
-            "de": "de-DE-KatjaNeural",  # German
-            "de-DE": "de-DE-KatjaNeural",
-            "en": "en-US-JennyNeural",  # English
-            "en-US": "en-US-JennyNeural",
-            "it": "it-IT-ElsaNeural",  # Italian
-            "it-IT": "it-IT-ElsaNeural",
-            "pt": "pt-BR-FranciscaNeural",  # Portuguese
-            "pt-BR": "pt-BR-FranciscaNeural",
-        }
-        return voice_map.get(language, f"{language}-JennyNeural")  # Fallback pattern
-
     def _build_translation_config(
         self, 
     ) -> tuple[speechsdk.translation.SpeechTranslationConfig, Optional[speechsdk.languageconfig.AutoDetectSourceLanguageConfig]]:
-        """Build translation config with optional automatic language detection.
+        """Return the (cached) translation config with automatic language detection.
         
         Returns:
             Tuple of (translation_config, auto_detect_config)
             auto_detect_config is None if auto-detect is disabled
         """
-        # Try to use from_endpoint if available (newer SDK versions)
-        # Otherwise fall back to standard constructor with subscription and region
-        try:
-            config = speechsdk.translation.SpeechTranslationConfig(
-                speech_key=self.settings.subscription_key,
-                endpoint=self.settings.endpoint,
-            )
-        except Exception:
-            # Fall back to standard constructor if from_endpoint fails
-            # print in red bold
-            console.print(f"[bold red]Exception building translation config from endpoint: {Exception}[/bold red]")
-            config = speechsdk.translation.SpeechTranslationConfig(
-                subscription=self.settings.subscription_key,
-                region=self.settings.service_region,
-            )
-        
-        config.set_property(
-            property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
-            value="Continuous"
-        )
-                
-        auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-            languages=self.supported_languages
-        )
-        console.print(
-            f"[bold cyan]Auto language detection enabled for: {', '.join(self.supported_languages)}[/bold cyan]"
+        config, auto_detect_config, notes = _translation_configs(
+            self.settings, self.supported_languages, self.voice_name
         )
+        for note in notes:
+            self.console.print(note)
+        return config, auto_detect_config
 
-        # Add target languages
-        # For bidirectional translation, add both languages as targets
-        target_languages_to_add = list(self.supported_languages)
-        
-        for lang in self.supported_languages:
-            # Use full locale code (e.g., "en-US", "es-ES") for consistency
-            # Check if this language (by base code) is already in the target list
-            lang_base = lang.split("-")[0].lower()
-            already_added = any(
-                (l.split("-")[0].lower() if "-" in l else l.lower()) == lang_base
-                for l in target_languages_to_add
-            )
-            if not already_added:
-                target_languages_to_add.append(lang)
-                console.print(
-                    f"[dim]Added {lang} as target language for bidirectional translation[/dim]"
-                )
-        
-        console.print(
-            f"[dim]Target languages: {target_languages_to_add}[/dim]"
+    def _create_recognizer(
+        self,
+        audio_config: speechsdk.audio.AudioConfig,
+        translation_config: speechsdk.translation.SpeechTranslationConfig,
+        auto_detect_config: Optional[speechsdk.languageconfig.AutoDetectSourceLanguageConfig],
+    ) -> speechsdk.translation.TranslationRecognizer:
+        """Build a recognizer for one session on top of the shared, immutable configs."""
+        return speechsdk.translation.TranslationRecognizer(
+            translation_config=translation_config,
+            audio_config=audio_config,
+            auto_detect_source_language_config=auto_detect_config,
         )
-        for language in target_languages_to_add:
-            config.add_target_language(language)
-
-        # Voice selection for bidirectional translation
-        # Note: Azure SDK only supports one voice_name, so for bidirectional we use a default
-        # The voice will match one direction; the other direction will use Azure's default
-        
-        # For bidirectional, don't set voice_name - let Azure use default
-        # Or use the primary target language's voice
-        if not self.voice_name:
-            # Use the original target language's voice as default
-            primary_target = self.supported_languages[0]
-            default_voice = self._get_default_voice_for_language(primary_target)
-            config.voice_name = default_voice
-            console.print(
-                f"[dim]Auto-selected voice for bidirectional translation: {default_voice} "
-                f"(primary target: {primary_target})[/dim]"
-            )
-        else:
-            config.voice_name = self.voice_name
-
-        return config, auto_detect_config
 
     def translate(
         self,
@@ -147,37 +221,111 @@ class LiveInterpreterTranslator:
         on_event: Optional[Callable[[dict], None]] = None,
     ) -> TranslationOutcome:
         """Run continuous streaming translation with automatic language detection for bidirectional pairs."""
-        console.print(
-            f"[bold cyan]Auto-detecting {', '.join(self.supported_languages)}[/bold cyan]"
-        )
+        session = self._start_recognition(audio_input, on_event)
+        recognizer = session.recognizer
 
-        speech_config = speechsdk.SpeechConfig(
-            subscription=self.settings.subscription_key,
-            region=self.settings.service_region,
-        )
+        # Start continuous recognition
+        recognizer.start_continuous_recognition()
 
-        # 1) Set continuous language ID BEFORE creating the recognizer
-        speech_config.set_property(
-            property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
-            value="Continuous"
+        # Wait for recognition to complete (either end of stream or error)
+        # Check for stop signal from audio_input if it's a stream
+        try:
+            while not session.recognition_done.is_set():
+                if audio_input._stop_capture and audio_input._stop_capture.is_set():
+                    # End of stream signaled, stop recognition gracefully
+                    recognizer.stop_continuous_recognition_async().get()
+                    break
+                session.recognition_done.wait(timeout=0.1)
+        except KeyboardInterrupt:
+            self.console.print("[yellow]Interrupted by user[/yellow]")
+            recognizer.stop_continuous_recognition_async().get()
+        finally:
+            # Ensure recognition is stopped
+            try:
+                recognizer.stop_continuous_recognition_async().get()
+            except Exception:
+                pass
+
+        return self._build_outcome(session)
+
+    async def translate_async(
+        self,
+        audio_input: AudioInput,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> TranslationOutcome:
+        """Run the same session as translate() without tying up a thread while waiting.
+
+        The SDK drives recognition on its own native threads; this coroutine only
+        waits for the session to finish, so the calling loop stays free for other calls.
+        Note that on_event is still invoked from SDK threads.
+        """
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+
+        def _notify_done() -> None:
+            # Called from SDK threads; the loop may already be gone at shutdown
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(done.set)
+
+        session = self._start_recognition(audio_input, on_event, on_done=_notify_done)
+        recognizer = session.recognizer
+
+        # The async variant returns immediately; failures surface via the canceled event
+        recognizer.start_continuous_recognition_async()
+
+        # Wake on session end or on audio_input.close(); the timeout only bounds how
+        # long a bare _stop_capture.set() goes unnoticed
+        done_waiter = asyncio.ensure_future(done.wait())
+        closed_waiter = asyncio.ensure_future(audio_input._audio_queue.wait_closed())
+        try:
+            while not done.is_set():
+                if audio_input._stop_capture and audio_input._stop_capture.is_set():
+                    break
+                await asyncio.wait(
+                    {done_waiter, closed_waiter},
+                    timeout=STOP_CHECK_INTERVAL_S,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if closed_waiter.done():
+                    break
+        finally:
+            done_waiter.cancel()
+            closed_waiter.cancel()
+            # Stopping blocks until the SDK flushes the session, so wait off-loop
+            try:
+                stop_future = recognizer.stop_continuous_recognition_async()
+                await loop.run_in_executor(None, stop_future.get)
+            except Exception:
+                pass
+
+        return self._build_outcome(session)
+
+    def _start_recognition(
+        self,
+        audio_input: AudioInput,
+        on_event: Optional[Callable[[dict], None]],
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> _RecognitionSession:
+        """Build the recognizer and wire SDK event handlers into a fresh session state."""
+        self.console.print(
+            f"[bold cyan]Auto-detecting {', '.join(self.supported_languages)}[/bold cyan]"
         )
-        
+
+        # Continuous language ID is set on the shared translation config; the
+        # handlers below also read it for the detected language and the voice
         translation_config, auto_detect_config = self._build_translation_config()
 
         # Create recognizer with auto-detect
-        recognizer = speechsdk.translation.TranslationRecognizer(
-            translation_config=translation_config,
-            audio_config=audio_input.config,
-            auto_detect_source_language_config=auto_detect_config,
-        )
+        recognizer = self._create_recognizer(audio_input.config, translation_config, auto_detect_config)
 
         # Accumulated results for final outcome
-        all_recognized_text: list[str] = []
-        all_translations: dict[str, list[str]] = {lang: [] for lang in self.supported_languages}
-        synthesized_chunks: list[bytes] = []
-        final_reason = speechsdk.ResultReason.NoMatch
-        error_details: Optional[str] = None
-        recognition_done = threading.Event()
+        session = _RecognitionSession(
+            recognizer=recognizer,
+            all_translations={lang: deque(maxlen=self.history_turns) for lang in self.supported_languages},
+            all_recognized_text=deque(maxlen=self.history_turns),
+            synthesized_turns=deque(maxlen=self.history_turns),
+            on_done=on_done,
+        )
         
         # Track previous recognized text to calculate deltas
         previous_recognized_text = ""
@@ -193,7 +341,7 @@ class LiveInterpreterTranslator:
         #         # Find the translation that's different from recognized text
         #         current_translation = None
         #         for lang, translation in evt.result.translations.items():
-        #             console.print(f"[dim] _on_recognizing {lang}: {translation[:50]}...[/dim]")
+        #             self.console.print(f"[dim] _on_recognizing {lang}: {translation[:50]}...[/dim]")
         #             if translation.strip().lower() != evt.result.text.strip().lower():
         #                 current_translation = translation
         #                 break
@@ -238,7 +386,7 @@ class LiveInterpreterTranslator:
         # This fires when Azure SDK's built-in VAD detects a complete utterance
         # (similar to Voice Live's server-side VAD commits)
         def _on_recognized(evt: speechsdk.translation.TranslationRecognitionEventArgs) -> None:
-            nonlocal final_reason, previous_recognized_text, previous_translation_text
+            nonlocal previous_recognized_text, previous_translation_text
             # Reset previous text when a new utterance is recognized (new turn)
             previous_recognized_text = ""
             previous_translation_text = ""
@@ -251,23 +399,23 @@ class LiveInterpreterTranslator:
                 if auto_detect_config:
                     # Direct property access (as shown in Microsoft docs for translation)
                     if hasattr(evt.result, 'properties') and evt.result.properties:
-                        console.print(f"[bold green]Properties: {evt.result.properties}[/bold green]")
+                        self.console.print(f"[bold green]Properties: {evt.result.properties}[/bold green]")
                         detected_language = evt.result.properties.get(
                             speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult
                         )
                 
                 if evt.result.text:
-                    all_recognized_text.append(evt.result.text)
+                    session.all_recognized_text.append(evt.result.text)
                     if detected_language:
-                        console.print(f"[bold green]Detected source language: {detected_language}[/bold green]")
+                        self.console.print(f"[bold green]Detected source language: {detected_language}[/bold green]")
                 
                 if evt.result.translations:
                     # Debug: log all available translations
-                    console.print(
+                    self.console.print(
                         f"[dim]Available translations: {list(evt.result.translations.keys())}[/dim]"
                     )
                     for lang, trans in evt.result.translations.items():
-                        console.print(f"[dim]  {lang}: {trans[:50]}...[/dim]")
+                        self.console.print(f"[dim]  {lang}: {trans[:50]}...[/dim]")
                     
                     # For bidirectional translation, emit only the translation for the opposite language
                     # If English was detected, emit Spanish translation, and vice versa
@@ -293,7 +441,7 @@ class LiveInterpreterTranslator:
                             # Skip if this translation is for the same language as the detected source
                             # This handles cases where Azure returns the source text as a "translation"
                             if lang_base == detected_base:
-                                console.print(
+                                self.console.print(
                                     f"[yellow]Skipping translation for {lang} (matches detected source {detected_language})[/yellow]"
                                 )
                                 continue
@@ -305,7 +453,7 @@ class LiveInterpreterTranslator:
                                 if translation.strip().lower() != evt.result.text.strip().lower():
                                     target_translation = translation
                                     target_lang = lang  # Use full language code from result
-                                    console.print(
+                                    self.console.print(
                                         f"[green]Selected translation for {target_lang}: {target_translation[:50]}...[/green]"
                                     )
                                     on_event({
@@ -314,13 +462,13 @@ class LiveInterpreterTranslator:
                                     })
                                     break
                                 else:
-                                    console.print(
+                                    self.console.print(
                                         f"[yellow]Skipping {lang} translation (same as recognized text, likely no-op)[/yellow]"
                                     )
                         
                         if not target_translation:
                             # Fallback: try to find any translation that's not the source language
-                            console.print(
+                            self.console.print(
                                 f"[yellow]No translation found for target language '{target_lang}', "
                                 f"trying fallback (detected: {detected_language}, available: {list(evt.result.translations.keys())})[/yellow]"
                             )
@@ -332,13 +480,13 @@ class LiveInterpreterTranslator:
                                     if translation.strip().lower() != evt.result.text.strip().lower():
                                         target_translation = translation
                                         target_lang = lang
-                                        console.print(
+                                        self.console.print(
                                             f"[green]Using fallback translation for {target_lang}: {target_translation[:50]}...[/green]"
                                         )
                                         break
                             
                             if not target_translation:
-                                console.print(
+                                self.console.print(
                                     f"[red]Error: No valid translation found "
                                     f"(detected: {detected_language}, available: {list(evt.result.translations.keys())})[/red]"
                                 )
@@ -349,8 +497,8 @@ class LiveInterpreterTranslator:
                     
                     # Accumulate all translations for final outcome
                     for lang, translation in evt.result.translations.items():
-                        if lang in all_translations:
-                            all_translations[lang].append(translation)
+                        if lang in session.all_translations:
+                            session.all_translations[lang].append(translation)
                     
                     # Emit the appropriate translation (opposite language for bidirectional)
                     if target_translation and on_event:
@@ -363,35 +511,41 @@ class LiveInterpreterTranslator:
                         if detected_language:
                             event_data["detected_source_language"] = detected_language
                         on_event(event_data)
-                final_reason = evt.result.reason
+                session.final_reason = evt.result.reason
 
         # Event handler for audio synthesis
         def _on_synthesizing(evt: speechsdk.translation.TranslationSynthesisEventArgs) -> None:
+            if evt.result and not evt.result.audio:
+                # An empty result marks the end of one phrase's synthesis
+                if session.synthesized_chunks:
+                    session.synthesized_turns.append(b"".join(session.synthesized_chunks))
+                    session.synthesized_chunks.clear()
+                return
             if evt.result and evt.result.audio:
-                synthesized_chunks.append(evt.result.audio)
+                if self.history_turns != 0:
+                    session.synthesized_chunks.append(evt.result.audio)
                 # Emit audio delta event in ACS format
                 if on_event:
-                    console.print(f"[dim]Emitting synthesized audio chunk: {len(evt.result.audio)} bytes[/dim]")
+                    self.console.print(f"[dim]Emitting synthesized audio chunk: {len(evt.result.audio)} bytes[/dim]")
                     self._emit_acs_audio_event(evt.result.audio, on_event)
                 else:
-                    console.print("[yellow]Warning: on_event callback not available for audio synthesis[/yellow]")
+                    self.console.print("[yellow]Warning: on_event callback not available for audio synthesis[/yellow]")
 
         # Event handler for cancellation/errors
         def _on_canceled(evt: speechsdk.translation.TranslationRecognitionCanceledEventArgs) -> None:
-            nonlocal error_details, final_reason
-            final_reason = speechsdk.ResultReason.Canceled
+            session.final_reason = speechsdk.ResultReason.Canceled
             if evt.reason == speechsdk.CancellationReason.Error:
-                error_details = f"Error: {evt.error_details}"
+                session.error_details = f"Error: {evt.error_details}"
             elif evt.reason == speechsdk.CancellationReason.EndOfStream:
                 # End of stream is expected, not an error
-                final_reason = speechsdk.ResultReason.TranslatedSpeech
+                session.final_reason = speechsdk.ResultReason.TranslatedSpeech
             else:
-                error_details = f"Cancellation reason: {evt.reason}"
-            recognition_done.set()
+                session.error_details = f"Cancellation reason: {evt.reason}"
+            session.mark_done()
 
         # Event handler for session stopped
         def _on_session_stopped(evt: speechsdk.SessionEventArgs) -> None:
-            recognition_done.set()
+            session.mark_done()
 
         # Connect event handlers
         recognizer.recognizing.connect(_on_recognizing)
@@ -399,47 +553,34 @@ class LiveInterpreterTranslator:
         # Check if voice is configured (either provided or auto-selected)
         voice_configured = translation_config.voice_name if hasattr(translation_config, 'voice_name') else self.voice_name
         if voice_configured:
-            console.print(f"[bold cyan]Voice synthesis enabled: {voice_configured}[/bold cyan]")
+            self.console.print(f"[bold cyan]Voice synthesis enabled: {voice_configured}[/bold cyan]")
             recognizer.synthesizing.connect(_on_synthesizing)
         else:
-            console.print("[yellow]Voice synthesis disabled - no voice configured[/yellow]")
+            self.console.print("[yellow]Voice synthesis disabled - no voice configured[/yellow]")
         recognizer.canceled.connect(_on_canceled)
         recognizer.session_stopped.connect(_on_session_stopped)
 
-        console.print(Panel.fit("Starting continuous translation stream...", style="bold magenta"))
-        
-        # Start continuous recognition
-        recognizer.start_continuous_recognition()
+        self.console.print(Panel.fit("Starting continuous translation stream...", style="bold magenta"))
+        return session
 
-        # Wait for recognition to complete (either end of stream or error)
-        # Check for stop signal from audio_input if it's a stream
-        try:
-            while not recognition_done.is_set():
-                if audio_input._stop_capture and audio_input._stop_capture.is_set():
-                    # End of stream signaled, stop recognition gracefully
-                    recognizer.stop_continuous_recognition_async().get()
-                    break
-                recognition_done.wait(timeout=0.1)
-        except KeyboardInterrupt:
-            console.print("[yellow]Interrupted by user[/yellow]")
-            recognizer.stop_continuous_recognition_async().get()
-        finally:
-            # Ensure recognition is stopped
-            try:
-                recognizer.stop_continuous_recognition_async().get()
-            except Exception:
-                pass
+    def _build_outcome(self, session: _RecognitionSession) -> TranslationOutcome:
+        """Turn the accumulated session results into a TranslationOutcome."""
+        final_reason = session.final_reason
+        error_details = session.error_details
 
         # Build final outcome
-        recognized_text = " ".join(all_recognized_text) if all_recognized_text else None
+        recognized_text = " ".join(session.all_recognized_text) if session.all_recognized_text else None
         translations = {
             lang: " ".join(texts) if texts else ""
-            for lang, texts in all_translations.items()
+            for lang, texts in session.all_translations.items()
         }
 
         audio_output_path: Optional[Path] = None
-        if synthesized_chunks and self.output_audio_path:
-            audio_output_path = self._persist_audio(b"".join(synthesized_chunks))
+        if session.synthesized_chunks:
+            session.synthesized_turns.append(b"".join(session.synthesized_chunks))
+            session.synthesized_chunks.clear()
+        if session.synthesized_turns and self.output_audio_path:
+            audio_output_path = self._persist_audio(b"".join(session.synthesized_turns))
 
         outcome = TranslationOutcome(
             recognized_text=recognized_text,
@@ -450,9 +591,9 @@ class LiveInterpreterTranslator:
         )
 
         if final_reason == speechsdk.ResultReason.Canceled and error_details:
-            console.print(Panel(error_details, title="Translation canceled", style="bold red"))
+            self.console.print(Panel(error_details, title="Translation canceled", style="bold red"))
         elif final_reason == speechsdk.ResultReason.NoMatch:
-            console.print(
+            self.console.print(
                 Panel("No speech could be recognized", title="No match", style="bold yellow")
             )
         elif recognized_text or any(translations.values()):
@@ -493,7 +634,7 @@ class LiveInterpreterTranslator:
         assert output_path is not None
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(audio_bytes)
-        console.print(
+        self.console.print(
             Panel.fit(
                 f"Synthesized audio saved to {output_path}",
                 title="Audio output",
@@ -516,5 +657,5 @@ class LiveInterpreterTranslator:
         if outcome.audio_output_path:
             table.add_row("Synthesized audio", str(outcome.audio_output_path))
 
-        console.print(table)
+        self.console.print(table)
 
@@ -0,0 +1,90 @@
+"""Prometheus metrics for the WebSocket server.
+
+The server answers plain HTTP GETs on its WebSocket port: `/metrics` returns these
+metrics in the Prometheus text format and `/health` a small JSON status, so the
+k8s deployment can scrape and probe the pod without a second port.
+
+With `serve --workers N` every worker records into the directory named by
+`PROMETHEUS_MULTIPROC_DIR` (set up by the supervisor), and any worker or the
+supervisor's health port can render the aggregate.
+"""
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Per-frame CPU work: tens of microseconds normally, milliseconds when starved
+RESAMPLE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+# A socket write that is not immediate means the client or the network is behind
+SEND_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+# Speech latencies: sub-second is good, several seconds is what callers notice
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 20.0)
+
+ACTIVE_SESSIONS = Gauge(
+    "speech_poc_active_sessions",
+    "WebSocket sessions currently connected.",
+    multiprocess_mode="livesum",
+)
+SESSIONS = Counter(
+    "speech_poc_sessions",
+    "WebSocket sessions accepted.",
+)
+INBOUND_FRAMES = Counter(
+    "speech_poc_inbound_frames",
+    "Inbound audio frames fed into the translation pipeline.",
+)
+RESAMPLE_SECONDS = Histogram(
+    "speech_poc_resample_seconds",
+    "Time spent resampling one block of audio.",
+    ["direction"],
+    buckets=RESAMPLE_BUCKETS,
+)
+AUDIO_QUEUE_DEPTH = Gauge(
+    "speech_poc_audio_queue_depth_chunks",
+    "Audio chunks waiting for the translator, summed over sessions.",
+    multiprocess_mode="livesum",
+)
+OUTBOUND_SEND_SECONDS = Histogram(
+    "speech_poc_outbound_send_seconds",
+    "Time to write one message to the client socket.",
+    buckets=SEND_BUCKETS,
+)
+RESPONSE_FIRST_AUDIO_SECONDS = Histogram(
+    "speech_poc_voice_live_first_audio_seconds",
+    "Time from Voice Live response.created to its first audio delta.",
+    buckets=LATENCY_BUCKETS,
+)
+FIRST_AUDIO_SECONDS = Histogram(
+    "speech_poc_first_audio_seconds",
+    "Time from a call's first inbound audio frame to its first translated audio.",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition body and its content type."""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished worker's live gauges from the multiprocess aggregate."""
+    if os.environ.get(MULTIPROC_DIR_ENV):
+        multiprocess.mark_process_dead(pid)
@@ -8,6 +8,11 @@ from typing import Optional
 
 import azure.cognitiveservices.speech as speechsdk
 
+# Turns kept for the final TranslationOutcome of a streaming session (e.g. the
+# WebSocket server). Per-turn results are delivered through on_event as they
+# happen, so older turns can be released and memory stays flat on long calls.
+DEFAULT_SESSION_HISTORY_TURNS = 20
+
 
 @dataclass
 class TranslationOutcome:
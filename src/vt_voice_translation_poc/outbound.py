@@ -0,0 +1,239 @@
+"""Per-session outbound message queue for the WebSocket server.
+
+Translation events are produced by the translator (on the server loop for Voice Live,
+on Speech SDK threads for Live Interpreter) and must never wait for the client's
+socket. Each session gets an `OutboundQueue` with a dedicated writer task; producers
+call `put()` and return immediately.
+
+Backpressure is handled with watermarks. Once the queue depth reaches the high
+watermark the queue starts shedding droppable messages (stale text deltas by
+default) and keeps doing so until the writer drains it below the low watermark.
+Audio and control messages are never shed; `max_size` is a last-resort cap for a
+client that has stopped reading altogether.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Message kinds used to apply the drop policy
+KIND_AUDIO = "audio"
+KIND_TEXT = "text"
+KIND_CONTROL = "control"
+
+DEFAULT_HIGH_WATERMARK = 200
+DEFAULT_LOW_WATERMARK = 50
+DEFAULT_MAX_SIZE = 2000
+
+
+class OutboundDropPolicy(str, Enum):
+    """Which messages may be discarded while the queue is above its high watermark."""
+
+    TEXT = "text"  # Shed text deltas; audio and control messages are always kept
+    NONE = "none"  # Never shed; only the max_size safety cap applies
+
+
+@dataclass
+class OutboundStats:
+    """Counters describing one session's outbound queue."""
+
+    enqueued: int = 0
+    sent: int = 0
+    dropped: int = 0  # Shed by the drop policy
+    overflowed: int = 0  # Rejected because the queue hit max_size
+    failed: int = 0  # Send raised (usually because the client went away)
+    depth: int = 0
+    max_depth: int = 0
+    shedding_episodes: int = 0
+    send_time_total_s: float = 0.0
+    send_time_max_s: float = 0.0
+    queue_wait_max_s: float = 0.0
+
+    @property
+    def send_time_avg_s(self) -> float:
+        return self.send_time_total_s / self.sent if self.sent else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "overflowed": self.overflowed,
+            "failed": self.failed,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "shedding_episodes": self.shedding_episodes,
+            "send_time_avg_ms": round(self.send_time_avg_s * 1000, 3),
+            "send_time_max_ms": round(self.send_time_max_s * 1000, 3),
+            "queue_wait_max_ms": round(self.queue_wait_max_s * 1000, 3),
+        }
+
+
+class OutboundQueue:
+    """Bounded, non-blocking send queue drained by a single writer task."""
+
+    def __init__(
+        self,
+        websocket: Any,
+        *,
+        high_watermark: int = DEFAULT_HIGH_WATERMARK,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+        max_size: int = DEFAULT_MAX_SIZE,
+        drop_policy: OutboundDropPolicy = OutboundDropPolicy.TEXT,
+    ) -> None:
+        if not 0 <= low_watermark < high_watermark <= max_size:
+            raise ValueError(
+                "Outbound queue limits must satisfy 0 <= low_watermark < high_watermark <= max_size "
+                f"(got low={low_watermark}, high={high_watermark}, max={max_size})."
+            )
+        self.websocket = websocket
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.max_size = max_size
+        self.drop_policy = drop_policy
+        self.stats = OutboundStats()
+
+        # Entries are (payload, kind, enqueue_time)
+        self._queue: deque[tuple[str, str, float]] = deque()
+        self._wakeup = asyncio.Event()
+        self._shedding = False
+        self._closed = False
+        self._loop = asyncio.get_running_loop()
+        self._writer = self._loop.create_task(self._run_writer())
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def put(self, payload: str, kind: str = KIND_CONTROL) -> None:
+        """Queue a payload for sending. Safe to call from any thread; never blocks."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._enqueue(payload, kind, time.perf_counter())
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._enqueue, payload, kind, time.perf_counter())
+
+    def _enqueue(self, payload: str, kind: str, enqueued_at: float) -> None:
+        if self._closed:
+            return
+
+        depth = len(self._queue)
+        droppable = self._is_droppable(kind)
+
+        if depth >= self.high_watermark and not self._shedding:
+            self._shedding = True
+            self.stats.shedding_episodes += 1
+            logger.warning(
+                "Outbound queue above high watermark (%d messages); shedding %s messages",
+                depth,
+                self.drop_policy.value,
+            )
+            self._purge_droppable()
+            depth = len(self._queue)
+
+        if self._shedding and droppable:
+            self.stats.dropped += 1
+            return
+
+        if depth >= self.max_size:
+            self.stats.overflowed += 1
+            if self.stats.overflowed == 1:
+                logger.error(
+                    "Outbound queue full (%d messages); client is not reading, dropping %s message",
+                    depth,
+                    kind,
+                )
+            return
+
+        self._queue.append((payload, kind, enqueued_at))
+        self.stats.enqueued += 1
+        self.stats.depth = len(self._queue)
+        if self.stats.depth > self.stats.max_depth:
+            self.stats.max_depth = self.stats.depth
+        self._wakeup.set()
+
+    def _is_droppable(self, kind: str) -> bool:
+        return self.drop_policy is OutboundDropPolicy.TEXT and kind == KIND_TEXT
+
+    def _purge_droppable(self) -> None:
+        """Remove queued droppable messages; by the time they would be sent they are stale."""
+        if self.drop_policy is OutboundDropPolicy.NONE:
+            return
+        kept = deque(entry for entry in self._queue if not self._is_droppable(entry[1]))
+        self.stats.dropped += len(self._queue) - len(kept)
+        self._queue = kept
+        self.stats.depth = len(self._queue)
+
+    async def _run_writer(self) -> None:
+        while True:
+            if not self._queue:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            payload, kind, enqueued_at = self._queue.popleft()
+            self.stats.depth = len(self._queue)
+            if self._shedding and self.stats.depth <= self.low_watermark:
+                self._shedding = False
+                logger.info("Outbound queue drained below low watermark (%d messages)", self.stats.depth)
+
+            started = time.perf_counter()
+            try:
+                await self.websocket.send(payload)
+            except (ConnectionClosedOK, ConnectionClosedError) as exc:
+                # Nobody left to deliver to; discard the backlog
+                self.stats.failed += 1 + len(self._queue)
+                logger.debug("Dropping %d outbound message(s) after client disconnect: %s", len(self._queue) + 1, exc)
+                self._queue.clear()
+                self.stats.depth = 0
+                self._closed = True
+                return
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self.stats.failed += 1
+                logger.warning("Failed to send %s message to client: %s", kind, exc)
+                continue
+
+            finished = time.perf_counter()
+            send_time = finished - started
+            self.stats.sent += 1
+            self.stats.send_time_total_s += send_time
+            metrics.OUTBOUND_SEND_SECONDS.observe(send_time)
+            if send_time > self.stats.send_time_max_s:
+                self.stats.send_time_max_s = send_time
+            queue_wait = started - enqueued_at
+            if queue_wait > self.stats.queue_wait_max_s:
+                self.stats.queue_wait_max_s = queue_wait
+
+    async def close(self, timeout: Optional[float] = 2.0) -> None:
+        """Stop accepting messages and give the writer a chance to flush what is queued."""
+        self._closed = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._writer), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        except asyncio.CancelledError:
+            self._writer.cancel()
+            raise
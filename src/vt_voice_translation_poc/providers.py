@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Protocol
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Protocol
 
 from rich.console import Console
 
@@ -11,7 +11,10 @@ from .audio import AudioInput
 from .config import SpeechProvider, SpeechServiceSettings
 from .live_interpreter import LiveInterpreterTranslator
 from .models import TranslationOutcome
-from .voice_live import VoiceLiveTranslator
+from .voice_live import DEFAULT_AUDIO_DELTA_COALESCE_MS, AudioDeltaMode, VoiceLiveTranslator
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .voice_live_pool import VoiceLiveConnectionPool
 
 console = Console()
 
@@ -21,7 +24,12 @@ TranslationEventCallback = Callable[[dict], None]
 
 
 class Translator(Protocol):
-    """Protocol representing a translation provider implementation."""
+    """Protocol representing a translation provider implementation.
+
+    ``translate`` is the blocking entry point used by the CLI. ``translate_async``
+    runs the same session as a coroutine on the caller's event loop, which is what
+    the WebSocket server uses so that each call is a task rather than a thread.
+    """
 
     def translate(
         self, 
@@ -30,6 +38,13 @@ class Translator(Protocol):
     ) -> TranslationOutcome:
         ...
 
+    async def translate_async(
+        self,
+        audio_input: AudioInput,
+        on_event: Optional[TranslationEventCallback] = None,
+    ) -> TranslationOutcome:
+        ...
+
 
 def create_translator(
     settings: SpeechServiceSettings,
@@ -40,13 +55,26 @@ def create_translator(
     output_audio_path: Optional[Path],
     terminate_on_completion: bool = False,
     local_audio_playback: bool = False,
+    audio_delta_mode: AudioDeltaMode = AudioDeltaMode.RESPONSE,
+    audio_delta_coalesce_ms: int = DEFAULT_AUDIO_DELTA_COALESCE_MS,
+    history_turns: Optional[int] = None,
+    connection_pool: Optional[VoiceLiveConnectionPool] = None,
+    quiet: bool = False,
 ) -> Translator:
-    """Return a translator implementation for the configured provider."""
+    """Return a translator implementation for the configured provider.
+
+    ``history_turns`` bounds how many turns a session keeps for its final outcome;
+    None keeps everything, which one-shot translations rely on. ``connection_pool``
+    supplies warm Voice Live sessions and is ignored by Live Interpreter. ``quiet``
+    suppresses the translator's console output.
+    """
     if settings.provider is SpeechProvider.LIVE_INTERPRETER:
         return LiveInterpreterTranslator(
             settings,
             voice_name=voice_name,
             output_audio_path=output_audio_path,
+            history_turns=history_turns,
+            quiet=quiet,
         )
 
     if settings.provider is SpeechProvider.VOICE_LIVE:
@@ -58,6 +86,11 @@ def create_translator(
             output_audio_path=output_audio_path,
             terminate_on_completion=terminate_on_completion,
             local_audio_playback=local_audio_playback,
+            audio_delta_mode=audio_delta_mode,
+            audio_delta_coalesce_ms=audio_delta_coalesce_ms,
+            history_turns=history_turns,
+            connection_pool=connection_pool,
+            quiet=quiet,
         )
 
     raise RuntimeError(f"Unsupported provider: {settings.provider}")
@@ -0,0 +1,166 @@
+"""Streaming polyphase resampler for 16-bit PCM.
+
+ACS delivers audio as short (20 ms) frames and Voice Live returns translated audio
+as a stream of deltas. Resampling each piece independently restarts the
+interpolation at every boundary, which produces clicks at the frame rate and lets
+content above the new Nyquist frequency alias into the speech band.
+
+`StreamingResampler` keeps the tail of the previous input as filter history, so
+consecutive calls produce exactly the same samples as resampling the whole stream
+at once. Filter taps are designed once per rate pair and shared between all
+resampler instances.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+# Taps per polyphase branch; the prototype low-pass filter has TAPS_PER_PHASE * up taps.
+DEFAULT_TAPS_PER_PHASE = 32
+# Pass-band edge as a fraction of the lower of the two Nyquist frequencies.
+DEFAULT_ROLLOFF = 0.9
+# Kaiser window shape; ~80 dB stop-band attenuation.
+DEFAULT_KAISER_BETA = 8.0
+# Block layouts remembered per resampler; steady frame sizes only need a handful
+_INDEX_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=32)
+def polyphase_taps(
+    up: int,
+    down: int,
+    taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+    rolloff: float = DEFAULT_ROLLOFF,
+    beta: float = DEFAULT_KAISER_BETA,
+) -> np.ndarray:
+    """Design a Kaiser-windowed sinc low-pass and split it into `up` branches.
+
+    Row `p` holds the taps applied when the output sample falls on phase `p` of the
+    upsampled grid, ordered from the newest input sample to the oldest. The returned
+    array is read-only because it is shared between resamplers.
+    """
+    num_taps = taps_per_phase * up
+    # Cut-off in cycles per sample of the upsampled signal (rate = src_rate * up)
+    cutoff = 0.5 * rolloff / max(up, down)
+    n = np.arange(num_taps, dtype=np.float64) - (num_taps - 1) / 2.0
+    prototype = 2.0 * cutoff * np.sinc(2.0 * cutoff * n) * np.kaiser(num_taps, beta)
+    # Each branch sees one real sample every `up` positions, so restore the gain
+    prototype *= up / prototype.sum()
+    taps = prototype.reshape(taps_per_phase, up).T.astype(np.float32)
+    taps.flags.writeable = False
+    return taps
+
+
+class StreamingResampler:
+    """Stateful int16 mono resampler that carries filter history between calls.
+
+    `process()` returns a view into an internal buffer that is reused on the next
+    call, so callers must copy (e.g. `tobytes()`) before feeding more audio.
+    One instance serves one stream; it is not safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        src_rate: int,
+        dst_rate: int,
+        *,
+        taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+    ) -> None:
+        if src_rate <= 0 or dst_rate <= 0:
+            raise ValueError(f"Sample rates must be positive (got {src_rate} -> {dst_rate}).")
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        divisor = gcd(src_rate, dst_rate)
+        self.up = dst_rate // divisor
+        self.down = src_rate // divisor
+        self.passthrough = self.up == self.down
+        self._taps = polyphase_taps(self.up, self.down, taps_per_phase)
+        self._history_len = taps_per_phase - 1
+        # Input samples (as float32) with the previous call's tail in front
+        self._work = np.zeros(self._history_len, dtype=np.float32)
+        self._out = np.empty(0, dtype="<i2")
+        # Position of the next output sample on the upsampled grid, relative to the
+        # first sample of the next input block
+        self._phase_pos = 0
+        # Gather offsets from a block's base index to its tap window (newest first)
+        self._tap_offsets = np.arange(self._history_len, -1, -1)
+        self._index_cache: dict[tuple[int, int], tuple[np.ndarray, np.ndarray, int]] = {}
+
+    @property
+    def latency_samples(self) -> float:
+        """Group delay of the filter, in output samples."""
+        return self._history_len / 2.0 * self.up / self.down
+
+    def reset(self) -> None:
+        """Forget the filter history, e.g. after a discontinuity in the input."""
+        self._work[: self._history_len] = 0.0
+        self._phase_pos = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one block of int16 mono samples."""
+        if self.passthrough:
+            return samples
+
+        count = len(samples)
+        if count == 0:
+            return self._out[:0]
+
+        history = self._history_len
+        needed = history + count
+        if len(self._work) < needed:
+            grown = np.empty(max(needed, 2 * len(self._work)), dtype=np.float32)
+            grown[:history] = self._work[:history]
+            self._work = grown
+        work = self._work
+        work[history:needed] = samples
+
+        base, phases, out_count = self._indices(self._phase_pos, count)
+        if out_count:
+            windows = work[base[:, None] + self._tap_offsets]
+            resampled = np.einsum("ij,ij->i", windows, self._taps[phases])
+            out = self._output_buffer(out_count)
+            np.rint(resampled, out=resampled)
+            np.clip(resampled, -32768, 32767, out=resampled)
+            out[:] = resampled
+        else:
+            out = self._out[:0]
+
+        # Carry the tail forward as history for the next block
+        work[:history] = work[count:needed]
+        self._phase_pos += out_count * self.down - count * self.up
+        return out
+
+    def _indices(self, phase_pos: int, count: int) -> tuple[np.ndarray, np.ndarray, int]:
+        """Input base indices and filter phases for every output sample of a block.
+
+        Fixed-size frames cycle through a small set of starting phases, so the result
+        is cached per (starting phase, block size).
+        """
+        key = (phase_pos, count)
+        cached = self._index_cache.get(key)
+        if cached is None:
+            limit = count * self.up
+            positions = np.arange(phase_pos, limit, self.down)
+            base = positions // self.up
+            phases = positions - base * self.up
+            cached = (base, phases, len(positions))
+            if len(self._index_cache) >= _INDEX_CACHE_SIZE:
+                self._index_cache.clear()
+            self._index_cache[key] = cached
+        return cached
+
+    def _output_buffer(self, size: int) -> np.ndarray:
+        if len(self._out) < size:
+            self._out = np.empty(max(size, 2 * len(self._out)), dtype="<i2")
+        return self._out[:size]
+
+
+def downmix_to_mono(samples: np.ndarray, channels: int) -> np.ndarray:
+    """Average interleaved int16 channels into a mono int16 array."""
+    if channels == 1:
+        return samples
+    frames = samples[: len(samples) - len(samples) % channels].reshape(-1, channels)
+    return (frames.sum(axis=1, dtype=np.int32) // channels).astype("<i2")
@@ -5,11 +5,15 @@ from __future__ import annotations
 import asyncio
 import base64
 import json
+import time
 import uuid
 import wave
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Optional
 from urllib.parse import urlencode, urlparse, urlunparse
 
 import azure.cognitiveservices.speech as speechsdk
@@ -18,9 +22,14 @@ import websockets
 from rich.console import Console
 from rich.panel import Panel
 
-from .audio import AudioInput
+from .audio import AudioChunk, AudioInput
+from . import metrics
 from .config import SpeechServiceSettings
 from .models import TranslationOutcome
+from .wav import WavFile
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .voice_live_pool import VoiceLiveConnectionPool
 
 console = Console()
 
@@ -38,6 +47,22 @@ SUPPORTED_VOICE_LIVE_VOICES = {
 }
 
 
+class AudioDeltaMode(str, Enum):
+    """How translated audio is handed to the `on_event` callback.
+
+    * response: buffer every delta and emit one event when the response completes;
+    * delta: emit each Voice Live audio delta as it arrives;
+    * coalesced: group deltas into blocks of roughly `audio_delta_coalesce_ms`.
+    """
+
+    RESPONSE = "response"
+    DELTA = "delta"
+    COALESCED = "coalesced"
+
+
+DEFAULT_AUDIO_DELTA_COALESCE_MS = 100
+
+
 @dataclass
 class VoiceLiveConfig:
     """Runtime configuration for Voice Live sessions."""
@@ -69,7 +94,14 @@ class VoiceLiveTranslator:
         output_audio_path: Optional[Path],
         terminate_on_completion: bool = False,
         local_audio_playback: bool = False,
+        audio_delta_mode: AudioDeltaMode = AudioDeltaMode.RESPONSE,
+        audio_delta_coalesce_ms: int = DEFAULT_AUDIO_DELTA_COALESCE_MS,
+        history_turns: Optional[int] = None,
+        connection_pool: Optional[VoiceLiveConnectionPool] = None,
+        quiet: bool = False,
     ) -> None:
+        # Quiet translators drop their progress output (concurrent batch runs)
+        self.console = Console(quiet=True) if quiet else console
         self.settings = settings
         self.from_language = from_language
         self.to_languages = tuple(to_languages)
@@ -78,6 +110,17 @@ class VoiceLiveTranslator:
         self.translation_instruction = self._build_instruction()
         self._terminate_on_completion = terminate_on_completion
         self._local_audio_playback = local_audio_playback
+        self.audio_delta_mode = AudioDeltaMode(audio_delta_mode)
+        if audio_delta_coalesce_ms < 1:
+            raise ValueError(f"Audio delta coalescing must be at least 1 ms (got {audio_delta_coalesce_ms}).")
+        self.audio_delta_coalesce_ms = audio_delta_coalesce_ms
+        # None keeps every turn for the final outcome; a number keeps only the most
+        # recent turns (streaming sessions deliver results through on_event)
+        if history_turns is not None and history_turns < 0:
+            raise ValueError(f"History turns must not be negative (got {history_turns}).")
+        self.history_turns = history_turns
+        # Warm, already configured sessions shared between calls (WebSocket server)
+        self._connection_pool = connection_pool
 
         if not self.to_languages:
             raise ValueError("At least one target language must be specified.")
@@ -87,6 +130,15 @@ class VoiceLiveTranslator:
         audio_input: AudioInput,
         on_event: Optional[Callable[[dict], None]] = None,
     ) -> TranslationOutcome:
+        """Blocking wrapper around translate_async() for callers without an event loop."""
+        return asyncio.run(self.translate_async(audio_input, on_event=on_event))
+
+    async def translate_async(
+        self,
+        audio_input: AudioInput,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> TranslationOutcome:
+        """Run a Voice Live session on the caller's event loop."""
         if audio_input.is_file:
             source_path = audio_input.source_path
             if source_path is None:
@@ -99,13 +151,13 @@ class VoiceLiveTranslator:
                 )
 
             audio_bytes, sample_rate, channels = self._load_wav(source_path)
-            console.print(f"Loaded WAV {source_path}, bytes={len(audio_bytes)}, sr={sample_rate}, channels={channels}")
+            self.console.print(f"Loaded WAV {source_path}, bytes={len(audio_bytes)}, sr={sample_rate}, channels={channels}")
             config = self._build_config(sample_rate=sample_rate, channels=channels)
             is_streaming = False
         elif audio_input.is_microphone or audio_input.is_stream:
             sample_rate, channels, sample_width = audio_input.get_audio_format()
             source_type_name = "microphone" if audio_input.is_microphone else "stream"
-            console.print(
+            self.console.print(
                 f"[bold cyan]Streaming from {source_type_name}: sr={sample_rate}Hz, "
                 f"channels={channels}, width={sample_width} bytes[/bold cyan]"
             )
@@ -115,7 +167,7 @@ class VoiceLiveTranslator:
         else:
             raise ValueError(f"Unsupported audio input type: {audio_input.source_type}")
 
-        console.print(
+        self.console.print(
             Panel.fit(
                 f"Voice Live config\n"
                 f"- websocket: {config.websocket_url}\n"
@@ -129,10 +181,10 @@ class VoiceLiveTranslator:
         )
 
         try:
-            outcome = asyncio.run(self._dispatch(audio_input, audio_bytes, config, is_streaming, on_event))
+            outcome = await self._dispatch(audio_input, audio_bytes, config, is_streaming, on_event)
         except Exception as exc:  # pragma: no cover - safeguard for unexpected runtime issues
             message = f"{exc.__class__.__name__}: {exc}" if str(exc) else repr(exc)
-            console.print(Panel(message, title="Voice Live error", style="bold red"))
+            self.console.print(Panel(message, title="Voice Live error", style="bold red"))
             return TranslationOutcome(
                 recognized_text=None,
                 translations={},
@@ -156,101 +208,137 @@ class VoiceLiveTranslator:
     async def _dispatch(
         self,
         audio_input: AudioInput,
-        audio_bytes: Optional[bytes],
+        audio_bytes: Optional[AudioChunk],
         config: VoiceLiveConfig,
         is_streaming: bool,
         on_event: Optional[Callable[[dict], None]] = None,
     ) -> TranslationOutcome:
-        headers = {
-            "api-key": config.api_key,
-            "Ocp-Apim-Subscription-Key": config.api_key,
-            "x-ms-client-request-id": str(uuid.uuid4()),
-            "Authorization": f"Bearer {config.api_key}",
-            "OpenAI-Beta": "realtime=v1",
-        }
-
-        console.print(Panel.fit("Connecting to Voice Live...", style="bold cyan"))
-
-        async with websockets.connect(
-            config.websocket_url,
-            extra_headers=headers,
-            max_size=None,
-            ping_interval=None,
-        ) as ws:
+        async with self._session_socket(config) as (ws, configured):
             # Wrap websocket for logging
             from .websocket_logger import WebSocketLogger
-            websocket = WebSocketLogger(ws, log_file="voice_live_messages.log", log_dir="logs")
+            async with WebSocketLogger(ws, log_file="voice_live_messages.log", log_dir="logs") as websocket:
 
-            await self._configure_session(websocket, config)
+                if not configured:
+                    await self._configure_session(websocket, config)
             
-            if is_streaming:
-                # For streaming microphone: run audio streaming and response reading concurrently
-                # Use shared flags to coordinate shutdown and response state
-                streaming_done = asyncio.Event()
-                response_in_progress = asyncio.Event()  # Track if a response is being processed
-                commit_ack_queue: asyncio.Queue[asyncio.Future] = asyncio.Queue()
+                if is_streaming:
+                    # For streaming microphone: run audio streaming and response reading concurrently
+                    # Use shared flags to coordinate shutdown and response state
+                    streaming_done = asyncio.Event()
+                    response_in_progress = asyncio.Event()  # Track if a response is being processed
+                    commit_ack_queue: asyncio.Queue[asyncio.Future] = asyncio.Queue()
                 
-                async def stream_with_cleanup():
-                    try:
-                        await self._stream_audio(
+                    async def stream_with_cleanup():
+                        try:
+                            await self._stream_audio(
+                                websocket,
+                                audio_input,
+                                audio_bytes,
+                                config,
+                                is_streaming,
+                                response_in_progress,
+                                commit_ack_queue,
+                            )
+                        except KeyboardInterrupt:
+                            self.console.print("\n[bold yellow]Interrupted by user[/bold yellow]")
+                        finally:
+                            streaming_done.set()
+                
+                    streaming_task = asyncio.create_task(stream_with_cleanup())
+                    responses_task = asyncio.create_task(
+                        self._read_responses(
                             websocket,
-                            audio_input,
-                            audio_bytes,
                             config,
-                            is_streaming,
-                            response_in_progress,
-                            commit_ack_queue,
+                            play_audio=self._local_audio_playback,
+                            streaming_done=streaming_done,
+                            response_in_progress=response_in_progress,
+                            commit_ack_queue=commit_ack_queue,
+                            on_event=on_event,
                         )
-                    except KeyboardInterrupt:
-                        console.print("\n[bold yellow]Interrupted by user[/bold yellow]")
-                    finally:
-                        streaming_done.set()
-                
-                streaming_task = asyncio.create_task(stream_with_cleanup())
-                responses_task = asyncio.create_task(
-                    self._read_responses(
-                        websocket,
-                        config,
-                        play_audio=self._local_audio_playback,
-                        streaming_done=streaming_done,
-                        response_in_progress=response_in_progress,
-                        commit_ack_queue=commit_ack_queue,
-                        on_event=on_event,
                     )
-                )
                 
-                # Wait for streaming to complete
-                await streaming_task
+                    # Wait for streaming to complete
+                    await streaming_task
                 
-                # Give responses a moment to finish processing
-                await asyncio.sleep(2)
+                    # Give responses a moment to finish processing
+                    await asyncio.sleep(2)
                 
-                # Cancel response reading if still running
-                if not responses_task.done():
-                    responses_task.cancel()
-                    try:
-                        await responses_task
-                    except asyncio.CancelledError:
-                        pass
+                    # Cancel response reading if still running
+                    if not responses_task.done():
+                        responses_task.cancel()
+                        try:
+                            await responses_task
+                        except asyncio.CancelledError:
+                            pass
                 
-                # Get the outcome
-                if responses_task.done():
-                    try:
-                        return responses_task.result()
-                    except Exception as e:
-                        console.print(f"[yellow]Response task error: {e}[/yellow]")
+                    # Get the outcome
+                    if responses_task.done():
+                        try:
+                            return responses_task.result()
+                        except Exception as e:
+                            self.console.print(f"[yellow]Response task error: {e}[/yellow]")
                 
-                # Fallback outcome
-                return TranslationOutcome(
-                    recognized_text=None,
-                    translations={},
-                    result_reason=speechsdk.ResultReason.Canceled,
-                    error_details="Streaming completed",
-                )
-            else:
-                # For file input: stream first, then read responses
-                await self._stream_audio(websocket, audio_input, audio_bytes, config, is_streaming)
-                return await self._read_responses(websocket, config, play_audio=self._local_audio_playback, on_event=on_event)
+                    # Fallback outcome
+                    return TranslationOutcome(
+                        recognized_text=None,
+                        translations={},
+                        result_reason=speechsdk.ResultReason.Canceled,
+                        error_details="Streaming completed",
+                    )
+                else:
+                    # For file input: stream first, then read responses
+                    await self._stream_audio(websocket, audio_input, audio_bytes, config, is_streaming)
+                    return await self._read_responses(websocket, config, play_audio=self._local_audio_playback, on_event=on_event)
+
+    @asynccontextmanager
+    async def _session_socket(
+        self,
+        config: VoiceLiveConfig,
+    ) -> AsyncIterator[tuple[websockets.WebSocketClientProtocol, bool]]:
+        """Yield a Voice Live socket and whether session.update was already sent.
+
+        A warm session is adopted from the connection pool when one is available.
+        """
+        ws = self._connection_pool.acquire(self, config) if self._connection_pool else None
+        configured = ws is not None
+        if ws is None:
+            self.console.print(Panel.fit("Connecting to Voice Live...", style="bold cyan"))
+            ws = await self._connect(config)
+        else:
+            self.console.print("[bold cyan]Adopted a pre-connected Voice Live session[/bold cyan]")
+        try:
+            yield ws, configured
+        finally:
+            await ws.close()
+
+    async def _connect(self, config: VoiceLiveConfig) -> websockets.WebSocketClientProtocol:
+        headers = {
+            "api-key": config.api_key,
+            "Ocp-Apim-Subscription-Key": config.api_key,
+            "x-ms-client-request-id": str(uuid.uuid4()),
+            "Authorization": f"Bearer {config.api_key}",
+            "OpenAI-Beta": "realtime=v1",
+        }
+        return await websockets.connect(
+            config.websocket_url,
+            extra_headers=headers,
+            max_size=None,
+            ping_interval=None,
+        )
+
+    async def open_session(self, config: VoiceLiveConfig) -> websockets.WebSocketClientProtocol:
+        """Connect and send session.update; used by the connection pool to pre-warm sessions."""
+        websocket = await self._connect(config)
+        try:
+            await self._configure_session(websocket, config)
+        except Exception:
+            await websocket.close()
+            raise
+        return websocket
+
+    def prewarm(self, pool: VoiceLiveConnectionPool, *, sample_rate: int = 16000, channels: int = 1) -> None:
+        """Keep warm sessions for this translator's settings in `pool` (pinned)."""
+        pool.register(self, self._build_config(sample_rate=sample_rate, channels=channels), pinned=True)
 
     def _build_instruction(self) -> str:
         return """
@@ -304,7 +392,7 @@ Do not describe silence or noise.
             return None
         normalised = voice_name.strip()
         if normalised not in SUPPORTED_VOICE_LIVE_VOICES:
-            console.print(
+            self.console.print(
                 Panel.fit(
                     f"Voice '{normalised}' is not supported by Voice Live. "
                     "Falling back to the default voice.",
@@ -345,14 +433,14 @@ Do not describe silence or noise.
         if self.voice_name:
             session_payload["session"]["voice"] = self.voice_name
 
-        console.log(f"[dim]Session instructions: {self.translation_instruction}[/dim]")
+        self.console.log(f"[dim]Session instructions: {self.translation_instruction}[/dim]")
         await websocket.send(json.dumps(session_payload))
 
     async def _stream_audio(
         self,
         websocket: websockets.WebSocketClientProtocol,
         audio_input: AudioInput,
-        audio_bytes: Optional[bytes],
+        audio_bytes: Optional[AudioChunk],
         config: VoiceLiveConfig,
         is_streaming: bool,
         response_in_progress: Optional[asyncio.Event] = None,
@@ -361,21 +449,22 @@ Do not describe silence or noise.
         if is_streaming:
             # Stream microphone input in real-time
             # Turn detection is handled by the service via session.update configuration
-            console.print("[bold yellow]Recording from microphone. Press Ctrl+C to stop...[/bold yellow]")
+            self.console.print("[bold yellow]Recording from microphone. Press Ctrl+C to stop...[/bold yellow]")
             chunk_count = 0
-            commit_audio_buffer = bytearray()
+            # Only the byte count is kept so memory stays flat however long the call runs
+            committed_bytes = 0
             outstanding_buffer = False
             
             try:
-                for chunk in audio_input.get_audio_chunks():
+                async for chunk in audio_input.get_audio_chunks_async():
                     if chunk:
                         chunk_count += 1
                         
                         if chunk_count % 100 == 0:  # Log every 100 chunks
-                            console.log(f"Voice Live streaming chunk #{chunk_count} ({len(chunk)} bytes)")
+                            self.console.log(f"Voice Live streaming chunk #{chunk_count} ({len(chunk)} bytes)")
                         
-                        # Append chunk to buffer for final commit
-                        commit_audio_buffer.extend(chunk)
+                        # Count the chunk towards the final commit
+                        committed_bytes += len(chunk)
                         
                         # Send chunk to service - turn detection will handle commits automatically
                         await websocket.send(
@@ -387,23 +476,28 @@ Do not describe silence or noise.
                             )
                         )
                         outstanding_buffer = True
-                        
-                        # Small delay to prevent overwhelming the WebSocket
-                        await asyncio.sleep(0.002)
-            except KeyboardInterrupt:
-                console.print("\n[bold yellow]Stopping microphone capture...[/bold yellow]")
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # Ctrl+C under asyncio.run() arrives as a cancellation of the running
+                # task. Only a local microphone treats it as "stop and commit"; server
+                # streams are cancelled when the client goes away and must unwind.
+                if not audio_input.is_microphone:
+                    raise
+                current_task = asyncio.current_task()
+                if current_task is not None:
+                    current_task.uncancel()
+                self.console.print("\n[bold yellow]Stopping microphone capture...[/bold yellow]")
                 # Signal the audio input to stop capturing
                 if hasattr(audio_input, '_stop_capture') and audio_input._stop_capture:
                     audio_input._stop_capture.set()
             except Exception as e:
-                console.print(f"[bold red]Error during microphone streaming: {e}[/bold red]")
+                self.console.print(f"[bold red]Error during microphone streaming: {e}[/bold red]")
                 # Signal the audio input to stop capturing
                 if hasattr(audio_input, '_stop_capture') and audio_input._stop_capture:
                     audio_input._stop_capture.set()
                 raise
             
             # Final commit when streaming stops (if there is buffered audio)
-            if outstanding_buffer and commit_audio_buffer:
+            if outstanding_buffer and committed_bytes:
                 # Avoid overlapping responses: wait for any in‑flight response to
                 # finish before issuing the final commit/response.create pair.
                 if response_in_progress:
@@ -414,7 +508,7 @@ Do not describe silence or noise.
                     while response_in_progress.is_set() and (loop.time() - start) < 5.0:
                         await asyncio.sleep(0.01)
                     if response_in_progress.is_set():
-                        console.print(
+                        self.console.print(
                             "[yellow]Timed out waiting for previous response to finish "
                             "before final commit; skipping final commit to avoid "
                             "conversation_already_has_active_response[/yellow]"
@@ -427,15 +521,10 @@ Do not describe silence or noise.
                     ack_future = loop.create_future()
                     await commit_ack_queue.put(ack_future)
                 
-                commit_payload = bytes(commit_audio_buffer)
                 await websocket.send(json.dumps({"type": "input_audio_buffer.commit"}))
-                commit_duration = (
-                    len(commit_payload) / (config.sample_rate_hz * config.channels * 2)
-                    if commit_payload
-                    else 0.0
-                )
-                console.log(
-                    f"[dim]Final commit audio bytes={len(commit_payload)} dur={commit_duration:.2f}s[/dim]"
+                commit_duration = committed_bytes / (config.sample_rate_hz * config.channels * 2)
+                self.console.log(
+                    f"[dim]Final commit audio bytes={committed_bytes} dur={commit_duration:.2f}s[/dim]"
                 )
 
                 if ack_future is not None:
@@ -443,11 +532,11 @@ Do not describe silence or noise.
                         event = await asyncio.wait_for(ack_future, timeout=5.0)
                         ack_item_id = event.get("item_id") if isinstance(event, dict) else None
                         if ack_item_id:
-                            console.log(f"[dim]input_audio_buffer.committed ack item_id={ack_item_id}[/dim]")
+                            self.console.log(f"[dim]input_audio_buffer.committed ack item_id={ack_item_id}[/dim]")
                         await websocket.send(json.dumps({"type": "input_audio_buffer.clear"}))
-                        console.log("[dim]Cleared input audio buffer after final commit[/dim]")
+                        self.console.log("[dim]Cleared input audio buffer after final commit[/dim]")
                     except asyncio.TimeoutError:
-                        console.print(
+                        self.console.print(
                             "[yellow]Timed out waiting for input_audio_buffer.committed acknowledgement (final)[/yellow]"
                         )
                 
@@ -465,7 +554,7 @@ Do not describe silence or noise.
                         }
                     )
                 )
-                console.log("Voice Live response.create dispatched (final)")
+                self.console.log("Voice Live response.create dispatched (final)")
         else:
             # Stream file input
             if audio_bytes is None:
@@ -473,7 +562,7 @@ Do not describe silence or noise.
             chunk_size = 3200  # approx 100ms @ 16kHz mono 16-bit
             for chunk_start in range(0, len(audio_bytes), chunk_size):
                 chunk = audio_bytes[chunk_start : chunk_start + chunk_size]
-                console.log(f"Voice Live audio chunk bytes={len(chunk)} start={chunk_start}")
+                self.console.log(f"Voice Live audio chunk bytes={len(chunk)} start={chunk_start}")
                 await websocket.send(
                     json.dumps(
                         {
@@ -485,7 +574,7 @@ Do not describe silence or noise.
 
         if not is_streaming:
             await websocket.send(json.dumps({"type": "input_audio_buffer.commit"}))
-            console.log("Voice Live audio stream committed")
+            self.console.log("Voice Live audio stream committed")
 
             response_payload: dict[str, object] = {
                 "instructions": self.translation_instruction,
@@ -499,7 +588,7 @@ Do not describe silence or noise.
                     }
                 )
             )
-            console.log("Voice Live response.create dispatched")
+            self.console.log("Voice Live response.create dispatched")
 
     async def _read_responses(
         self,
@@ -511,9 +600,20 @@ Do not describe silence or noise.
         commit_ack_queue: Optional[asyncio.Queue[asyncio.Future]] = None,
         on_event: Optional[Callable[[dict], None]] = None,
     ) -> TranslationOutcome:
-        recognized_segments: list[str] = []
+        recognized_segments: deque[str] = deque(maxlen=self.history_turns)
         text_segments: list[str] = []
+        # Audio of the current response, and of completed responses that were not
+        # handed to on_event (kept for the output WAV)
         audio_chunks: list[bytes] = []
+        audio_turns: deque[bytes] = deque(maxlen=self.history_turns)
+        # Incremental forwarding: audio not yet emitted in coalesced mode, and the
+        # amount of audio received for the current response
+        stream_audio = on_event is not None and self.audio_delta_mode is not AudioDeltaMode.RESPONSE
+        pending_audio = bytearray()
+        coalesce_bytes = max(2, config.output_sample_rate_hz * self.audio_delta_coalesce_ms // 1000 * 2)
+        response_audio_bytes = 0
+        # Set on response.created until the response's first audio delta arrives
+        response_created_at: Optional[float] = None
         # Track all server-side conversation item IDs so we can clear them
         # after each completed response, keeping the model effectively
         # stateless between turns.
@@ -534,14 +634,14 @@ Do not describe silence or noise.
                     blocksize=config.output_sample_rate_hz // 10,  # ~100ms chunks
                 )
                 audio_output_stream.start()
-                console.print("[bold cyan]Local audio playback enabled[/bold cyan]")
+                self.console.print("[bold cyan]Local audio playback enabled[/bold cyan]")
             except Exception as e:
-                console.print(f"[yellow]Could not initialize audio playback: {e}[/yellow]")
+                self.console.print(f"[yellow]Could not initialize audio playback: {e}[/yellow]")
                 audio_output_stream = None
         else:
-            console.print("[dim]Local audio playback disabled[/dim]")
+            self.console.print("[dim]Local audio playback disabled[/dim]")
 
-        console.print("[bold green]Listening for Azure responses...[/bold green]")
+        self.console.print("[bold green]Listening for Azure responses...[/bold green]")
         try:
             while True:
                 # If streaming is done, wait a bit longer then exit
@@ -550,7 +650,7 @@ Do not describe silence or noise.
                     try:
                         message = await asyncio.wait_for(websocket.recv(), timeout=3.0)
                     except asyncio.TimeoutError:
-                        console.print("[dim]No more responses, closing...[/dim]")
+                        self.console.print("[dim]No more responses, closing...[/dim]")
                         break
                 else:
                     try:
@@ -592,6 +692,7 @@ Do not describe silence or noise.
                         response_in_progress.set()
                     text_segments.clear()
                     audio_transcript = None
+                    response_created_at = time.perf_counter()
                     # Emit event to callback
                     if on_event:
                         on_event({"type": "translation.started"})
@@ -604,13 +705,13 @@ Do not describe silence or noise.
                     # Log text deltas inline
                     delta = event.get("delta", "")
                     if delta:
-                        console.print(f"[dim]→ {delta}[/dim]", end="")
+                        self.console.print(f"[dim]→ {delta}[/dim]", end="")
                         # Emit text delta event to callback
                         if on_event:
                             on_event({"type": "translation.text_delta", "delta": delta})
                 else:
                     # Log other events prominently
-                    console.print(f"[bold blue]Voice Live:[/bold blue] {event_type}")
+                    self.console.print(f"[bold blue]Voice Live:[/bold blue] {event_type}")
                     if event_type not in {"response.output_text.delta", "response.audio_transcript.delta"}:
                         # Only show transcript field if it exists in the event structure
                         def _extract_transcript(value):
@@ -633,10 +734,10 @@ Do not describe silence or noise.
 
                         transcript = _extract_transcript(event)
                         if transcript is not None:
-                            console.log("Event transcript:", transcript)
+                            self.console.log("Event transcript:", transcript)
 
                 if event_type == "response.error" or event_type == "error":
-                    console.print(f"Event: {event_type} - {event}")
+                    self.console.print(f"Event: {event_type} - {event}")
                     error = event.get("error") or {}
                     error_details = error.get("message", str(error))
                     error_code = error.get("code")
@@ -645,13 +746,13 @@ Do not describe silence or noise.
                     # as a soft warning so the session can continue instead of
                     # hard‑failing the whole run.
                     if error_code == "conversation_already_has_active_response":
-                        console.print(
+                        self.console.print(
                             "\n[yellow]Voice Live reported an overlapping response "
                             "(conversation_already_has_active_response); continuing "
                             "and waiting for the active response to finish.[/yellow]"
                         )
                         continue
-                    console.print(
+                    self.console.print(
                         "\n"
                         + Panel(
                             error_details,
@@ -662,29 +763,32 @@ Do not describe silence or noise.
                     break
 
                 if event_type in {"response.completed", "response.done", "response.finished"}:
-                    # Emit the buffered audio to the on_event callback *once* for
-                    # the whole response. This lets upstream callers (e.g. the
-                    # WebSocket server) decide whether to forward it back to ACS.
+                    # Flush the tail of a coalesced block so the next response
+                    # starts on a fresh one
+                    if pending_audio:
+                        self._emit_audio_delta(on_event, config, base64.b64encode(pending_audio).decode("ascii"))
+                        pending_audio.clear()
+
+                    # In response mode, emit the buffered audio to the on_event
+                    # callback *once* for the whole response. This lets upstream
+                    # callers (e.g. the WebSocket server) decide whether to
+                    # forward it back to ACS.
                     if audio_chunks and on_event:
                         combined_audio = b"".join(audio_chunks)
                         if combined_audio:
-                            delta_b64 = base64.b64encode(combined_audio).decode("ascii")
-                            on_event(
-                                {
-                                    "type": "translation.audio_delta",
-                                    "audio": delta_b64,
-                                    "sample_rate": config.output_sample_rate_hz,
-                                    "channels": 1,
-                                    "bits_per_sample": 16,
-                                }
-                            )
+                            self._emit_audio_delta(on_event, config, base64.b64encode(combined_audio).decode("ascii"))
                         # Clear per-response buffer after emitting
                         audio_chunks.clear()
+                    elif audio_chunks:
+                        audio_turns.append(b"".join(audio_chunks))
+                        audio_chunks.clear()
 
-                    if not text_segments and not audio_chunks:
-                        console.print("\n[yellow]Response completed with empty content (no text or audio)[/yellow]")
+                    empty_response = not text_segments and not response_audio_bytes
+                    response_audio_bytes = 0
+                    if empty_response:
+                        self.console.print("\n[yellow]Response completed with empty content (no text or audio)[/yellow]")
                     else:
-                        console.print("\n[bold green]Response completed[/bold green]")
+                        self.console.print("\n[bold green]Response completed[/bold green]")
 
                     # After each completed response, delete all known
                     # conversation items so the next turn starts with a clean
@@ -703,14 +807,14 @@ Do not describe silence or noise.
                                         }
                                     )
                                 )
-                                console.log(
+                                self.console.log(
                                     f"[dim]Deleted conversation item {item_id} "
                                     "to reset Voice Live context[/dim]"
                                 )
                             except Exception:
                                 # Best-effort context reset; don't fail the
                                 # whole session if a delete call has issues.
-                                console.print(
+                                self.console.print(
                                     f"[yellow]Failed to delete conversation item "
                                     f"{item_id}; continuing.[/yellow]"
                                 )
@@ -720,7 +824,7 @@ Do not describe silence or noise.
                     if response_in_progress:
                         response_in_progress.clear()
                     if self._terminate_on_completion:
-                        console.print("[dim]Batch test mode: closing Voice Live session after first response.[/dim]")
+                        self.console.print("[dim]Batch test mode: closing Voice Live session after first response.[/dim]")
                         break
                     # Don't break - continue listening for more responses
                     # The streaming will continue and trigger new responses
@@ -734,14 +838,29 @@ Do not describe silence or noise.
                         on_event({"type": "translation.text_delta", "delta": delta_text})
 
                 if event_type == "response.output_text.done":
-                    console.print()  # New line after text
+                    self.console.print()  # New line after text
                     continue
 
                 if event_type in {"response.output_audio.delta", "response.audio.delta"}:
                     delta = event.get("delta")
                     if delta:
                         audio_data = base64.b64decode(delta)
-                        audio_chunks.append(audio_data)
+                        response_audio_bytes += len(audio_data)
+                        if response_created_at is not None:
+                            metrics.RESPONSE_FIRST_AUDIO_SECONDS.observe(time.perf_counter() - response_created_at)
+                            response_created_at = None
+                        if not stream_audio:
+                            audio_chunks.append(audio_data)
+                        elif self.audio_delta_mode is AudioDeltaMode.DELTA:
+                            # Forward the delta as received; no need to re-encode
+                            self._emit_audio_delta(on_event, config, delta)
+                        else:
+                            pending_audio += audio_data
+                            if len(pending_audio) >= coalesce_bytes:
+                                self._emit_audio_delta(
+                                    on_event, config, base64.b64encode(pending_audio).decode("ascii")
+                                )
+                                pending_audio.clear()
                         # Play audio in real-time if output stream is available
                         if audio_output_stream:
                             try:
@@ -764,14 +883,18 @@ Do not describe silence or noise.
                 transcript = event.get("transcript")
                 if transcript:
                     audio_transcript = transcript
-                    console.print()  # New line after transcript
+                    self.console.print()  # New line after transcript
 
                 if event_type == "input_audio_buffer.speech.recognized":
                     transcript = event.get("transcript")
                     if transcript:
                         recognized_segments.append(transcript)
-                        console.print(f"[dim]Recognized: {transcript}[/dim]")
+                        self.console.print(f"[dim]Recognized: {transcript}[/dim]")
         finally:
+            # Don't drop the last block if the session ends mid-response
+            if pending_audio:
+                self._emit_audio_delta(on_event, config, base64.b64encode(pending_audio).decode("ascii"))
+                pending_audio.clear()
             # Clean up audio output stream
             if audio_output_stream:
                 try:
@@ -794,7 +917,9 @@ Do not describe silence or noise.
             except json.JSONDecodeError:
                 translations = {"response": raw_output}
 
-        synth_audio = b"".join(audio_chunks) if audio_chunks else None
+        if audio_chunks:
+            audio_turns.append(b"".join(audio_chunks))
+        synth_audio = b"".join(audio_turns) if audio_turns else None
 
         if not translations and audio_transcript and self.to_languages:
             translations = {self.to_languages[0]: audio_transcript.strip()}
@@ -825,6 +950,22 @@ Do not describe silence or noise.
 
         return outcome
 
+    @staticmethod
+    def _emit_audio_delta(
+        on_event: Callable[[dict], None],
+        config: VoiceLiveConfig,
+        audio_b64: str,
+    ) -> None:
+        on_event(
+            {
+                "type": "translation.audio_delta",
+                "audio": audio_b64,
+                "sample_rate": config.output_sample_rate_hz,
+                "channels": 1,
+                "bits_per_sample": 16,
+            }
+        )
+
     def _write_wav(
         self,
         *,
@@ -840,7 +981,7 @@ Do not describe silence or noise.
             wav_file.setframerate(sample_rate)
             wav_file.writeframes(audio_bytes)
 
-        console.print(
+        self.console.print(
             Panel.fit(
                 f"Synthesized audio saved to {target_path}",
                 title="Voice Live audio output",
@@ -850,24 +991,25 @@ Do not describe silence or noise.
 
         return target_path
 
-    def _load_wav(self, path: Path) -> tuple[bytes, int, int]:
-        with wave.open(str(path), "rb") as wav_file:
-            sample_width = wav_file.getsampwidth()
-            channels = wav_file.getnchannels()
-            sample_rate = wav_file.getframerate()
-            frames = wav_file.readframes(wav_file.getnframes())
-
-        if sample_width != 2:
-            raise ValueError(
-                f"Unsupported WAV sample width ({sample_width * 8} bit). "
-                "Please provide 16-bit PCM WAV audio."
-            )
+    def _load_wav(self, path: Path) -> tuple[AudioChunk, int, int]:
+        # A view over the mapped file for mono input; the view keeps the mapping alive
+        with WavFile(path) as wav_file:
+            wav_format = wav_file.format
+
+            if wav_format.sample_width != 2:
+                raise ValueError(
+                    f"Unsupported WAV sample width ({wav_format.bits_per_sample} bit). "
+                    "Please provide 16-bit PCM WAV audio."
+                )
+
+            if wav_format.channels not in (1, 2):
+                raise ValueError(f"Unsupported WAV channel count ({wav_format.channels}). Use mono or stereo.")
 
-        if channels not in (1, 2):
-            raise ValueError(f"Unsupported WAV channel count ({channels}). Use mono or stereo.")
+            frames = wav_file.mono_pcm16()
 
+        sample_rate = wav_format.sample_rate
         if sample_rate not in (16000, 24000, 44100, 48000):
-            console.print(
+            self.console.print(
                 Panel(
                     f"Warning: uncommon sample rate {sample_rate} Hz. "
                     "Voice Live typically expects 16 kHz. Consider resampling for best quality.",
@@ -876,20 +1018,7 @@ Do not describe silence or noise.
                 )
             )
 
-        if channels == 2:
-            frames = self._downmix_to_mono(frames)
-            channels = 1
-
-        return frames, sample_rate, channels
-
-    def _downmix_to_mono(self, frames: bytes) -> bytes:
-        import array
-
-        stereo = array.array("h", frames)
-        mono = array.array("h", (0 for _ in range(len(stereo) // 2)))
-        for i in range(0, len(stereo), 2):
-            mono[i // 2] = (stereo[i] + stereo[i + 1]) // 2
-        return mono.tobytes()
+        return frames, sample_rate, 1
 
     def _build_config(self, *, sample_rate: int, channels: int) -> VoiceLiveConfig:
         endpoint = self.settings.endpoint or ""
@@ -0,0 +1,270 @@
+"""Pool of pre-connected, pre-configured Voice Live sessions.
+
+Opening a Voice Live session costs a TLS handshake, authentication and a
+`session.update` round trip. Without a pool all of that happens after the caller's
+first audio frame arrives, i.e. inside the first-utterance latency.
+
+`VoiceLiveConnectionPool` keeps a few sessions per (language pair, voice,
+deployment) connected and configured ahead of time. A new call adopts a warm
+socket if one is available and falls back to connecting itself otherwise. Sessions
+are never returned to the pool: a used session carries conversation state, so it
+is closed when its call ends and the pool opens a fresh one in the background.
+
+A maintenance task closes sessions that have been idle longer than
+`idle_timeout_s` or fail a ping, and tops each key back up to `size` warm
+sessions, subject to `max_total`. Keys nobody has asked for within `key_ttl_s`
+stop being refilled, unless they were registered as pinned (e.g. the server's
+configured language pair).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+import websockets
+from rich.console import Console
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle at runtime
+    from .voice_live import VoiceLiveConfig, VoiceLiveTranslator
+
+console = Console()
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_TOTAL = 16
+DEFAULT_IDLE_TIMEOUT_S = 120.0
+DEFAULT_HEALTH_CHECK_INTERVAL_S = 15.0
+DEFAULT_KEY_TTL_S = 900.0
+PING_TIMEOUT_S = 5.0
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    """Sessions are interchangeable when these match."""
+
+    from_language: str
+    to_languages: tuple[str, ...]
+    voice_name: Optional[str]
+    websocket_url: str  # includes the deployment
+
+    @classmethod
+    def for_config(cls, config: VoiceLiveConfig) -> PoolKey:
+        return cls(
+            from_language=config.from_language,
+            to_languages=tuple(config.to_languages),
+            voice_name=config.voice_name,
+            websocket_url=config.websocket_url,
+        )
+
+
+@dataclass
+class _IdleSession:
+    websocket: websockets.WebSocketClientProtocol
+    ready_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _KeyState:
+    translator: VoiceLiveTranslator
+    config: VoiceLiveConfig
+    idle: deque[_IdleSession] = field(default_factory=deque)
+    opening: int = 0
+    last_wanted: float = field(default_factory=time.monotonic)
+    pinned: bool = False
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    opened: int = 0
+    open_failures: int = 0
+    expired: int = 0
+    unhealthy: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(self.__dict__)
+
+
+class VoiceLiveConnectionPool:
+    """Warm Voice Live sessions keyed by `PoolKey`; use from a single event loop."""
+
+    def __init__(
+        self,
+        *,
+        size: int = DEFAULT_POOL_SIZE,
+        max_total: int = DEFAULT_MAX_TOTAL,
+        idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+        health_check_interval_s: float = DEFAULT_HEALTH_CHECK_INTERVAL_S,
+        key_ttl_s: float = DEFAULT_KEY_TTL_S,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1 (got {size}).")
+        if max_total < size:
+            raise ValueError(f"Pool max_total ({max_total}) must be at least the per-key size ({size}).")
+        self.size = size
+        self.max_total = max_total
+        self.idle_timeout_s = idle_timeout_s
+        self.health_check_interval_s = health_check_interval_s
+        self.key_ttl_s = key_ttl_s
+        self.stats = PoolStats()
+        self._keys: dict[PoolKey, _KeyState] = {}
+        self._maintenance: Optional[asyncio.Task] = None
+        # Strong references to in-flight opens so they are not garbage collected
+        self._open_tasks: set[asyncio.Task] = set()
+        self._closed = False
+
+    # ------------------------------------------------------------------ public API
+
+    def register(
+        self,
+        translator: VoiceLiveTranslator,
+        config: VoiceLiveConfig,
+        *,
+        pinned: bool = False,
+    ) -> PoolKey:
+        """Start keeping warm sessions for this translator's key (e.g. at server start).
+
+        Pinned keys are kept warm even when no call has used them for `key_ttl_s`.
+        """
+        key = PoolKey.for_config(config)
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _KeyState(translator=translator, config=config)
+        else:
+            # Later calls may carry newer settings; refills use the latest
+            state.translator = translator
+            state.config = config
+        state.last_wanted = time.monotonic()
+        state.pinned = state.pinned or pinned
+        self._ensure_maintenance()
+        self._refill(key, state)
+        return key
+
+    def acquire(
+        self,
+        translator: VoiceLiveTranslator,
+        config: VoiceLiveConfig,
+    ) -> Optional[websockets.WebSocketClientProtocol]:
+        """Take a configured session for `config`, or None if none is warm.
+
+        The caller owns the returned socket and must close it.
+        """
+        key = self.register(translator, config)
+        state = self._keys[key]
+        while state.idle:
+            idle = state.idle.popleft()
+            if idle.websocket.open:
+                self.stats.hits += 1
+                self._refill(key, state)
+                return idle.websocket
+            self.stats.unhealthy += 1
+        self.stats.misses += 1
+        return None
+
+    @property
+    def idle_count(self) -> int:
+        return sum(len(state.idle) for state in self._keys.values())
+
+    async def close(self) -> None:
+        """Stop maintenance and close every idle session."""
+        self._closed = True
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+            try:
+                await self._maintenance
+            except asyncio.CancelledError:
+                pass
+        for task in list(self._open_tasks):
+            task.cancel()
+        await asyncio.gather(*self._open_tasks, return_exceptions=True)
+        sessions = [idle.websocket for state in self._keys.values() for idle in state.idle]
+        for state in self._keys.values():
+            state.idle.clear()
+        await asyncio.gather(*(ws.close() for ws in sessions), return_exceptions=True)
+
+    # ------------------------------------------------------------------ internals
+
+    def _ensure_maintenance(self) -> None:
+        if self._maintenance is None and not self._closed:
+            self._maintenance = asyncio.create_task(self._run_maintenance())
+
+    def _refill(self, key: PoolKey, state: _KeyState) -> None:
+        """Open sessions in the background until the key has `size` warm or opening."""
+        if self._closed:
+            return
+        total = sum(len(s.idle) + s.opening for s in self._keys.values())
+        missing = min(self.size - len(state.idle) - state.opening, self.max_total - total)
+        for _ in range(max(0, missing)):
+            state.opening += 1
+            task = asyncio.create_task(self._open(key, state))
+            self._open_tasks.add(task)
+            task.add_done_callback(self._open_tasks.discard)
+
+    async def _open(self, key: PoolKey, state: _KeyState) -> None:
+        try:
+            websocket = await state.translator.open_session(state.config)
+        except Exception as exc:
+            self.stats.open_failures += 1
+            logger.warning("Could not pre-open Voice Live session for %s: %s", key.websocket_url, exc)
+            return
+        finally:
+            state.opening -= 1
+        if self._closed or self._keys.get(key) is not state:
+            await websocket.close()
+            return
+        self.stats.opened += 1
+        state.idle.append(_IdleSession(websocket))
+
+    async def _run_maintenance(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_s)
+            try:
+                await self._check_sessions()
+            except Exception:  # pragma: no cover - keep the pool alive
+                logger.exception("Voice Live pool maintenance failed")
+
+    async def _check_sessions(self) -> None:
+        now = time.monotonic()
+        to_close: list[websockets.WebSocketClientProtocol] = []
+        for state in self._keys.values():
+            for idle in [idle for idle in state.idle if now - idle.ready_at > self.idle_timeout_s]:
+                state.idle.remove(idle)
+                self.stats.expired += 1
+                to_close.append(idle.websocket)
+
+        # Ping every remaining session at once. They stay in the pool while being
+        # checked, so calls arriving meanwhile still get a warm session.
+        checks = [(state, idle) for state in self._keys.values() for idle in state.idle]
+        results = await asyncio.gather(*(self._healthy(idle.websocket) for _, idle in checks))
+        for (state, idle), healthy in zip(checks, results):
+            # Skip sessions a call adopted while the ping was in flight
+            if healthy or not any(entry is idle for entry in state.idle):
+                continue
+            state.idle.remove(idle)
+            self.stats.unhealthy += 1
+            to_close.append(idle.websocket)
+        await asyncio.gather(*(websocket.close() for websocket in to_close), return_exceptions=True)
+
+        for key, state in list(self._keys.items()):
+            if not state.pinned and now - state.last_wanted > self.key_ttl_s:
+                if not state.idle and not state.opening:
+                    del self._keys[key]
+                continue
+            self._refill(key, state)
+
+    @staticmethod
+    async def _healthy(websocket: websockets.WebSocketClientProtocol) -> bool:
+        if not websocket.open:
+            return False
+        try:
+            pong = await websocket.ping()
+            await asyncio.wait_for(pong, timeout=PING_TIMEOUT_S)
+        except Exception:
+            return False
+        return True
@@ -0,0 +1,196 @@
+"""Shared, memory-mapped access to PCM WAV files.
+
+Every file-based audio path (CLI inputs, Voice Live file translation, the ACS
+emulator and the evaluation sender) reads WAVs through `WavFile`. The header is
+parsed once and the sample data is served as zero-copy `memoryview` slices of
+an `mmap`, so chunking a file costs no reads or copies until the bytes are
+actually sent, and the pages are shared between concurrent sessions playing the
+same clip.
+
+Views keep the mapping alive on their own: closing a `WavFile` while a chunk is
+still referenced (e.g. queued for sending) is safe, and the mapping is released
+when the last view goes away.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Union
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# numpy dtypes for the PCM sample widths we can vectorise (8-bit WAV is unsigned)
+_SAMPLE_DTYPES = {1: np.dtype("u1"), 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+
+
+class WavFormatError(ValueError):
+    """The file is not a PCM WAV this module can read."""
+
+
+@dataclass(frozen=True)
+class WavFormat:
+    sample_rate: int
+    channels: int
+    sample_width: int  # bytes per sample
+
+    @property
+    def bits_per_sample(self) -> int:
+        return self.sample_width * 8
+
+    @property
+    def frame_bytes(self) -> int:
+        return self.channels * self.sample_width
+
+    def frames_for_ms(self, duration_ms: float) -> int:
+        return int(self.sample_rate * duration_ms / 1000)
+
+
+class WavFile:
+    """A PCM WAV file mapped read-only into memory."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise WavFormatError(f"{self.path} is empty") from exc
+        try:
+            self.format, data_offset, data_length = _parse_header(self._mmap, self.path)
+        except Exception:
+            self._mmap.close()
+            raise
+        # Ignore a trailing partial frame, as the wave module does
+        data_length -= data_length % self.format.frame_bytes
+        self._data = memoryview(self._mmap)[data_offset : data_offset + data_length]
+        self.num_frames = data_length // self.format.frame_bytes
+
+    @property
+    def data(self) -> memoryview:
+        """View of all sample data; valid after the file is closed."""
+        return self._data[:]
+
+    @property
+    def duration_s(self) -> float:
+        return self.num_frames / self.format.sample_rate if self.format.sample_rate else 0.0
+
+    def frames(self, start: int, count: int) -> memoryview:
+        """View of `count` frames starting at frame `start` (clamped to the file)."""
+        frame_bytes = self.format.frame_bytes
+        return self._data[start * frame_bytes : (start + count) * frame_bytes]
+
+    def chunks(self, frames_per_chunk: int) -> Iterator[memoryview]:
+        """Consecutive views of `frames_per_chunk` frames; the last may be shorter."""
+        step = max(1, frames_per_chunk) * self.format.frame_bytes
+        data = self._data
+        for offset in range(0, len(data), step):
+            yield data[offset : offset + step]
+
+    def samples(self) -> np.ndarray:
+        """Read-only (frames, channels) array over the mapped samples."""
+        dtype = _SAMPLE_DTYPES.get(self.format.sample_width)
+        if dtype is None:
+            raise WavFormatError(f"{self.format.bits_per_sample}-bit samples are not supported in {self.path}")
+        return np.frombuffer(self.data, dtype=dtype).reshape(-1, self.format.channels)
+
+    def mono_pcm16(self) -> Union[memoryview, bytes]:
+        """16-bit mono PCM: the mapped data itself if already mono, else a downmix."""
+        if self.format.sample_width != 2:
+            raise WavFormatError(f"{self.path} is {self.format.bits_per_sample}-bit; 16-bit PCM is required")
+        if self.format.channels == 1:
+            return self.data
+        return downmix_to_mono(self.data, self.format.channels)
+
+    def close(self) -> None:
+        self._data.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Chunks handed out earlier still reference the mapping; it is
+            # unmapped when the last of them is released
+            pass
+
+    def __enter__(self) -> "WavFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_wav_format(path: Union[str, Path]) -> WavFormat:
+    """Format of a WAV file; headers are parsed once per file version."""
+    stat = os.stat(path)
+    return _cached_format(str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _cached_format(path: str, size: int, mtime_ns: int) -> WavFormat:
+    with WavFile(path) as wav:
+        return wav.format
+
+
+def downmix_to_mono(pcm, channels: int) -> bytes:
+    """Average interleaved 16-bit PCM channels into one (rounding down like `//`)."""
+    if channels == 1:
+        return bytes(pcm)
+    frames = np.frombuffer(pcm, dtype="<i2")
+    usable = len(frames) - len(frames) % channels
+    mixed = frames[:usable].reshape(-1, channels).sum(axis=1, dtype=np.int32) // channels
+    return mixed.astype("<i2").tobytes()
+
+
+def _parse_header(buffer: mmap.mmap, path: Path) -> tuple[WavFormat, int, int]:
+    """Return (format, data offset, data length) from a RIFF/WAVE header."""
+    size = len(buffer)
+    if size < 12 or buffer[0:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+        raise WavFormatError(f"{path} is not a RIFF/WAVE file")
+
+    wav_format = None
+    offset = 12
+    while offset + 8 <= size:
+        chunk_id = buffer[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", buffer, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            wav_format = _parse_fmt(buffer, body, chunk_size, path)
+        elif chunk_id == b"data":
+            if wav_format is None:
+                raise WavFormatError(f"{path} has a data chunk before its fmt chunk")
+            # Streamed writers may leave the size unset or too large
+            return wav_format, body, min(chunk_size, size - body)
+        offset = body + chunk_size + (chunk_size & 1)
+    raise WavFormatError(f"{path} has no data chunk")
+
+
+def _parse_fmt(buffer: mmap.mmap, offset: int, length: int, path: Path) -> WavFormat:
+    if length < 16:
+        raise WavFormatError(f"{path} has a truncated fmt chunk")
+    format_tag, channels, sample_rate, _byte_rate, block_align, bits = struct.unpack_from(
+        "<HHIIHH", buffer, offset
+    )
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and length >= 40:
+        # The sub-format GUID starts with the real format tag
+        (format_tag,) = struct.unpack_from("<H", buffer, offset + 24)
+    if format_tag != WAVE_FORMAT_PCM:
+        raise WavFormatError(f"{path} is not PCM (format tag {format_tag:#06x})")
+    if channels < 1 or sample_rate < 1:
+        raise WavFormatError(f"{path} has an invalid fmt chunk")
+    sample_width = (bits + 7) // 8 or block_align // channels
+    return WavFormat(sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+
+
+__all__ = [
+    "WavFile",
+    "WavFormat",
+    "WavFormatError",
+    "downmix_to_mono",
+    "read_wav_format",
+]
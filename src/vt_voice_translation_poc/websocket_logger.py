@@ -2,18 +2,349 @@
 
 This module provides a wrapper class that logs all JSON messages sent and received
 through a WebSocket connection. Useful for debugging and analyzing WebSocket communication.
+
+Logging never touches the disk on the caller's thread: `WebSocketLogger` only
+samples the message and hands it to a shared background writer thread, which
+formats, truncates and writes it. The writer's queue is bounded (messages are
+dropped and counted rather than growing memory when the disk falls behind) and
+log files rotate once they reach a size limit.
+
+Behaviour is configured through environment variables (see `WireLogConfig`):
+
+    WIRE_LOG__MODE               shared (default, one JSONL file for all sessions),
+                                 session (one JSONL file per connection),
+                                 text (legacy pretty-printed log) or off
+    WIRE_LOG__DIR                overrides the directory passed by the caller
+    WIRE_LOG__MAX_PAYLOAD_CHARS  longer string values (base64 audio) are replaced by a
+                                 placeholder; 0 keeps payloads intact (default 256)
+    WIRE_LOG__SAMPLE_RATES       per-type fraction of messages kept, e.g.
+                                 "AudioData=0.02,input_audio_buffer.append=0.05"
+    WIRE_LOG__MAX_BYTES          rotate a log file at this size (default 50 MB)
+    WIRE_LOG__BACKUP_COUNT       rotated files kept per log (default 3)
+    WIRE_LOG__QUEUE_SIZE         messages buffered for the writer (default 10000)
+
+Each process rotates the files it writes, so processes must not share one.
+Under `serve --workers N` every worker sets WIRE_LOG__WORKER to its slot, and
+shared and text logs become `<name>-worker<slot>.jsonl` (`.log` for text).
 """
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
 import logging
+import os
+import queue
+import re
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, TextIO, Union
 
 logger = logging.getLogger(__name__)
 
+WIRE_LOG_MODE_ENV = "WIRE_LOG__MODE"
+WIRE_LOG_DIR_ENV = "WIRE_LOG__DIR"
+WIRE_LOG_MAX_PAYLOAD_CHARS_ENV = "WIRE_LOG__MAX_PAYLOAD_CHARS"
+WIRE_LOG_SAMPLE_RATES_ENV = "WIRE_LOG__SAMPLE_RATES"
+WIRE_LOG_MAX_BYTES_ENV = "WIRE_LOG__MAX_BYTES"
+WIRE_LOG_BACKUP_COUNT_ENV = "WIRE_LOG__BACKUP_COUNT"
+WIRE_LOG_QUEUE_SIZE_ENV = "WIRE_LOG__QUEUE_SIZE"
+# Set by the worker supervisor in each worker process
+WIRE_LOG_WORKER_ENV = "WIRE_LOG__WORKER"
+
+# Only the head of a message is scanned for its type when sampling
+_TYPE_PATTERN = re.compile(r'"(?:type|kind)"\s*:\s*"([^"]+)"')
+_TYPE_SCAN_CHARS = 256
+
+
+class WireLogMode(str, Enum):
+    """Where wire messages are written."""
+
+    SHARED = "shared"  # One JSONL file per log name, shared by all sessions
+    SESSION = "session"  # One JSONL file per connection
+    TEXT = "text"  # Legacy pretty-printed log, one file per log name
+    OFF = "off"
+
+
+@dataclass(frozen=True)
+class WireLogConfig:
+    """Wire logging settings, normally loaded from the environment."""
+
+    mode: WireLogMode = WireLogMode.SHARED
+    log_dir: Optional[Path] = None
+    max_payload_chars: int = 256
+    sample_rates: dict[str, float] = field(default_factory=dict)
+    max_bytes: int = 50 * 1024 * 1024
+    backup_count: int = 3
+    queue_size: int = 10000
+    worker: Optional[int] = None  # Worker slot under `serve --workers`
+
+    @classmethod
+    def from_env(cls) -> "WireLogConfig":
+        mode_raw = os.getenv(WIRE_LOG_MODE_ENV, WireLogMode.SHARED.value).strip().lower()
+        try:
+            mode = WireLogMode(mode_raw)
+        except ValueError as exc:
+            valid = ", ".join(m.value for m in WireLogMode)
+            raise RuntimeError(f"Invalid value for {WIRE_LOG_MODE_ENV}: {mode_raw} (expected one of {valid})") from exc
+
+        log_dir_raw = os.getenv(WIRE_LOG_DIR_ENV)
+        worker_raw = os.getenv(WIRE_LOG_WORKER_ENV)
+        return cls(
+            mode=mode,
+            log_dir=Path(log_dir_raw) if log_dir_raw else None,
+            max_payload_chars=_int_from_env(WIRE_LOG_MAX_PAYLOAD_CHARS_ENV, 256),
+            sample_rates=_parse_sample_rates(os.getenv(WIRE_LOG_SAMPLE_RATES_ENV, "")),
+            max_bytes=_int_from_env(WIRE_LOG_MAX_BYTES_ENV, 50 * 1024 * 1024),
+            backup_count=_int_from_env(WIRE_LOG_BACKUP_COUNT_ENV, 3),
+            queue_size=_int_from_env(WIRE_LOG_QUEUE_SIZE_ENV, 10000),
+            worker=_int_from_env(WIRE_LOG_WORKER_ENV, 0) if worker_raw else None,
+        )
+
+    def sample_period(self, message_type: str) -> int:
+        """Keep one message in N for this type; 0 means drop all."""
+        rate = self.sample_rates.get(message_type, 1.0)
+        if rate <= 0:
+            return 0
+        return max(1, round(1 / min(rate, 1.0)))
+
+
+def _int_from_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid value for {name}: {raw}") from exc
+    if value < 0:
+        raise RuntimeError(f"Invalid value for {name}: {raw} (must be >= 0)")
+    return value
+
+
+def _parse_sample_rates(raw: str) -> dict[str, float]:
+    rates: dict[str, float] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        try:
+            if not sep:
+                raise ValueError
+            rates[name.strip()] = float(value)
+        except ValueError as exc:
+            raise RuntimeError(
+                f"Invalid entry in {WIRE_LOG_SAMPLE_RATES_ENV}: {item!r} (expected <type>=<rate>)"
+            ) from exc
+    return rates
+
+
+_default_config: Optional[WireLogConfig] = None
+
+
+def get_wire_log_config() -> WireLogConfig:
+    """Config from the environment, read once (after any .env file was loaded)."""
+    global _default_config
+    if _default_config is None:
+        _default_config = WireLogConfig.from_env()
+    return _default_config
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Entry:
+    path: Path
+    mode: WireLogMode
+    session_id: str
+    direction: str
+    count: int
+    timestamp: str
+    message: Union[str, bytes, None]
+    max_payload_chars: int
+    text: Optional[str] = None  # Pre-rendered line (headers/footers)
+
+
+_CLOSE = object()
+
+
+class _OpenLog:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle: TextIO = open(path, "a", encoding="utf-8")
+        self.size = path.stat().st_size
+
+
+class WireLogWriter:
+    """Single background thread that formats and writes wire log entries for all loggers."""
+
+    def __init__(self, queue_size: int, max_bytes: int, backup_count: int) -> None:
+        self.queue_size = queue_size
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        # Unbounded so control items (close/flush) always get through; submit()
+        # enforces queue_size for log entries
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._files: dict[Path, _OpenLog] = {}
+        self._thread = threading.Thread(target=self._run, name="wire-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> None:
+        """Queue an entry; never blocks. Entries are dropped when the queue is full."""
+        if self.queue_size and self._queue.qsize() >= self.queue_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("Wire log queue full; %d message(s) dropped so far", self.dropped)
+            return
+        self._queue.put(item)
+
+    def release(self, path: Path) -> None:
+        """Close a file once everything queued for it has been written."""
+        self._queue.put((_CLOSE, path))
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait (bounded) for queued entries to be written."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if isinstance(item, threading.Event):
+                    for open_log in self._files.values():
+                        open_log.handle.flush()
+                    item.set()
+                elif isinstance(item, tuple) and item[0] is _CLOSE:
+                    open_log = self._files.pop(item[1], None)
+                    if open_log is not None:
+                        open_log.handle.close()
+                else:
+                    self._write(item)
+            except Exception as exc:  # pragma: no cover - logging must never break the writer
+                logger.error("Failed to write wire log entry: %s", exc)
+
+    def _write(self, entry: _Entry) -> None:
+        line = entry.text if entry.text is not None else _format_entry(entry)
+        open_log = self._files.get(entry.path)
+        if open_log is None:
+            open_log = self._files[entry.path] = _OpenLog(entry.path)
+        encoded_size = len(line.encode("utf-8"))
+        if self.max_bytes and open_log.size and open_log.size + encoded_size > self.max_bytes:
+            open_log = self._rotate(open_log)
+        open_log.handle.write(line)
+        open_log.size += encoded_size
+        if self._queue.empty():
+            open_log.handle.flush()
+
+    def _rotate(self, open_log: _OpenLog) -> _OpenLog:
+        open_log.handle.close()
+        path = open_log.path
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = path.with_name(f"{path.name}.{index}")
+                if source.exists():
+                    source.replace(path.with_name(f"{path.name}.{index + 1}"))
+            path.replace(path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink(missing_ok=True)
+        rotated = self._files[path] = _OpenLog(path)
+        return rotated
+
+
+def _truncate_payload(value: Any, limit: int) -> Any:
+    """Replace long strings (base64 audio) with a placeholder describing their size."""
+    if isinstance(value, str):
+        if len(value) > limit:
+            return f"<{len(value)} chars omitted>"
+        return value
+    if isinstance(value, dict):
+        return {key: _truncate_payload(item, limit) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_truncate_payload(item, limit) for item in value]
+    return value
+
+
+def _decode_payload(message: Union[str, bytes, None]) -> tuple[Any, Optional[str]]:
+    """Return (parsed JSON or raw text, message type)."""
+    if isinstance(message, bytes):
+        try:
+            message = message.decode("utf-8")
+        except UnicodeDecodeError:
+            return None, None
+    if not isinstance(message, str):
+        return None, None
+    try:
+        parsed = json.loads(message)
+    except (json.JSONDecodeError, ValueError):
+        return message, None
+    message_type = parsed.get("type", parsed.get("kind", "unknown")) if isinstance(parsed, dict) else None
+    return parsed, message_type
+
+
+def _format_entry(entry: _Entry) -> str:
+    size = len(entry.message) if entry.message is not None else 0
+    parsed, message_type = _decode_payload(entry.message)
+    is_binary = isinstance(entry.message, bytes) and parsed is None
+    if entry.max_payload_chars and not is_binary:
+        parsed = _truncate_payload(parsed, entry.max_payload_chars)
+
+    if entry.mode is WireLogMode.TEXT:
+        separator = "-" * 80
+        header = f"\n{separator}\n[{entry.timestamp}] {entry.direction} #{entry.count} ({entry.session_id})\n{separator}\n"
+        if message_type is not None:
+            header += f"Type: {message_type}\n{separator}\n"
+        if is_binary:
+            body = f"<binary data: {size} bytes>"
+        elif isinstance(parsed, (dict, list)):
+            body = json.dumps(parsed, indent=2)
+        else:
+            body = str(parsed)
+        return f"{header}{body}\n"
+
+    record = {
+        "ts": entry.timestamp,
+        "session": entry.session_id,
+        "dir": entry.direction,
+        "seq": entry.count,
+        "type": message_type,
+        "bytes": size,
+    }
+    if not is_binary:
+        record["payload"] = parsed
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+_writer: Optional[WireLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_wire_log_writer(config: WireLogConfig) -> WireLogWriter:
+    """Process-wide writer, started on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WireLogWriter(config.queue_size, config.max_bytes, config.backup_count)
+            atexit.register(_writer.flush)
+        return _writer
+
+
+# ---------------------------------------------------------------------------
+# WebSocket wrapper
+# ---------------------------------------------------------------------------
+
 
 class WebSocketLogger:
     """
@@ -38,8 +369,10 @@ class WebSocketLogger:
     Attributes:
         websocket: The underlying WebSocket connection
         log_file: Path to the log file
+        session_id: Identifier written with every entry
         message_count: Counter for sent messages
         receive_count: Counter for received messages
+        sampled_out: Messages skipped by the per-type sampling rates
     """
 
     def __init__(
@@ -47,35 +380,55 @@ class WebSocketLogger:
         websocket: Any,
         log_file: Union[str, Path] = "sent_messages.log",
         log_dir: Optional[Union[str, Path]] = None,
+        *,
+        session_id: Optional[str] = None,
+        config: Optional[WireLogConfig] = None,
     ) -> None:
         """
         Initialize the WebSocket logger.
 
         Args:
             websocket: The WebSocket connection to wrap
-            log_file: Name of the log file (default: "sent_messages.log")
+            log_file: Name of the log file (default: "sent_messages.log"); JSONL modes
+                use the same name with a ".jsonl" suffix
             log_dir: Directory for log file. If None, uses current directory.
+            session_id: Identifier for this connection (random if omitted)
+            config: Logging settings; defaults to the environment configuration
         """
         self.websocket = websocket
+        self.config = config or get_wire_log_config()
+        self.session_id = session_id or uuid.uuid4().hex[:12]
         self.message_count = 0
         self.receive_count = 0
-
-        # Set up log file path
-        if log_dir:
-            log_path = Path(log_dir) / log_file
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            log_path = Path(log_file)
-
-        self.log_file = log_path
-
-        # Create/clear log file with header
-        with open(self.log_file, "w") as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"WebSocket Communication Log - Started at {datetime.now().isoformat()}\n")
-            f.write("=" * 80 + "\n\n")
-
-        logger.info(f"WebSocket logging initialized: {self.log_file}")
+        self.sampled_out = 0
+        self._type_counters: dict[str, itertools.count] = {}
+        self._closed = False
+
+        directory = self.config.log_dir or (Path(log_dir) if log_dir else Path("."))
+        log_name = Path(log_file)
+        if self.config.worker is not None and self.config.mode in (WireLogMode.SHARED, WireLogMode.TEXT):
+            # Worker processes each rotate their own file
+            log_name = log_name.with_name(f"{log_name.stem}-worker{self.config.worker}{log_name.suffix}")
+        if self.config.mode is WireLogMode.SESSION:
+            safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", self.session_id)
+            log_name = log_name.with_name(f"{log_name.stem}-{safe_id}.jsonl")
+        elif self.config.mode is WireLogMode.SHARED:
+            log_name = log_name.with_suffix(".jsonl")
+        self.log_file = directory / log_name
+
+        self._writer: Optional[WireLogWriter] = None
+        if self.config.mode is not WireLogMode.OFF:
+            self._writer = get_wire_log_writer(self.config)
+            if self.config.mode is WireLogMode.SESSION:
+                # Close this connection's file even if close_log() is never called
+                weakref.finalize(self, self._writer.release, self.log_file)
+            if self.config.mode is WireLogMode.TEXT:
+                self._submit_text(
+                    "=" * 80 + "\n"
+                    f"WebSocket Communication Log - Session {self.session_id} started at {datetime.now().isoformat()}\n"
+                    + "=" * 80 + "\n\n"
+                )
+            logger.info(f"WebSocket logging initialized: {self.log_file}")
 
     async def send(self, message: Union[str, bytes]) -> None:
         """
@@ -85,7 +438,7 @@ class WebSocketLogger:
             message: The message to send (string or bytes)
         """
         # Log the outgoing message
-        self._log_message("SENDING", message)
+        self._log_message("SENT", message)
 
         # Send through underlying websocket
         await self.websocket.send(message)
@@ -138,14 +491,12 @@ class WebSocketLogger:
 
     def _log_message(self, direction: str, message: Union[str, bytes]) -> None:
         """
-        Log a message to the log file with formatting.
+        Queue a message for the background writer, subject to sampling.
 
         Args:
             direction: "SENT" or "RECV"
             message: The message to log
         """
-        timestamp = datetime.now().isoformat()
-
         # Increment appropriate counter
         if direction == "SENT":
             self.message_count += 1
@@ -154,42 +505,58 @@ class WebSocketLogger:
             self.receive_count += 1
             count = self.receive_count
 
-        # Prepare log entry
-        separator = "-" * 80
-        header = f"\n{separator}\n[{timestamp}] {direction} #{count}\n{separator}\n"
+        if self._writer is None:
+            return
+
+        if self.config.sample_rates:
+            message_type = self._peek_type(message)
+            period = self.config.sample_period(message_type)
+            counter = self._type_counters.setdefault(message_type, itertools.count())
+            if period == 0 or next(counter) % period:
+                self.sampled_out += 1
+                return
+
+        self._writer.submit(
+            _Entry(
+                path=self.log_file,
+                mode=self.config.mode,
+                session_id=self.session_id,
+                direction=direction,
+                count=count,
+                timestamp=datetime.now().isoformat(),
+                message=message,
+                max_payload_chars=self.config.max_payload_chars,
+            )
+        )
 
-        # Try to parse and pretty-print JSON
-        if isinstance(message, str):
-            try:
-                parsed = json.loads(message)
-                formatted_message = json.dumps(parsed, indent=2)
-                message_type = parsed.get("type", parsed.get("kind", "unknown"))
-                header += f"Type: {message_type}\n{separator}\n"
-            except (json.JSONDecodeError, ValueError):
-                # Not JSON, log as-is
-                formatted_message = message
-        elif isinstance(message, bytes):
-            # Try to decode bytes as JSON
-            try:
-                decoded = message.decode("utf-8")
-                parsed = json.loads(decoded)
-                formatted_message = json.dumps(parsed, indent=2)
-                message_type = parsed.get("type", parsed.get("kind", "unknown"))
-                header += f"Type: {message_type}\n{separator}\n"
-            except (UnicodeDecodeError, json.JSONDecodeError, ValueError):
-                # Binary data, log size
-                formatted_message = f"<binary data: {len(message)} bytes>"
+    @staticmethod
+    def _peek_type(message: Union[str, bytes]) -> str:
+        """Cheap type lookup for sampling; avoids parsing the whole message."""
+        if isinstance(message, bytes):
+            head = message[:_TYPE_SCAN_CHARS].decode("utf-8", errors="ignore")
+            if not head.lstrip().startswith("{"):
+                return "binary"
         else:
-            formatted_message = str(message)
-
-        # Write to log file
-        try:
-            with open(self.log_file, "a") as f:
-                f.write(header)
-                f.write(formatted_message)
-                f.write("\n")
-        except Exception as e:
-            logger.error(f"Failed to write to log file {self.log_file}: {e}")
+            head = message[:_TYPE_SCAN_CHARS]
+        match = _TYPE_PATTERN.search(head)
+        return match.group(1) if match else "unknown"
+
+    def _submit_text(self, text: str) -> None:
+        if self._writer is None:
+            return
+        self._writer.submit(
+            _Entry(
+                path=self.log_file,
+                mode=self.config.mode,
+                session_id=self.session_id,
+                direction="",
+                count=0,
+                timestamp="",
+                message=None,
+                max_payload_chars=0,
+                text=text,
+            )
+        )
 
     def close_log(self) -> None:
         """
@@ -197,24 +564,25 @@ class WebSocketLogger:
 
         Note: Does not close the underlying WebSocket connection.
         """
-        timestamp = datetime.now().isoformat()
-        footer = (
-            f"\n\n{'=' * 80}\n"
-            f"WebSocket Communication Log - Ended at {timestamp}\n"
-            f"Total Messages Sent: {self.message_count}\n"
-            f"Total Messages Received: {self.receive_count}\n"
-            f"{'=' * 80}\n"
-        )
-
-        try:
-            with open(self.log_file, "a") as f:
-                f.write(footer)
-        except Exception as e:
-            logger.error(f"Failed to write footer to log file {self.log_file}: {e}")
+        if self._closed:
+            return
+        self._closed = True
+
+        if self.config.mode is WireLogMode.TEXT:
+            timestamp = datetime.now().isoformat()
+            self._submit_text(
+                f"\n\n{'=' * 80}\n"
+                f"WebSocket Communication Log - Session {self.session_id} ended at {timestamp}\n"
+                f"Total Messages Sent: {self.message_count}\n"
+                f"Total Messages Received: {self.receive_count}\n"
+                f"{'=' * 80}\n"
+            )
+        elif self._writer is not None and self.config.mode is WireLogMode.SESSION:
+            self._writer.release(self.log_file)
 
         logger.info(
             f"WebSocket logging closed: {self.message_count} sent, "
-            f"{self.receive_count} received"
+            f"{self.receive_count} received, {self.sampled_out} sampled out"
         )
 
     # Proxy other WebSocket attributes/methods
@@ -248,4 +616,4 @@ class WebSocketLogger:
         return (
             f"WebSocketLogger(log_file={self.log_file}, "
             f"sent={self.message_count}, recv={self.receive_count})"
-        )
\ No newline at end of file
+        )
@@ -7,9 +7,12 @@ import base64
 import json
 import logging
 import threading
-from collections import deque
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from http import HTTPStatus
 from typing import Optional, Union
+from urllib.parse import parse_qs, urlsplit
 
 import azure.cognitiveservices.speech as speechsdk
 import numpy as np
@@ -19,9 +22,40 @@ from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
 from rich.console import Console
 from rich.panel import Panel
 
-from .audio import AudioInput, AudioSourceType
-from .config import SpeechServiceSettings
+from .acks import (
+    DEFAULT_ACK_EVERY,
+    DEFAULT_ACK_INTERVAL_MS,
+    DEFAULT_ACK_POLICY,
+    AckPolicy,
+    AckSettings,
+    AckTracker,
+)
+from .audio import (
+    DEFAULT_CHUNK_DURATION_MS,
+    END_OF_STREAM,
+    AudioChunkChannel,
+    AudioInput,
+    AudioSourceType,
+    PcmRingBuffer,
+)
+from .binary_framing import BINARY_SUBPROTOCOL, FrameDecodeError, decode_frame
+from .config import SpeechProvider, SpeechServiceSettings
+from . import metrics
+from .models import DEFAULT_SESSION_HISTORY_TURNS
+from .outbound import (
+    DEFAULT_HIGH_WATERMARK,
+    DEFAULT_LOW_WATERMARK,
+    DEFAULT_MAX_SIZE,
+    KIND_AUDIO,
+    KIND_CONTROL,
+    KIND_TEXT,
+    OutboundDropPolicy,
+    OutboundQueue,
+)
 from .providers import create_translator
+from .resampler import StreamingResampler, downmix_to_mono
+from .voice_live import DEFAULT_AUDIO_DELTA_COALESCE_MS, AudioDeltaMode
+from .voice_live_pool import DEFAULT_IDLE_TIMEOUT_S, DEFAULT_POOL_SIZE, VoiceLiveConnectionPool
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -30,6 +64,9 @@ logger = logging.getLogger(__name__)
 TARGET_SAMPLE_RATE = 16000
 TARGET_CHANNELS = 1
 TARGET_BITS_PER_SAMPLE = 16
+# Bounds for the per-session chunk duration (the `chunk_ms` query parameter)
+MIN_CHUNK_DURATION_MS = 10
+MAX_CHUNK_DURATION_MS = 1000
 
 
 class WebSocketServer:
@@ -47,6 +84,18 @@ class WebSocketServer:
         play_input_audio: bool = False,
         play_azure_audio: bool = False,
         testing_mode: bool = False,
+        outbound_high_watermark: int = DEFAULT_HIGH_WATERMARK,
+        outbound_low_watermark: int = DEFAULT_LOW_WATERMARK,
+        outbound_drop_policy: OutboundDropPolicy = OutboundDropPolicy.TEXT,
+        chunk_duration_ms: int = DEFAULT_CHUNK_DURATION_MS,
+        ack_policy: AckPolicy = DEFAULT_ACK_POLICY,
+        ack_every: int = DEFAULT_ACK_EVERY,
+        ack_interval_ms: int = DEFAULT_ACK_INTERVAL_MS,
+        audio_delta_mode: AudioDeltaMode = AudioDeltaMode.COALESCED,
+        audio_delta_coalesce_ms: int = DEFAULT_AUDIO_DELTA_COALESCE_MS,
+        session_history_turns: int = DEFAULT_SESSION_HISTORY_TURNS,
+        voice_live_pool_size: int = DEFAULT_POOL_SIZE,
+        voice_live_pool_idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
     ) -> None:
         self.settings = settings
         self.host = host
@@ -57,17 +106,56 @@ class WebSocketServer:
         self.play_input_audio = play_input_audio
         self.play_azure_audio = play_azure_audio
         self.testing_mode = testing_mode
+        # Per-session outbound queue limits (messages)
+        if not 0 <= outbound_low_watermark < outbound_high_watermark:
+            raise ValueError(
+                "Outbound low watermark must be non-negative and below the high watermark "
+                f"(got low={outbound_low_watermark}, high={outbound_high_watermark})."
+            )
+        self.outbound_high_watermark = outbound_high_watermark
+        self.outbound_low_watermark = outbound_low_watermark
+        self.outbound_drop_policy = outbound_drop_policy
+        # Default duration of the chunks fed to the translator; clients may override
+        # it per connection with ?chunk_ms=<n>
+        if not MIN_CHUNK_DURATION_MS <= chunk_duration_ms <= MAX_CHUNK_DURATION_MS:
+            raise ValueError(
+                f"Chunk duration must be between {MIN_CHUNK_DURATION_MS} and "
+                f"{MAX_CHUNK_DURATION_MS} ms (got {chunk_duration_ms})."
+            )
+        self.chunk_duration_ms = chunk_duration_ms
+        # Which inbound frames get a JSON ack; clients may override per connection
+        # with ?ack=<policy>&ack_every=<n>&ack_interval_ms=<ms>
+        self.ack_settings = AckSettings(policy=ack_policy, every=ack_every, interval_ms=ack_interval_ms)
+        # Translated audio is forwarded to the client as it arrives (in ~100 ms
+        # blocks by default) rather than once per completed response
+        self.audio_delta_mode = AudioDeltaMode(audio_delta_mode)
+        self.audio_delta_coalesce_ms = audio_delta_coalesce_ms
+        # Results are streamed to the client per turn, so translators only keep a
+        # short history for the end-of-stream summary
+        if session_history_turns < 0:
+            raise ValueError(f"Session history turns must not be negative (got {session_history_turns}).")
+        self.session_history_turns = session_history_turns
+        # Warm Voice Live sessions per server (0 disables the pool); created in serve()
+        if voice_live_pool_size < 0:
+            raise ValueError(f"Voice Live pool size must not be negative (got {voice_live_pool_size}).")
+        self.voice_live_pool_size = voice_live_pool_size
+        self.voice_live_pool_idle_timeout_s = voice_live_pool_idle_timeout_s
+        self._voice_live_pool: Optional[VoiceLiveConnectionPool] = None
         # Per-client session state management
         self._client_sessions: dict[str, dict] = {}
+        # Lifetime counters, reported by stats()
+        self.connections_total = 0
+        self.messages_total = 0
 
     async def _handle_client(self, ws: WebSocketServerProtocol, path: str) -> None:
         """Handle an incoming WebSocket connection."""
-        # Wrap websocket for logging
+        client_address = f"{ws.remote_address[0]}:{ws.remote_address[1]}"
+        # Wrap websocket for logging (written by a background thread, see websocket_logger)
         from .websocket_logger import WebSocketLogger
-        websocket = WebSocketLogger(ws, log_file="acs_messages.log", log_dir="logs")
+        websocket = WebSocketLogger(ws, log_file="acs_messages.log", log_dir="logs", session_id=client_address)
 
-        client_address = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
         client_key = client_address
+        self.connections_total += 1
         console.print(
             Panel.fit(
                 f"New WebSocket connection from {client_address}",
@@ -77,7 +165,7 @@ class WebSocketServer:
         )
 
         # Initialize streaming session
-        session = self._initialize_streaming_session(client_key)
+        session = self._initialize_streaming_session(client_key, websocket, path)
         translation_task = None
         playback_task = None
 
@@ -135,8 +223,9 @@ class WebSocketServer:
         session: dict,
     ) -> None:
         """Process an incoming message from the client."""
+        self.messages_total += 1
         if isinstance(message, bytes):
-            await self._handle_binary_message(websocket, message)
+            await self._handle_binary_message(websocket, message, session)
         elif isinstance(message, str):
             await self._handle_json_message(websocket, message, session)
 
@@ -144,16 +233,64 @@ class WebSocketServer:
         self,
         websocket: WebSocketServerProtocol,
         message: bytes,
+        session: dict,
     ) -> None:
-        """Handle a binary message from the client."""
-        message_size = len(message)
-        console.print(
-            f"[cyan]Received binary message: {message_size} bytes[/cyan]"
-        )
-        await websocket.send(json.dumps({
-            "status": "error",
-            "message": "Binary messages not supported. Please use ACS JSON format."
-        }))
+        """Handle a binary audio frame (only on sessions that negotiated binary framing)."""
+        if websocket.subprotocol != BINARY_SUBPROTOCOL:
+            console.print(f"[cyan]Received binary message: {len(message)} bytes[/cyan]")
+            await websocket.send(json.dumps({
+                "status": "error",
+                "message": (
+                    "Binary messages require the "
+                    f"'{BINARY_SUBPROTOCOL}' subprotocol. Otherwise use ACS JSON format."
+                ),
+            }))
+            return
+
+        try:
+            frame = decode_frame(message)
+        except FrameDecodeError as exc:
+            console.print(f"[red]Invalid binary frame: {exc}[/red]")
+            await websocket.send(json.dumps({
+                "status": "error",
+                "message": f"Invalid binary frame: {exc}",
+            }))
+            return
+
+        try:
+            if frame.pcm and not frame.silent:
+                await self._ingest_audio(
+                    websocket,
+                    session,
+                    frame.pcm,
+                    participant_id=frame.participant_id or "unknown",
+                    audio_format_data={
+                        "sampleRate": frame.sample_rate,
+                        "channels": frame.channels,
+                        "bitsPerSample": frame.bits_per_sample,
+                        "format": "pcm",
+                    },
+                    sequence_number=frame.sequence,
+                    timestamp=frame.timestamp,
+                )
+            elif frame.silent:
+                gap = self._validate_sequence(session, frame.sequence)
+                if session["ack_tracker"].should_ack(gap=gap):
+                    await websocket.send(json.dumps({
+                        "status": "skipped",
+                        "reason": "silent",
+                        "sequenceNumber": frame.sequence,
+                    }))
+        except Exception as e:
+            console.print(f"[red]Error processing binary frame: {e}[/red]")
+            logger.exception("Error in binary frame processing")
+            await websocket.send(json.dumps({
+                "status": "error",
+                "message": f"Processing error: {str(e)}"
+            }))
+
+        if frame.end_of_stream:
+            self._end_audio_stream(session)
 
     async def _handle_json_message(
         self,
@@ -179,9 +316,21 @@ class WebSocketServer:
                 "message": f"Processing error: {str(e)}"
             }))
 
-    def _initialize_streaming_session(self, client_key: str) -> dict:
+    def _initialize_streaming_session(
+        self,
+        client_key: str,
+        websocket: WebSocketServerProtocol,
+        path: str = "/",
+    ) -> dict:
         """Initialize a streaming session with audio queue for continuous translation."""
-        audio_queue: deque[bytes] = deque(maxlen=512)
+        options = parse_qs(urlsplit(path or "/").query)
+        chunk_duration_ms = self._chunk_duration_from_options(options)
+        chunk_bytes = TARGET_SAMPLE_RATE * chunk_duration_ms // 1000 * (TARGET_BITS_PER_SAMPLE // 8) * TARGET_CHANNELS
+        # Resampled frames are regrouped into fixed-duration chunks in place; the
+        # chunks queued for the translator are views into this ring, so the queue
+        # may not hold more of them than the ring can keep alive
+        stream_ring = PcmRingBuffer(chunk_bytes)
+        audio_queue = AudioChunkChannel(maxlen=stream_ring.max_outstanding_chunks)
         stop_streaming = threading.Event()
         
         # Create streaming AudioInput with both queue (for Voice Live) and stream (for SDK)
@@ -204,13 +353,15 @@ class WebSocketServer:
         
         session = {
             "audio_queue": audio_queue,
-            "playback_queue": deque(maxlen=512),  # Separate queue for playback
+            "playback_queue": AudioChunkChannel(maxlen=512),  # Separate queue for playback
             "stop_streaming": stop_streaming,
             "audio_input": audio_input,
-            # Buffer for normalising incoming ACS frames to ~100ms 16 kHz mono chunks
-            # before feeding them into the streaming pipeline (matches WAV/mic behaviour).
-            "stream_buffer": bytearray(),
+            # Ring for normalising incoming ACS frames to fixed-duration 16 kHz mono chunks
+            # (100 ms by default, matching WAV/mic behaviour) before the streaming pipeline.
+            "stream_ring": stream_ring,
+            "chunk_duration_ms": chunk_duration_ms,
             "expected_sequence": 0,
+            "ack_tracker": AckTracker(self._ack_settings_from_options(options)),
             "participant_id": None,
             "audio_format": {
                 "sample_rate": TARGET_SAMPLE_RATE,  # Default, will be updated from first chunk
@@ -218,25 +369,84 @@ class WebSocketServer:
                 "bits_per_sample": TARGET_BITS_PER_SAMPLE,
             },
             "last_timestamp": None,
-            # Logical 100ms chunks pushed into AudioInput (after resampling/aggregation)
+            # Logical chunks pushed into AudioInput (after resampling/aggregation)
             "chunk_count": 0,
             # Raw ACS frames received (before aggregation), used for resample logging/metrics
             "raw_chunk_count": 0,
             "bytes_received": 0,
             "translator": None,
+            # Stateful resamplers (created on first use) so filter history carries
+            # across frames: ACS audio -> 16 kHz, translator audio -> 16 kHz
+            "inbound_resampler": None,
+            "outbound_resampler": None,
+            # Translation events are queued here and written by a dedicated task so the
+            # translator never waits on the client's socket
+            "outbound": OutboundQueue(
+                websocket,
+                high_watermark=self.outbound_high_watermark,
+                low_watermark=self.outbound_low_watermark,
+                max_size=max(DEFAULT_MAX_SIZE, self.outbound_high_watermark),
+                drop_policy=self.outbound_drop_policy,
+            ),
             "format_initialized": False,  # Track if format was set from actual data
             "format_init_event": asyncio.Event(),  # Event to signal initialization
+            # Latency/queue metrics: when the first inbound frame arrived, whether the
+            # first translated audio has been observed, and the depth last reported
+            "first_audio_in_at": None,
+            "first_audio_out_seen": False,
+            "reported_queue_depth": 0,
         }
         
         self._client_sessions[client_key] = session
+        metrics.SESSIONS.inc()
+        metrics.ACTIVE_SESSIONS.inc()
         return session
 
+    def _chunk_duration_from_options(self, options: dict[str, list[str]]) -> int:
+        """Read the optional `chunk_ms` query parameter from the connection path."""
+        values = options.get("chunk_ms")
+        if not values:
+            return self.chunk_duration_ms
+        try:
+            chunk_duration_ms = int(values[-1])
+        except ValueError:
+            chunk_duration_ms = -1
+        if not MIN_CHUNK_DURATION_MS <= chunk_duration_ms <= MAX_CHUNK_DURATION_MS:
+            console.print(
+                f"[yellow]Ignoring invalid chunk_ms={values[-1]!r}; using {self.chunk_duration_ms} ms[/yellow]"
+            )
+            return self.chunk_duration_ms
+        console.print(f"[cyan]Session chunk duration: {chunk_duration_ms} ms[/cyan]")
+        return chunk_duration_ms
+
+    def _ack_settings_from_options(self, options: dict[str, list[str]]) -> AckSettings:
+        """Apply the optional `ack`, `ack_every` and `ack_interval_ms` query parameters."""
+        if not any(key in options for key in ("ack", "ack_every", "ack_interval_ms")):
+            return self.ack_settings
+        try:
+            settings = AckSettings(
+                policy=AckPolicy(options["ack"][-1]) if "ack" in options else self.ack_settings.policy,
+                every=int(options["ack_every"][-1]) if "ack_every" in options else self.ack_settings.every,
+                interval_ms=(
+                    int(options["ack_interval_ms"][-1])
+                    if "ack_interval_ms" in options
+                    else self.ack_settings.interval_ms
+                ),
+            )
+        except ValueError as exc:
+            console.print(f"[yellow]Ignoring invalid ack options: {exc}[/yellow]")
+            return self.ack_settings
+        console.print(f"[cyan]Session ack policy: {settings.policy.value}[/cyan]")
+        return settings
+
     def _cleanup_session(self, session: dict) -> None:
         """Clean up a streaming session."""
         if session.get("stop_streaming"):
             session["stop_streaming"].set()
         if session.get("audio_input"):
             session["audio_input"].close()
+        if session.get("playback_queue"):
+            session["playback_queue"].close()
 
     async def _cleanup_client(
         self,
@@ -259,22 +469,32 @@ class WebSocketServer:
                 await playback_task
             except asyncio.CancelledError:
                 pass
+        outbound: Optional[OutboundQueue] = session.get("outbound")
+        if outbound is not None:
+            await outbound.close()
+            console.print(f"[dim]Outbound queue stats: {outbound.stats.as_dict()}[/dim]")
+            close_log = getattr(outbound.websocket, "close_log", None)
+            if close_log is not None:
+                close_log()
         if client_key in self._client_sessions:
             del self._client_sessions[client_key]
+            metrics.ACTIVE_SESSIONS.dec()
+            metrics.AUDIO_QUEUE_DEPTH.dec(session["reported_queue_depth"])
 
-    def _validate_sequence(self, session: dict, sequence_number: int) -> None:
-        """Validate sequence number and update expected sequence."""
+    def _validate_sequence(self, session: dict, sequence_number: int) -> bool:
+        """Validate sequence number and update expected sequence. Returns True on a gap."""
         expected = session["expected_sequence"]
         if sequence_number < expected:
             console.print(
                 f"[yellow]Out-of-order chunk: got {sequence_number}, expected {expected}[/yellow]"
             )
         elif sequence_number > expected:
-            gap = sequence_number - expected
+            missing = sequence_number - expected
             console.print(
-                f"[yellow]Missing {gap} chunk(s): expected {expected}, got {sequence_number}[/yellow]"
+                f"[yellow]Missing {missing} chunk(s): expected {expected}, got {sequence_number}[/yellow]"
             )
         session["expected_sequence"] = sequence_number + 1
+        return sequence_number != expected
 
     async def _validate_audio_format(
         self,
@@ -355,7 +575,7 @@ class WebSocketServer:
             }))
             return None
 
-    def _resample_audio(self, audio_bytes: bytes, session: dict) -> Optional[bytes]:
+    def _resample_audio(self, audio_bytes: bytes, session: dict) -> Optional[np.ndarray]:
         """Resample and convert audio to mono 16kHz for translation service.
         
         Ensures output is:
@@ -363,6 +583,9 @@ class WebSocketServer:
         - Mono (1 channel)
         - 16-bit signed PCM
         - Little-endian byte order (required by Azure SDK)
+
+        Returns an int16 array that may be a view into the session resampler's
+        buffer; it is only valid until the next call.
         """
         # Get current format
         src_sample_rate = session["audio_format"]["sample_rate"]
@@ -379,80 +602,58 @@ class WebSocketServer:
             return None
         
         # Convert stereo to mono if needed
-        if src_channels == 2:
-            # Reshape to (samples, 2) and average the channels
-            audio_array = audio_array.reshape(-1, 2)
-            # Average channels (produces float64), then convert to int16
-            audio_array = audio_array.mean(axis=1).astype("<i2")
-        elif src_channels != 1:
+        if src_channels not in (1, 2):
             console.print(f"[yellow]Unsupported channel count: {src_channels}[/yellow]")
             return None
-        
-        # Resample if needed
+        audio_array = downmix_to_mono(audio_array, src_channels)
+
+        # Resample if needed; the session's resampler carries filter state across frames
         if src_sample_rate != TARGET_SAMPLE_RATE:
-            audio_array = self._linear_resample(
-                audio_array, src_sample_rate, TARGET_SAMPLE_RATE
-            )
-        
-        # Ensure we have little-endian int16 before converting to bytes
-        if audio_array.dtype != np.dtype("<i2"):
-            audio_array = audio_array.astype("<i2")
-        
-        # Convert back to bytes (tobytes() preserves the dtype's byte order)
-        resampled_audio_bytes = audio_array.tobytes()
-        
+            resampler = self._get_resampler(session, "inbound_resampler", src_sample_rate)
+            audio_array = resampler.process(audio_array)
+
         # Log resampling details for first few raw chunks
         raw_index = session.get("raw_chunk_count", 0)
         if raw_index < 3:
             console.print(
                 f"[dim]Resampled chunk #{raw_index + 1}: "
                 f"{len(audio_bytes)} bytes ({src_sample_rate}Hz, {src_channels}ch) → "
-                f"{len(resampled_audio_bytes)} bytes ({TARGET_SAMPLE_RATE}Hz, {TARGET_CHANNELS}ch)[/dim]"
+                f"{audio_array.nbytes} bytes ({TARGET_SAMPLE_RATE}Hz, {TARGET_CHANNELS}ch)[/dim]"
             )
 
-        return resampled_audio_bytes
+        return audio_array
 
     @staticmethod
-    def _linear_resample(
-        audio_array: np.ndarray,
-        src_sample_rate: int,
-        target_sample_rate: int,
-    ) -> np.ndarray:
-        """Resample audio using linear interpolation.
-        
-        Returns little-endian int16 array suitable for Azure SDK.
-        Values are clamped to int16 range to prevent overflow.
-        """
-        num_samples = len(audio_array)
-        duration = num_samples / src_sample_rate
-        target_num_samples = int(duration * target_sample_rate)
-
-        # Create new time axis
-        src_time = np.linspace(0, duration, num_samples, endpoint=False)
-        target_time = np.linspace(0, duration, target_num_samples, endpoint=False)
+    def _get_resampler(session: dict, key: str, src_sample_rate: int) -> StreamingResampler:
+        """Return the session's resampler for one direction, replacing it if the rate changed."""
+        resampler = session.get(key)
+        if resampler is None or resampler.src_rate != src_sample_rate:
+            resampler = StreamingResampler(src_sample_rate, TARGET_SAMPLE_RATE)
+            session[key] = resampler
+        return resampler
 
-        # Interpolate (np.interp returns float64)
-        resampled_float = np.interp(target_time, src_time, audio_array.astype(np.float64))
-        
-        # Clamp to int16 range to prevent overflow/clipping
-        resampled_float = np.clip(resampled_float, -32768, 32767)
-        
-        # Convert to little-endian int16 (required by Azure SDK)
-        return resampled_float.astype("<i2")
+    @staticmethod
+    def _parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+        """Parse an ACS ISO-8601 timestamp; returns None if missing or malformed."""
+        if not timestamp:
+            return None
+        try:
+            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return None
 
-    def _track_timestamp_from_string(self, timestamp: str, session: dict) -> None:
-        """Track timestamp from ISO string and detect gaps."""
-        if timestamp:
-            if session["last_timestamp"]:
-                try:
-                    last_dt = datetime.fromisoformat(session["last_timestamp"].replace("Z", "+00:00"))
-                    curr_dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    gap = (curr_dt - last_dt).total_seconds()
-                    if gap > 1.0:  # More than 1 second gap
-                        console.print(f"[yellow]Large time gap: {gap:.2f}s[/yellow]")
-                except Exception:
-                    pass
-            session["last_timestamp"] = timestamp
+    def _track_timestamp(self, timestamp: datetime, session: dict) -> None:
+        """Track frame timestamps and detect gaps."""
+        last_timestamp = session["last_timestamp"]
+        if last_timestamp:
+            try:
+                gap = (timestamp - last_timestamp).total_seconds()
+                if gap > 1.0:  # More than 1 second gap
+                    console.print(f"[yellow]Large time gap: {gap:.2f}s[/yellow]")
+            except TypeError:
+                # Mixed naive/aware timestamps; nothing useful to compare
+                pass
+        session["last_timestamp"] = timestamp
 
     async def _process_acs_message(
         self,
@@ -469,10 +670,7 @@ class WebSocketServer:
 
         # Handle end-of-stream signal
         if kind == "EndOfStream":
-            console.print("[cyan]Received end-of-stream signal, closing audio input[/cyan]")
-            # Close the audio input to trigger final commit in Voice Live
-            if session.get("audio_input"):
-                session["audio_input"].close()
+            self._end_audio_stream(session)
             return
 
         # Official ACS format: kind: "AudioData"
@@ -496,10 +694,11 @@ class WebSocketServer:
             # Skip silent chunks
             if is_silent:
                 console.print("[dim]Skipping silent audio chunk[/dim]")
-                await websocket.send(json.dumps({
-                    "status": "skipped",
-                    "reason": "silent"
-                }))
+                if session["ack_tracker"].should_ack():
+                    await websocket.send(json.dumps({
+                        "status": "skipped",
+                        "reason": "silent"
+                    }))
                 return
             
             # Check if format info is provided (optional in official format but needed for proper processing)
@@ -538,75 +737,96 @@ class WebSocketServer:
             }))
             return
 
-        # Step 3: Store participant ID if not set
+        # Step 3: Decode base64 audio
+        audio_bytes = await self._decode_audio(websocket, base64_audio)
+        if audio_bytes is None:
+            return
+
+        await self._ingest_audio(
+            websocket,
+            session,
+            audio_bytes,
+            participant_id=participant_id,
+            audio_format_data=audio_format_data,
+            sequence_number=sequence_number,
+            timestamp=self._parse_timestamp(timestamp),
+        )
+
+    async def _ingest_audio(
+        self,
+        websocket: WebSocketServerProtocol,
+        session: dict,
+        audio_bytes: Union[bytes, memoryview],
+        *,
+        participant_id: str,
+        audio_format_data: dict,
+        sequence_number: Optional[int],
+        timestamp: Optional[datetime],
+    ) -> None:
+        """Feed one decoded audio frame (ACS JSON or binary) into the streaming pipeline."""
+        # Step 4: Store participant ID if not set
         if not session["participant_id"]:
             session["participant_id"] = participant_id
             console.print(f"[cyan]Participant ID: {participant_id}[/cyan]")
 
-        # Step 4: Validate sequence (if present)
+        # Step 5: Validate sequence (if present)
+        sequence_gap = False
         if sequence_number is not None:
-            self._validate_sequence(session, sequence_number)
+            sequence_gap = self._validate_sequence(session, sequence_number)
         else:
             # Auto-increment sequence for official format
             session["expected_sequence"] += 1
 
-        # Step 5: Validate and store audio format
+        # Step 6: Validate and store audio format
         format_error = await self._validate_audio_format(websocket, audio_format_data, session)
         if format_error:
             return
 
-        # Step 6: Decode base64 audio
-        audio_bytes = await self._decode_audio(websocket, base64_audio)
-        if audio_bytes is None:
-            return
-
         # Step 7: Resample and convert audio to mono 16kHz for translation service
-        resampled_audio_bytes = self._resample_audio(audio_bytes, session)
-        if resampled_audio_bytes is None:
+        if session["first_audio_in_at"] is None:
+            session["first_audio_in_at"] = time.perf_counter()
+        metrics.INBOUND_FRAMES.inc()
+        resample_started = time.perf_counter()
+        resampled_audio = self._resample_audio(audio_bytes, session)
+        metrics.RESAMPLE_SECONDS.labels("inbound").observe(time.perf_counter() - resample_started)
+        if resampled_audio is None:
             return
 
         # Track raw bytes and frame count for diagnostics
         session["raw_chunk_count"] = session.get("raw_chunk_count", 0) + 1
         session["bytes_received"] += len(audio_bytes)
 
-        # Step 7b: Aggregate resampled audio into ~100ms chunks (3200 bytes @ 16kHz mono 16-bit)
-        # before feeding into the streaming pipeline so Voice Live sees the same temporal chunking
-        # as the WAV/microphone test paths.
-        stream_buffer: bytearray = session.get("stream_buffer")  # type: ignore[assignment]
-        if stream_buffer is None:
-            stream_buffer = bytearray()
-            session["stream_buffer"] = stream_buffer
-
-        stream_buffer.extend(resampled_audio_bytes)
-
-        CHUNK_SIZE_BYTES = 3200  # ~100ms at 16kHz mono 16-bit
+        # Step 7b: Aggregate resampled audio into fixed-duration chunks (100 ms by default)
+        # before feeding into the streaming pipeline so Voice Live sees the same temporal
+        # chunking as the WAV/microphone test paths. The ring copies the samples once and
+        # hands out views, which go straight into AudioInput (queue and SDK stream).
         produced_chunks = 0
-        while len(stream_buffer) >= CHUNK_SIZE_BYTES:
-            chunk = bytes(stream_buffer[:CHUNK_SIZE_BYTES])
-            del stream_buffer[:CHUNK_SIZE_BYTES]
-            # Use the write() method to feed both queue and SDK stream with normalised chunks
+        for chunk in session["stream_ring"].write(resampled_audio):
             session["audio_input"].write(chunk)
             session["chunk_count"] += 1
             produced_chunks += 1
+        self._report_queue_depth(session)
         
         # Also add ORIGINAL audio to playback queue so user can hear what's received (if enabled)
         if self.play_input_audio:
             playback_queue = session.get("playback_queue")
             if playback_queue is not None:
-                playback_queue.append(audio_bytes)  # Use original audio for playback
+                playback_queue.put(audio_bytes)  # Use original audio for playback
 
         # Log logical chunk reception periodically (post-aggregation)
         if produced_chunks > 0 and session["chunk_count"] % 10 == 0:
             console.print(
-                f"[dim]Received {session['chunk_count']} chunks (~100ms each), "
+                f"[dim]Received {session['chunk_count']} chunks (~{session['chunk_duration_ms']}ms each), "
                 f"total raw bytes: {session['bytes_received']}[/dim]"
             )
 
         # Step 8: Track timestamp
         if timestamp:
-            self._track_timestamp_from_string(timestamp, session)
+            self._track_timestamp(timestamp, session)
 
-        # Step 9: Send acknowledgment
+        # Step 9: Send acknowledgment if the session's ack policy asks for one
+        if not session["ack_tracker"].should_ack(gap=sequence_gap):
+            return
         ack = {
             "status": "received",
             # Report logical chunks pushed into the streaming pipeline; this is more meaningful
@@ -615,8 +835,37 @@ class WebSocketServer:
         }
         if sequence_number is not None:
             ack["sequenceNumber"] = sequence_number
+        if sequence_gap:
+            ack["sequenceGap"] = True
         await websocket.send(json.dumps(ack))
 
+    @staticmethod
+    def _report_queue_depth(session: dict) -> None:
+        """Publish the change in this session's translator queue depth."""
+        depth = len(session["audio_queue"])
+        delta = depth - session["reported_queue_depth"]
+        if delta:
+            metrics.AUDIO_QUEUE_DEPTH.inc(delta)
+            session["reported_queue_depth"] = depth
+
+    @staticmethod
+    def _observe_first_audio(session: dict) -> None:
+        """Record the call's first-audio latency once, when its first translated audio is queued."""
+        if session["first_audio_out_seen"] or session["first_audio_in_at"] is None:
+            return
+        session["first_audio_out_seen"] = True
+        metrics.FIRST_AUDIO_SECONDS.observe(time.perf_counter() - session["first_audio_in_at"])
+
+    def _end_audio_stream(self, session: dict) -> None:
+        """Forward the last partial chunk, then close the audio input to trigger the final commit."""
+        console.print("[cyan]Received end-of-stream signal, closing audio input[/cyan]")
+        if session.get("audio_input"):
+            tail = session["stream_ring"].drain_partial()
+            if tail is not None:
+                session["audio_input"].write(tail)
+                session["chunk_count"] += 1
+            session["audio_input"].close()
+
     async def _run_continuous_translation(
         self,
         websocket: WebSocketServerProtocol,
@@ -633,40 +882,48 @@ class WebSocketServer:
         )
 
         # Create translator once per session (maintains context)
-        translator = create_translator(
-            self.settings,
-            from_language=self.from_language,
-            to_languages=self.to_languages,
-            voice_name=self.voice,
-            output_audio_path=None,  # Don't save output for WebSocket mode
-            terminate_on_completion=False,  # Continuous streaming
-            local_audio_playback=self.play_azure_audio,
-        )
+        translator = self._create_translator()
         session["translator"] = translator
 
-        # Run translation in executor (it's synchronous but long-running)
-        loop = asyncio.get_event_loop()
+        # Run translation as a task on this loop so concurrent calls are not
+        # bounded by an executor pool
+        loop = asyncio.get_running_loop()
         on_translation_event = self._create_event_callback(websocket, loop, session)
         
         try:
-            # The translator.translate() will stream from audio_input.get_audio_chunks()
+            # The translator streams from audio_input.get_audio_chunks_async()
             # which reads from our audio_queue
             console.print("[dim]Waiting for audio chunks from WebSocket...[/dim]")
-            outcome = await loop.run_in_executor(
-                None,
-                lambda: translator.translate(session["audio_input"], on_event=on_translation_event),
+            outcome = await translator.translate_async(
+                session["audio_input"],
+                on_event=on_translation_event,
             )
 
-            await self._send_translation_result(websocket, outcome)
+            self._send_translation_result(session, outcome)
 
         except Exception as e:
             console.print(f"[red]Error in continuous translation: {e}[/red]")
             logger.exception("Error in continuous translation")
-            await websocket.send(json.dumps({
+            session["outbound"].put(json.dumps({
                 "status": "error",
                 "message": f"Translation processing failed: {str(e)}"
             }))
 
+    def _create_translator(self):
+        return create_translator(
+            self.settings,
+            from_language=self.from_language,
+            to_languages=self.to_languages,
+            voice_name=self.voice,
+            output_audio_path=None,  # Don't save output for WebSocket mode
+            terminate_on_completion=False,  # Continuous streaming
+            local_audio_playback=self.play_azure_audio,
+            audio_delta_mode=self.audio_delta_mode,
+            audio_delta_coalesce_ms=self.audio_delta_coalesce_ms,
+            history_turns=self.session_history_turns,
+            connection_pool=self._voice_live_pool,
+        )
+
     async def _wait_for_format_init(self, session: dict) -> bool:
         """Wait for audio format to be initialized. Returns False if timeout or stopped."""
         max_wait = 30  # Wait up to 30 seconds for first chunk
@@ -703,12 +960,14 @@ class WebSocketServer:
         session: dict,
     ):
         """Create callback to forward translation events to the WebSocket client."""
+        outbound: OutboundQueue = session["outbound"]
 
         def on_translation_event(event: dict) -> None:
             """Forward translation events to the WebSocket client.
 
-            This runs in the executor thread, so we need to schedule the send
-            on the main event loop using run_coroutine_threadsafe.
+            Voice Live calls this from its task on the server loop, Live Interpreter
+            from Speech SDK threads. Either way the payload is only queued; the
+            session's outbound writer task performs the actual send.
             """
             # If the client WebSocket or event loop is already closed, skip sending.
             if websocket.closed or loop.is_closed():
@@ -726,26 +985,14 @@ class WebSocketServer:
                     audio_size = len(event["audioData"].get("data", ""))
                     console.print(f"[dim]Forwarding synthesized audio to client: {audio_size} bytes (base64)[/dim]")
                 
-                payload = json.dumps(event)
-                try:
-                    future = asyncio.run_coroutine_threadsafe(
-                        websocket.send(payload),
-                        loop,
-                    )
-                    future.result(timeout=1.0)
-                except Exception as e:
-                    if isinstance(e, (ConnectionClosedOK, ConnectionClosedError)) or "Event loop is closed" in str(e):
-                        logger.debug(
-                            "Dropping translation event after client disconnect/loop close: %s",
-                            e,
-                        )
-                        return
-                    console.print(f"[yellow]Failed to send ACS audio event to client: {e}[/yellow]")
+                outbound.put(json.dumps(event), KIND_AUDIO)
+                self._observe_first_audio(session)
                 return
 
             # Convert Voice Live audio deltas into ACS-style AudioData payloads so the
             # same socket can be used to play translated audio back to the caller.
             payload: str
+            kind = KIND_CONTROL
             event_type = event.get("type")
 
             # Debug: log all events in testing mode
@@ -776,20 +1023,21 @@ class WebSocketServer:
                     )
                     return
 
-                audio_array = np.frombuffer(audio_bytes, dtype=np.int16)
-                if channels == 2:
-                    # Downmix stereo to mono if it ever occurs.
-                    audio_array = audio_array.reshape(-1, 2).mean(axis=1).astype(np.int16)
-                elif channels != 1:
+                audio_array = np.frombuffer(audio_bytes, dtype="<i2")
+                if channels not in (1, 2):
                     console.print(
                         f"[yellow]Unexpected channel count from translator: {channels}[/yellow]"
                     )
                     return
+                # Downmix stereo to mono if it ever occurs.
+                audio_array = downmix_to_mono(audio_array, channels)
+                channels = TARGET_CHANNELS
 
                 if sample_rate != TARGET_SAMPLE_RATE and audio_array.size:
-                    audio_array = self._linear_resample(
-                        audio_array, sample_rate, TARGET_SAMPLE_RATE
-                    )
+                    resampler = self._get_resampler(session, "outbound_resampler", sample_rate)
+                    resample_started = time.perf_counter()
+                    audio_array = resampler.process(audio_array)
+                    metrics.RESAMPLE_SECONDS.labels("outbound").observe(time.perf_counter() - resample_started)
                     sample_rate = TARGET_SAMPLE_RATE
 
                 audio_bytes_out = audio_array.tobytes()
@@ -816,6 +1064,8 @@ class WebSocketServer:
                     },
                 }
                 payload = json.dumps(acs_message)
+                kind = KIND_AUDIO
+                self._observe_first_audio(session)
             elif event_type == "translation.text_delta":
                 # In testing mode, forward text transcript events
                 if not self.testing_mode:
@@ -823,6 +1073,7 @@ class WebSocketServer:
 
                 console.print(f"[bold yellow]TESTING MODE: Sending text delta: {event.get('delta', '')}[/bold yellow]")
                 payload = json.dumps(event)
+                kind = KIND_TEXT
             elif event_type == "translation.complete":
                 # Complete translation event from Live Interpreter (when utterance is recognized)
                 # This provides real-time interpreter behavior - translation appears as soon as speaker finishes
@@ -835,29 +1086,13 @@ class WebSocketServer:
                 # Other non-audio events are forwarded as-is
                 payload = json.dumps(event)
 
-            try:
-                # Schedule the send on the main event loop
-                future = asyncio.run_coroutine_threadsafe(
-                    websocket.send(payload),
-                    loop,
-                )
-                # Wait for it to complete (with timeout to avoid blocking)
-                future.result(timeout=1.0)
-            except Exception as e:  # pragma: no cover - defensive logging
-                # Suppress noisy errors once the connection or loop is shutting down.
-                if isinstance(e, (ConnectionClosedOK, ConnectionClosedError)) or "Event loop is closed" in str(e):
-                    logger.debug(
-                        "Dropping translation event after client disconnect/loop close: %s",
-                        e,
-                    )
-                    return
-                console.print(f"[yellow]Failed to send event to client: {e}[/yellow]")
+            outbound.put(payload, kind)
 
         return on_translation_event
 
-    async def _send_translation_result(
+    def _send_translation_result(
         self,
-        websocket: WebSocketServerProtocol,
+        session: dict,
         outcome,
     ) -> None:
         """Send final translation result back to client."""
@@ -878,7 +1113,8 @@ class WebSocketServer:
         if outcome.error_details:
             response["error"] = outcome.error_details
 
-        await websocket.send(json.dumps(response))
+        # Queued behind any translation audio still waiting to be written
+        session["outbound"].put(json.dumps(response))
 
         if outcome.success:
             console.print("[green]Translation stream completed successfully[/green]")
@@ -956,14 +1192,13 @@ class WebSocketServer:
     async def _playback_loop(
         self,
         session: dict,
-        playback_queue: deque,
+        playback_queue: AudioChunkChannel,
         fmt: dict,
         audio_output_stream,
     ) -> None:
         """Main playback loop."""
         import numpy as np
         chunks_played = 0
-        empty_iterations = 0
         
         console.print("[dim]Starting playback loop...[/dim]")
         
@@ -973,56 +1208,55 @@ class WebSocketServer:
                 console.print("[yellow]Audio output stream became inactive, stopping playback[/yellow]")
                 break
             
-            if len(playback_queue) > 0:
-                empty_iterations = 0
-                chunk = playback_queue.popleft()
-                if chunk and len(chunk) > 0 and audio_output_stream:
-                    try:
-                        # Convert bytes to numpy array (16-bit PCM)
-                        audio_array = np.frombuffer(chunk, dtype=np.int16)
-                        
-                        if audio_array.size == 0:
-                            console.print("[yellow]Empty audio array from chunk[/yellow]")
-                            continue
-                        
-                        # Reshape for sounddevice: needs to be 2D (samples, channels)
-                        # For mono audio, reshape to (samples, 1)
-                        if fmt["channels"] == 1:
-                            if len(audio_array.shape) == 1:
-                                audio_array = audio_array.reshape(-1, 1)
-                        # For stereo, ensure it's (samples, 2)
-                        elif fmt["channels"] == 2:
-                            if len(audio_array.shape) == 1:
-                                # For stereo, we need to interleave or reshape correctly
-                                # Assuming interleaved stereo in the bytes
-                                audio_array = audio_array.reshape(-1, 2)
-                        
-                        # Write to audio output stream
-                        audio_output_stream.write(audio_array)
-                        chunks_played += 1
-                        
-                        # Log first few chunks and periodically
-                        if chunks_played <= 5 or chunks_played % 20 == 0:
-                            console.print(
-                                f"[dim]✓ Played chunk #{chunks_played}: "
-                                f"size={len(chunk)} bytes, shape={audio_array.shape}, "
-                                f"queue_remaining={len(playback_queue)}[/dim]"
-                            )
-                    except Exception as e:
-                        # Log playback errors with full details
-                        console.print(f"[red]Playback error on chunk #{chunks_played}: {e}[/red]")
-                        logger.exception("Playback error details")
-                        # Continue playing other chunks
-            else:
-                empty_iterations += 1
+            # Sleeps until a chunk arrives (or 1s passes) instead of polling
+            chunk = await playback_queue.get_async(timeout=1.0)
+            if chunk is END_OF_STREAM:
+                break
+            if chunk is None:
                 # Log if queue has been empty for a while (might indicate an issue)
-                if empty_iterations == 100:  # 1 second of empty queue
-                    console.print(
-                        f"[dim]Playback queue empty for 1s, waiting for chunks... "
-                        f"(played {chunks_played} chunks so far)[/dim]"
-                    )
-                    empty_iterations = 0  # Reset counter
-                await asyncio.sleep(0.01)  # Small delay when queue is empty
+                console.print(
+                    f"[dim]Playback queue empty for 1s, waiting for chunks... "
+                    f"(played {chunks_played} chunks so far)[/dim]"
+                )
+                continue
+
+            if chunk and len(chunk) > 0 and audio_output_stream:
+                try:
+                    # Convert bytes to numpy array (16-bit PCM)
+                    audio_array = np.frombuffer(chunk, dtype=np.int16)
+                    
+                    if audio_array.size == 0:
+                        console.print("[yellow]Empty audio array from chunk[/yellow]")
+                        continue
+                    
+                    # Reshape for sounddevice: needs to be 2D (samples, channels)
+                    # For mono audio, reshape to (samples, 1)
+                    if fmt["channels"] == 1:
+                        if len(audio_array.shape) == 1:
+                            audio_array = audio_array.reshape(-1, 1)
+                    # For stereo, ensure it's (samples, 2)
+                    elif fmt["channels"] == 2:
+                        if len(audio_array.shape) == 1:
+                            # For stereo, we need to interleave or reshape correctly
+                            # Assuming interleaved stereo in the bytes
+                            audio_array = audio_array.reshape(-1, 2)
+                    
+                    # Write to audio output stream
+                    audio_output_stream.write(audio_array)
+                    chunks_played += 1
+                    
+                    # Log first few chunks and periodically
+                    if chunks_played <= 5 or chunks_played % 20 == 0:
+                        console.print(
+                            f"[dim]✓ Played chunk #{chunks_played}: "
+                            f"size={len(chunk)} bytes, shape={audio_array.shape}, "
+                            f"queue_remaining={len(playback_queue)}[/dim]"
+                        )
+                except Exception as e:
+                    # Log playback errors with full details
+                    console.print(f"[red]Playback error on chunk #{chunks_played}: {e}[/red]")
+                    logger.exception("Playback error details")
+                    # Continue playing other chunks
 
     @staticmethod
     def _cleanup_audio_output(audio_output_stream) -> None:
@@ -1050,12 +1284,68 @@ class WebSocketServer:
             )
         )
 
-        async with websockets.serve(
-            self._handle_client,
-            self.host,
-            self.port,
-        ):
+        async with self.serve():
             console.print(f"[bold green]WebSocket server running on {server_info}[/bold green]")
             console.print("[yellow]Press Ctrl+C to stop the server[/yellow]")
             await asyncio.Future()  # Run forever
 
+    @asynccontextmanager
+    async def serve(self, **kwargs):
+        """Listen for clients (extra kwargs go to the loop) and yield the websockets server.
+
+        For Voice Live, also keeps a pool of warm sessions for the configured
+        language pair and voice while the server is up.
+        """
+        if self.voice_live_pool_size and self.settings.provider is SpeechProvider.VOICE_LIVE:
+            self._voice_live_pool = VoiceLiveConnectionPool(
+                size=self.voice_live_pool_size,
+                max_total=max(self.voice_live_pool_size, 4 * self.voice_live_pool_size),
+                idle_timeout_s=self.voice_live_pool_idle_timeout_s,
+            )
+            self._create_translator().prewarm(self._voice_live_pool, sample_rate=TARGET_SAMPLE_RATE)
+            console.print(f"[dim]Pre-warming {self.voice_live_pool_size} Voice Live session(s)[/dim]")
+        try:
+            async with websockets.serve(
+                self._handle_client,
+                self.host,
+                self.port,
+                # Clients that offer this subprotocol may send binary PCM frames;
+                # everyone else keeps using ACS JSON
+                subprotocols=[BINARY_SUBPROTOCOL],
+                # Plain HTTP GETs for /metrics and /health are answered before the handshake
+                process_request=self._process_http_request,
+                **kwargs,
+            ) as ws_server:
+                yield ws_server
+        finally:
+            if self._voice_live_pool is not None:
+                console.print(f"[dim]Voice Live pool stats: {self._voice_live_pool.stats.as_dict()}[/dim]")
+                await self._voice_live_pool.close()
+                self._voice_live_pool = None
+
+    async def _process_http_request(self, path: str, request_headers) -> Optional[tuple]:
+        """Serve /metrics and /health on the WebSocket port; anything else is a WebSocket handshake."""
+        route = urlsplit(path).path
+        if route == "/metrics":
+            body, content_type = metrics.render_metrics()
+            return HTTPStatus.OK, [("Content-Type", content_type)], body
+        if route in ("/health", "/healthz"):
+            body = json.dumps({"status": "ok", **self.stats()}).encode("utf-8")
+            return HTTPStatus.OK, [("Content-Type", "application/json")], body
+        return None
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for active sessions to end; True if they all did."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._client_sessions and loop.time() < deadline:
+            await asyncio.sleep(0.2)
+        return not self._client_sessions
+
+    def stats(self) -> dict[str, int]:
+        """Session and message counters for health reporting."""
+        return {
+            "active_sessions": len(self._client_sessions),
+            "connections_total": self.connections_total,
+            "messages_total": self.messages_total,
+        }
@@ -0,0 +1,396 @@
+"""Multi-process mode for the WebSocket server (`speech-poc serve --workers N`).
+
+A single `WebSocketServer` runs every call on one event loop, so JSON decoding,
+base64 and resampling for all calls share one core. `WorkerSupervisor` starts N
+worker processes that each run their own server on the same port with
+SO_REUSEPORT; the kernel spreads new connections across them. Calls never move
+between workers, which is fine because sessions are already isolated per client.
+
+The supervisor:
+
+* restarts workers that exit unexpectedly (with a back-off for crash loops);
+* on SIGHUP, replaces workers one at a time: the new worker starts listening
+  before the old one stops accepting and drains its active calls;
+* on SIGINT/SIGTERM, stops accepting on all workers and lets calls drain for up
+  to the graceful timeout;
+* serves aggregated health on `http://<host>:<health_port>/health` from the
+  counters each worker publishes to shared memory once per second, and the
+  workers' combined Prometheus metrics on `/metrics` (see `metrics`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from rich.console import Console
+
+from . import metrics
+from .config import SpeechServiceSettings
+from .websocket_logger import WIRE_LOG_WORKER_ENV
+
+console = Console()
+
+DEFAULT_GRACEFUL_TIMEOUT_S = 30.0
+DEFAULT_HEALTH_PORT = 8766
+# A worker is reported unhealthy when its counters are older than this
+HEARTBEAT_TIMEOUT_S = 5.0
+REPORT_INTERVAL_S = 1.0
+# Workers that die sooner than this after starting count as a crash loop
+MIN_UPTIME_S = 5.0
+MAX_RESTART_BACKOFF_S = 30.0
+# How long a replacement worker gets to start listening during a rolling restart
+READY_TIMEOUT_S = 15.0
+
+# Per-worker fields in the shared stats array
+_FIELDS = ("pid", "heartbeat", "active_sessions", "connections_total", "messages_total")
+_PID, _HEARTBEAT, _ACTIVE, _CONNECTIONS, _MESSAGES = range(len(_FIELDS))
+
+
+def reuse_port_supported() -> bool:
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def _worker_main(
+    slot: int,
+    settings: SpeechServiceSettings,
+    server_options: dict[str, Any],
+    stats,
+    graceful_timeout: float,
+) -> None:
+    """Entry point of a worker process."""
+    # Ctrl+C reaches the whole process group; only the supervisor reacts to it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Shared wire logs rotate per process, so each worker writes its own file
+    os.environ[WIRE_LOG_WORKER_ENV] = str(slot)
+    asyncio.run(_run_worker(slot, settings, server_options, stats, graceful_timeout))
+
+
+async def _run_worker(
+    slot: int,
+    settings: SpeechServiceSettings,
+    server_options: dict[str, Any],
+    stats,
+    graceful_timeout: float,
+) -> None:
+    # Imported here so the supervisor process never loads the Speech SDK
+    from .websocket_server import WebSocketServer
+
+    server = WebSocketServer(settings, **server_options)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stop.set)
+    base = slot * len(_FIELDS)
+
+    def _publish() -> None:
+        counters = server.stats()
+        stats[base + _PID] = os.getpid()
+        stats[base + _ACTIVE] = counters["active_sessions"]
+        stats[base + _CONNECTIONS] = counters["connections_total"]
+        stats[base + _MESSAGES] = counters["messages_total"]
+        stats[base + _HEARTBEAT] = time.time()
+
+    async with server.serve(reuse_port=True) as ws_server:
+        console.print(f"[bold green]Worker {slot} (pid {os.getpid()}) listening on ws://{server.host}:{server.port}[/bold green]")
+        while not stop.is_set():
+            _publish()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=REPORT_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+
+        # Stop accepting (other workers keep serving the port), then let calls finish
+        ws_server.server.close()
+        console.print(f"[yellow]Worker {slot} draining {len(server._client_sessions)} session(s)...[/yellow]")
+        drain_task = asyncio.create_task(server.drain(graceful_timeout))
+        while not drain_task.done():
+            _publish()
+            await asyncio.wait({drain_task}, timeout=REPORT_INTERVAL_S)
+        if not drain_task.result():
+            console.print(f"[yellow]Worker {slot}: graceful timeout reached, closing remaining sessions[/yellow]")
+    stats[base + _ACTIVE] = 0
+
+
+@dataclass
+class _Worker:
+    slot: int
+    process: multiprocessing.process.BaseProcess
+    started_at: float = field(default_factory=time.monotonic)
+    retiring: bool = False
+    # Set once an unexpected exit has been handled: when to start the replacement
+    restart_at: Optional[float] = None
+
+
+class WorkerSupervisor:
+    """Run `workers` WebSocket server processes sharing one port."""
+
+    def __init__(
+        self,
+        settings: SpeechServiceSettings,
+        server_options: dict[str, Any],
+        *,
+        workers: int,
+        health_port: Optional[int] = DEFAULT_HEALTH_PORT,
+        graceful_timeout: float = DEFAULT_GRACEFUL_TIMEOUT_S,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"Worker count must be at least 1 (got {workers}).")
+        if not reuse_port_supported():
+            raise RuntimeError("--workers requires SO_REUSEPORT, which this platform does not provide.")
+        self.settings = settings
+        self.server_options = server_options
+        self.workers = workers
+        self.health_port = health_port
+        self.graceful_timeout = graceful_timeout
+        # Spawn rather than fork: the Speech SDK's native threads do not survive fork
+        self._context = multiprocessing.get_context("spawn")
+        # Two slots per worker so a replacement can run next to the worker it replaces
+        self._slots = 2 * workers
+        self._stats = self._context.Array("d", self._slots * len(_FIELDS), lock=False)
+        self._active: dict[int, _Worker] = {}  # position (0..workers-1) -> current worker
+        self._retiring: list[_Worker] = []
+        self._backoff: dict[int, float] = {}
+        self._restarts = 0
+        self._started_at = time.time()
+        self._stopping = False
+        self._reload_requested = False
+        self._lock = threading.Lock()
+        self._metrics_dir: Optional[str] = None
+
+    # ------------------------------------------------------------------ processes
+
+    def _free_slot(self) -> int:
+        used = {w.slot for w in self._active.values()} | {w.slot for w in self._retiring}
+        for slot in range(self._slots):
+            if slot not in used:
+                return slot
+        raise RuntimeError("No free worker slot")  # pragma: no cover - reloads wait for draining workers
+
+    def _spawn(self) -> _Worker:
+        slot = self._free_slot()
+        base = slot * len(_FIELDS)
+        for offset in range(len(_FIELDS)):
+            self._stats[base + offset] = 0.0
+        process = self._context.Process(
+            target=_worker_main,
+            args=(slot, self.settings, self.server_options, self._stats, self.graceful_timeout),
+            name=f"speech-poc-worker-{slot}",
+            daemon=False,
+        )
+        process.start()
+        return _Worker(slot=slot, process=process)
+
+    def _wait_ready(self, worker: _Worker) -> bool:
+        """Wait until a new worker has published its first heartbeat (i.e. is listening)."""
+        deadline = time.monotonic() + READY_TIMEOUT_S
+        base = worker.slot * len(_FIELDS)
+        while time.monotonic() < deadline and worker.process.is_alive():
+            if self._stats[base + _HEARTBEAT] > 0:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.retiring = True
+        self._retiring.append(worker)
+        if worker.process.is_alive():
+            os.kill(worker.process.pid, signal.SIGTERM)
+
+    def _rolling_restart(self) -> None:
+        if self._retiring:
+            # Slots of the previous generation are still in use
+            console.print("[yellow]Previous reload is still draining; ignoring SIGHUP[/yellow]")
+            return
+        console.print("[bold cyan]Reloading workers one at a time...[/bold cyan]")
+        for position in range(self.workers):
+            if self._stopping:
+                return
+            replacement = self._spawn()
+            if not self._wait_ready(replacement):
+                console.print(f"[red]Replacement worker for position {position} did not start; keeping the old one[/red]")
+                replacement.process.terminate()
+                replacement.process.join(5)
+                continue
+            with self._lock:
+                old = self._active.get(position)
+                self._active[position] = replacement
+            if old is not None:
+                self._retire(old)
+        console.print("[bold green]Reload complete[/bold green]")
+
+    def _reap(self) -> None:
+        """Collect exited workers and restart unexpected exits."""
+        for worker in list(self._retiring):
+            if not worker.process.is_alive():
+                worker.process.join()
+                metrics.mark_process_dead(worker.process.pid)
+                self._retiring.remove(worker)
+
+        for position, worker in list(self._active.items()):
+            if worker.process.is_alive() or self._stopping:
+                continue
+            now = time.monotonic()
+            if worker.restart_at is None:
+                worker.process.join()
+                metrics.mark_process_dead(worker.process.pid)
+                uptime = now - worker.started_at
+                console.print(
+                    f"[red]Worker {worker.slot} (pid {worker.process.pid}) exited with code "
+                    f"{worker.process.exitcode} after {uptime:.1f}s[/red]"
+                )
+                backoff = self._backoff.get(position, 0.0)
+                backoff = min(MAX_RESTART_BACKOFF_S, max(1.0, backoff * 2)) if uptime < MIN_UPTIME_S else 0.0
+                self._backoff[position] = backoff
+                # Restarted on a later pass of the supervisor loop, so a crash loop
+                # never holds up signals or the other workers
+                worker.restart_at = now + backoff
+                if backoff:
+                    console.print(f"[yellow]Restarting position {position} in {backoff:.0f}s[/yellow]")
+            if now < worker.restart_at:
+                continue
+            with self._lock:
+                self._active[position] = self._spawn()
+                self._restarts += 1
+
+    def _shutdown(self) -> None:
+        workers = list(self._active.values()) + self._retiring
+        console.print(f"[yellow]Stopping {len(workers)} worker(s); draining calls for up to {self.graceful_timeout:.0f}s...[/yellow]")
+        for worker in workers:
+            if worker.process.is_alive():
+                os.kill(worker.process.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + 5.0
+        for worker in workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+
+    # ------------------------------------------------------------------ health
+
+    def health(self) -> dict[str, Any]:
+        """Aggregated worker state, as served on /health."""
+        now = time.time()
+        with self._lock:
+            workers = [(w, "active") for w in self._active.values()] + [(w, "draining") for w in self._retiring]
+        entries = []
+        totals = {"active_sessions": 0, "connections_total": 0, "messages_total": 0}
+        healthy = not self._stopping
+        for worker, state in sorted(workers, key=lambda item: item[0].slot):
+            base = worker.slot * len(_FIELDS)
+            values = {name: self._stats[base + offset] for offset, name in enumerate(_FIELDS)}
+            heartbeat_age = now - values["heartbeat"] if values["heartbeat"] else None
+            alive = worker.process.is_alive() and heartbeat_age is not None and heartbeat_age < HEARTBEAT_TIMEOUT_S
+            if state == "active" and not alive:
+                healthy = False
+            for key in totals:
+                totals[key] += int(values[key])
+            entries.append(
+                {
+                    "slot": worker.slot,
+                    "pid": worker.process.pid,
+                    "state": state,
+                    "alive": alive,
+                    "heartbeat_age_s": round(heartbeat_age, 2) if heartbeat_age is not None else None,
+                    "active_sessions": int(values["active_sessions"]),
+                    "connections_total": int(values["connections_total"]),
+                    "messages_total": int(values["messages_total"]),
+                }
+            )
+        return {
+            "status": "ok" if healthy else "degraded",
+            "workers": self.workers,
+            "restarts": self._restarts,
+            "uptime_s": round(now - self._started_at, 1),
+            **totals,
+            "processes": entries,
+        }
+
+    def _start_health_server(self) -> Optional[ThreadingHTTPServer]:
+        if self.health_port is None:
+            return None
+        supervisor = self
+
+        class _HealthHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                route = self.path.split("?")[0]
+                if route == "/metrics":
+                    body, content_type = metrics.render_metrics()
+                    status = 200
+                elif route in {"/health", "/healthz"}:
+                    report = supervisor.health()
+                    body = json.dumps(report).encode("utf-8")
+                    content_type = "application/json"
+                    status = 200 if report["status"] == "ok" else 503
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        host = self.server_options.get("host", "localhost")
+        httpd = ThreadingHTTPServer((host, self.health_port), _HealthHandler)
+        threading.Thread(target=httpd.serve_forever, name="health-server", daemon=True).start()
+        console.print(f"[dim]Health endpoint: http://{host}:{self.health_port}/health[/dim]")
+        return httpd
+
+    def _prepare_metrics_dir(self) -> None:
+        """Point workers at a shared directory for multiprocess Prometheus metrics."""
+        if os.environ.get(metrics.MULTIPROC_DIR_ENV):
+            return
+        self._metrics_dir = tempfile.mkdtemp(prefix="speech-poc-metrics-")
+        # Inherited by the spawned workers, read by render_metrics() here
+        os.environ[metrics.MULTIPROC_DIR_ENV] = self._metrics_dir
+
+    # ------------------------------------------------------------------ main loop
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _request_reload(self, signum, frame) -> None:
+        self._reload_requested = True
+
+    def run(self) -> None:
+        """Start the workers and supervise them until SIGINT/SIGTERM."""
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._request_reload)
+
+        self._prepare_metrics_dir()
+        httpd = self._start_health_server()
+        console.print(f"[bold magenta]Starting {self.workers} worker process(es) (supervisor pid {os.getpid()})[/bold magenta]")
+        try:
+            with self._lock:
+                for position in range(self.workers):
+                    self._active[position] = self._spawn()
+            while not self._stopping:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self._rolling_restart()
+                self._reap()
+                time.sleep(0.5)
+        finally:
+            self._stopping = True
+            if httpd is not None:
+                httpd.shutdown()
+            self._shutdown()
+            if self._metrics_dir is not None:
+                shutil.rmtree(self._metrics_dir, ignore_errors=True)
+            console.print("[yellow]All workers stopped[/yellow]")
@@ -8,6 +8,7 @@ import asyncio
 import base64
 import json
 import os
+import struct
 import subprocess
 import sys
 import tempfile
@@ -39,6 +40,31 @@ MIC_CHANNELS = 1
 MIC_BITS_PER_SAMPLE = 16
 MIC_CHUNK_SIZE = 3200  # ~100ms at 16kHz mono 16-bit
 
+# Binary PCM framing (see vt_voice_translation_poc/binary_framing.py):
+# version, flags, channels, bits per sample, sample rate, sequence,
+# timestamp (us since epoch), participant ID length; then participant ID and PCM.
+BINARY_SUBPROTOCOL = "vt-pcm.v1"
+BINARY_HEADER = struct.Struct("<BBBBIIQB")
+BINARY_FLAG_END_OF_STREAM = 0x02
+
+
+def _binary_frame(
+    pcm: bytes,
+    participant_id: str,
+    sample_rate: int,
+    channels: int,
+    bits_per_sample: int,
+    sequence: int,
+    flags: int = 0,
+) -> bytes:
+    """Pack one audio frame for servers that accepted the binary subprotocol."""
+    participant = participant_id.encode("utf-8")[:255]
+    timestamp_us = int(datetime.now(timezone.utc).timestamp() * 1_000_000)
+    header = BINARY_HEADER.pack(
+        1, flags, channels, bits_per_sample, sample_rate, sequence, timestamp_us, len(participant)
+    )
+    return header + participant + pcm
+
 
 def _get_server_command(uri: str) -> str:
     """Extract host and port from URI to suggest server command."""
@@ -133,14 +159,33 @@ def _convert_to_target_format(
         sys.exit(1)
 
 
+async def _print_responses(websocket, verbose: bool) -> None:
+    """Read server messages in the background.
+
+    Acknowledgements are optional (the server's ack policy may send none), so the
+    sender never waits for a reply to each chunk.
+    """
+    try:
+        async for response in websocket:
+            if verbose:
+                response_str = response.decode() if isinstance(response, bytes) else response
+                print(f"  → {response_str[:200]}")
+    except ConnectionClosedError:
+        pass
+
+
 async def send_audio_file(
     uri: str,
     audio_path: Path,
     chunk_size: int = 3200,
     verbose: bool = False,
     participant_id: Optional[str] = None,
+    binary: bool = False,
 ) -> None:
     """Send an audio file to the WebSocket server in chunks using ACS JSON format.
+
+    With binary=True the client offers the binary PCM subprotocol and, if the server
+    accepts it, sends raw PCM frames instead of base64 JSON.
     
     The audio is automatically converted to 16kHz, 16-bit, mono PCM if needed.
     
@@ -150,14 +195,20 @@ async def send_audio_file(
         chunk_size: Size of audio chunks in bytes
         verbose: Enable verbose output
         participant_id: Optional participant/sender ID for ACS format
+        binary: Negotiate binary PCM framing instead of ACS JSON
     """
     # Convert audio to target format (16kHz, 16-bit, mono)
     converted_path = _convert_to_target_format(audio_path, verbose=verbose)
     converted_is_temp = converted_path != audio_path
     
     try:
-        async with websockets.connect(uri) as websocket:
+        subprotocols = [BINARY_SUBPROTOCOL] if binary else None
+        async with websockets.connect(uri, subprotocols=subprotocols) as websocket:
             print(f"✓ Connected to {uri}")
+            use_binary = websocket.subprotocol == BINARY_SUBPROTOCOL
+            if binary and not use_binary:
+                print("  Server did not accept binary framing; falling back to ACS JSON")
+            reader_task = asyncio.create_task(_print_responses(websocket, verbose))
             
             with wave.open(str(converted_path), 'rb') as wav_file:
                 sample_rate = wav_file.getframerate()
@@ -172,7 +223,7 @@ async def send_audio_file(
                     print(f"  - Sample width: {sample_width} bytes")
                     print(f"  - Total frames: {frames}")
                     print(f"  - Duration: ~{frames / sample_rate:.2f} seconds")
-                    print(f"  - Format: ACS JSON with PCM 16-bit")
+                    print(f"  - Format: {'binary PCM frames' if use_binary else 'ACS JSON'} with PCM 16-bit")
                 
                 print(f"Sending audio: {audio_path.name} (format: {sample_rate}Hz, {sample_width*8}-bit, {channels}ch)")
                 chunk_count = 0
@@ -193,6 +244,21 @@ async def send_audio_file(
                     if not audio_chunk:
                         break
                     
+                    if use_binary:
+                        await websocket.send(_binary_frame(
+                            audio_chunk,
+                            participant_id,
+                            sample_rate,
+                            channels,
+                            sample_width * 8,
+                            chunk_count,
+                        ))
+                        if verbose:
+                            print(f"  Chunk {chunk_count}: {len(audio_chunk)} bytes (binary)")
+                        total_bytes += len(audio_chunk)
+                        chunk_count += 1
+                        continue
+
                     # Send in official ACS format: {"kind": "AudioData", "audioData": {...}}
                     # Note: We include optional format fields for proper audio processing
                     timestamp = datetime.now(timezone.utc).isoformat()
@@ -220,21 +286,21 @@ async def send_audio_file(
                     
                     total_bytes += len(audio_chunk)
                     chunk_count += 1
-                    
-                    # Wait for acknowledgment
-                    try:
-                        response = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                        if verbose:
-                            response_str = response.decode() if isinstance(response, bytes) else response
-                            print(f"  Chunk {chunk_count}: → {response_str}")
-                    except asyncio.TimeoutError:
-                        if verbose:
-                            print(f"  Chunk {chunk_count}: (no response)")
+                    # Yield so the response reader can keep up
+                    await asyncio.sleep(0)
                 
                 print(f"✓ Audio transmission complete")
                 print(f"  - Total chunks: {chunk_count}")
                 print(f"  - Total bytes: {total_bytes}")
-                print(f"  - Format: Official ACS JSON with base64-encoded audio")
+                if use_binary:
+                    await websocket.send(_binary_frame(
+                        b"", participant_id, sample_rate, channels, sample_width * 8,
+                        chunk_count, flags=BINARY_FLAG_END_OF_STREAM,
+                    ))
+                    print(f"  - Format: Binary PCM frames ({BINARY_SUBPROTOCOL})")
+                else:
+                    print(f"  - Format: Official ACS JSON with base64-encoded audio")
+            reader_task.cancel()
                 
     except FileNotFoundError:
         print(f"✗ Error: Audio file not found: {audio_path}", file=sys.stderr)
@@ -294,6 +360,7 @@ async def send_microphone_stream(
     try:
         async with websockets.connect(uri) as websocket:
             print(f"✓ Connected to {uri}")
+            reader_task = asyncio.create_task(_print_responses(websocket, verbose))
             
             if verbose:
                 print(f"Microphone streaming info:")
@@ -403,16 +470,6 @@ async def send_microphone_stream(
                         
                         total_bytes += len(audio_chunk)
                         chunk_count += 1
-                        
-                        # Wait for acknowledgment (with timeout to avoid blocking)
-                        try:
-                            response = await asyncio.wait_for(websocket.recv(), timeout=0.1)
-                            if verbose:
-                                response_str = response.decode() if isinstance(response, bytes) else response
-                                print(f"  Chunk {chunk_count}: → {response_str}")
-                        except asyncio.TimeoutError:
-                            if verbose and chunk_count <= 5:
-                                print(f"  Chunk {chunk_count}: (no response)")
                     else:
                         # No audio in queue, wait a bit
                         await asyncio.sleep(0.01)
@@ -426,6 +483,7 @@ async def send_microphone_stream(
                 print(f"  - Format: Official ACS JSON with base64-encoded audio")
                 
             finally:
+                reader_task.cancel()
                 # Stop and close audio stream
                 stop_capture.set()
                 if stream:
@@ -528,6 +586,9 @@ Examples:
   # Stream from microphone with duration limit
   python emit_audio.py --microphone --duration 10
 
+  # Send an audio file as binary PCM frames instead of base64 JSON
+  python emit_audio.py --audio samples/harvard.wav --binary
+
   # Send audio with custom participant ID
   python emit_audio.py --audio samples/harvard.wav --participant-id "4:+34646783858"
 
@@ -596,6 +657,11 @@ Note:
         default=3200,
         help='Audio chunk size in bytes (default: 3200 bytes = 100ms at 16kHz, 16-bit, mono)'
     )
+    parser.add_argument(
+        '--binary',
+        action='store_true',
+        help=f'Negotiate binary PCM framing ({BINARY_SUBPROTOCOL}) instead of ACS JSON (audio file mode)'
+    )
     parser.add_argument(
         '--participant-id',
         help='Participant/sender ID (auto-generated if not provided)'
@@ -646,7 +712,8 @@ Note:
             args.audio, 
             args.chunk_size, 
             args.verbose,
-            participant_id=args.participant_id
+            participant_id=args.participant_id,
+            binary=args.binary,
         ))
     elif args.microphone:
         asyncio.run(send_microphone_stream(
@@ -0,0 +1,57 @@
+"""Tests for the inbound audio ack policies."""
+
+import pytest
+
+from vt_voice_translation_poc import acks
+from vt_voice_translation_poc.acks import AckPolicy, AckSettings, AckTracker
+
+
+def _acks(tracker: AckTracker, frames: int, gaps: set = frozenset()) -> list:
+    return [index for index in range(frames) if tracker.should_ack(gap=index in gaps)]
+
+
+def test_none_never_acks_even_on_gaps():
+    tracker = AckTracker(AckSettings(policy=AckPolicy.NONE))
+    assert _acks(tracker, 10, gaps={3}) == []
+    assert tracker.sent == 0
+
+
+def test_every_acks_each_nth_frame():
+    tracker = AckTracker(AckSettings(policy=AckPolicy.EVERY, every=3))
+    assert _acks(tracker, 9) == [2, 5, 8]
+    assert tracker.sent == 3
+
+
+def test_every_one_acks_every_frame():
+    tracker = AckTracker(AckSettings(policy=AckPolicy.EVERY, every=1))
+    assert _acks(tracker, 4) == [0, 1, 2, 3]
+
+
+def test_gap_acks_immediately_and_restarts_the_count():
+    tracker = AckTracker(AckSettings(policy=AckPolicy.EVERY, every=3))
+    assert _acks(tracker, 8, gaps={1}) == [1, 4, 7]
+
+
+def test_gaps_policy_acks_only_gaps():
+    tracker = AckTracker(AckSettings(policy=AckPolicy.GAPS))
+    assert _acks(tracker, 10, gaps={2, 7}) == [2, 7]
+
+
+def test_interval_acks_at_most_once_per_interval(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(acks.time, "monotonic", lambda: now[0])
+    tracker = AckTracker(AckSettings(policy=AckPolicy.INTERVAL, interval_ms=1000))
+
+    acked = []
+    for index in range(10):
+        now[0] += 0.3
+        if tracker.should_ack():
+            acked.append(index)
+
+    assert acked == [3, 7]
+
+
+@pytest.mark.parametrize("options", [{"every": 0}, {"interval_ms": 0}])
+def test_invalid_settings_are_rejected(options):
+    with pytest.raises(ValueError):
+        AckSettings(**options)
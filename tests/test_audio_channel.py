@@ -0,0 +1,84 @@
+"""Tests for AudioChunkChannel."""
+
+import asyncio
+import threading
+
+import pytest
+
+from vt_voice_translation_poc.audio import END_OF_STREAM, AudioChunkChannel
+
+
+def test_fifo_and_oldest_chunk_dropped_when_full():
+    channel = AudioChunkChannel(maxlen=2)
+    for chunk in (b"a", b"b", b"c"):
+        channel.put(chunk)
+
+    assert channel.dropped == 1
+    assert channel.get(timeout=0) == b"b"
+    assert channel.get(timeout=0) == b"c"
+    assert channel.get(timeout=0) is None
+
+
+def test_close_drains_pending_chunks_then_ends_stream():
+    channel = AudioChunkChannel()
+    channel.put(b"a")
+    channel.close()
+    channel.put(b"ignored")
+
+    assert channel.closed
+    assert list(channel) == [b"a"]
+    assert channel.get(timeout=0) is END_OF_STREAM
+
+
+def test_blocking_get_is_woken_by_a_producer_thread():
+    channel = AudioChunkChannel()
+    timer = threading.Timer(0.05, channel.put, args=(b"late",))
+    timer.start()
+    try:
+        assert channel.get(timeout=5) == b"late"
+    finally:
+        timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_get_async_is_woken_by_a_producer_thread():
+    channel = AudioChunkChannel()
+    waiter = asyncio.create_task(channel.get_async(timeout=5))
+    await asyncio.sleep(0)
+    await asyncio.to_thread(channel.put, b"chunk")
+
+    assert await asyncio.wait_for(waiter, 1) == b"chunk"
+
+
+@pytest.mark.asyncio
+async def test_get_async_times_out_without_data():
+    channel = AudioChunkChannel()
+    assert await channel.get_async(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_stops_at_close():
+    channel = AudioChunkChannel()
+
+    async def produce():
+        for chunk in (b"a", b"b"):
+            channel.put(chunk)
+            await asyncio.sleep(0)
+        channel.close()
+
+    producer = asyncio.create_task(produce())
+    received = [chunk async for chunk in channel]
+    await producer
+
+    assert received == [b"a", b"b"]
+
+
+@pytest.mark.asyncio
+async def test_wait_closed_does_not_consume_chunks():
+    channel = AudioChunkChannel()
+    channel.put(b"a")
+    closer = asyncio.get_running_loop().call_later(0.01, channel.close)
+    await asyncio.wait_for(channel.wait_closed(), 1)
+    closer.cancel()
+
+    assert len(channel) == 1
@@ -0,0 +1,128 @@
+"""Tests for vt-pcm.v1 binary audio frames."""
+
+import json
+import struct
+
+import pytest
+
+from vt_voice_translation_poc.binary_framing import (
+    BINARY_SUBPROTOCOL,
+    HEADER_SIZE,
+    FrameDecodeError,
+    decode_frame,
+    encode_frame,
+)
+from vt_voice_translation_poc.config import SpeechServiceSettings
+from vt_voice_translation_poc.websocket_server import WebSocketServer
+
+
+def _frame(**overrides) -> bytes:
+    options = {"participant_id": "caller", "sample_rate": 16000, "sequence": 7}
+    options.update(overrides)
+    return encode_frame(options.pop("pcm", b"\x01\x00\x02\x00"), **options)
+
+
+def test_round_trip_preserves_every_field():
+    message = encode_frame(
+        b"\x01\x00\x02\x00\x03\x00\x04\x00",
+        participant_id="caller-é",
+        sample_rate=24000,
+        channels=2,
+        sequence=2**32 + 5,
+        timestamp_us=1_700_000_000_123_456,
+        silent=True,
+        end_of_stream=True,
+    )
+    frame = decode_frame(message)
+
+    assert frame.participant_id == "caller-é"
+    assert (frame.sample_rate, frame.channels, frame.bits_per_sample) == (24000, 2, 16)
+    assert frame.sequence == 5  # wraps at 32 bits
+    assert frame.timestamp_us == 1_700_000_000_123_456
+    assert frame.timestamp.year == 2023
+    assert frame.silent and frame.end_of_stream
+    assert bytes(frame.pcm) == b"\x01\x00\x02\x00\x03\x00\x04\x00"
+
+
+def test_pcm_is_a_view_into_the_message():
+    message = _frame()
+    frame = decode_frame(message)
+
+    assert isinstance(frame.pcm, memoryview)
+    assert frame.pcm.obj is message
+    assert frame.timestamp is None
+
+
+@pytest.mark.parametrize(
+    "message, reason",
+    [
+        (b"\x01" * (HEADER_SIZE - 1), "too short"),
+        (b"\x02" + _frame()[1:], "version"),
+        (_frame()[: HEADER_SIZE + 2], "participant ID"),
+        (_frame(pcm=b"\x01\x00\x02"), "whole number"),
+        (_frame(pcm=b"\x01\x00\x02\x00\x03\x00", channels=2), "whole number"),
+        (_frame(sample_rate=0), "sample rate"),
+        (_frame(channels=0), "channel count"),
+        (_frame(bits_per_sample=12), "bits per sample"),
+    ],
+)
+def test_malformed_frames_are_rejected(message, reason):
+    with pytest.raises(FrameDecodeError, match=reason):
+        decode_frame(message)
+
+
+def test_invalid_participant_encoding_is_rejected():
+    message = bytearray(_frame(participant_id="ab"))
+    message[HEADER_SIZE] = 0xFF
+    with pytest.raises(FrameDecodeError, match="UTF-8"):
+        decode_frame(bytes(message))
+
+
+def test_overlong_participant_id_cannot_be_encoded():
+    with pytest.raises(ValueError):
+        encode_frame(b"", participant_id="x" * 256, sample_rate=16000)
+
+
+def test_header_layout_is_fixed():
+    message = _frame(participant_id="p", pcm=b"")
+    assert struct.unpack_from("<BBBBIIQB", message) == (1, 0, 1, 16, 16000, 7, 0, 1)
+
+
+class RecordingWebSocket:
+    subprotocol = BINARY_SUBPROTOCOL
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(json.loads(payload))
+
+
+@pytest.mark.asyncio
+async def test_bad_frame_gets_an_error_reply():
+    server = WebSocketServer(SpeechServiceSettings(subscription_key="key", service_region="region"))
+    websocket = RecordingWebSocket()
+
+    await server._handle_binary_message(websocket, _frame(pcm=b"\x01"), {})
+
+    assert websocket.sent[0]["status"] == "error"
+    assert "whole number" in websocket.sent[0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_failure_gets_an_error_reply(monkeypatch):
+    server = WebSocketServer(SpeechServiceSettings(subscription_key="key", service_region="region"))
+    websocket = RecordingWebSocket()
+    ended = []
+
+    async def failing_ingest(*args, **kwargs):
+        raise ValueError("resampler rejected the frame")
+
+    monkeypatch.setattr(server, "_ingest_audio", failing_ingest)
+    monkeypatch.setattr(server, "_end_audio_stream", ended.append)
+    session = {}
+
+    await server._handle_binary_message(websocket, _frame(end_of_stream=True), session)
+
+    assert websocket.sent == [{"status": "error", "message": "Processing error: resampler rejected the frame"}]
+    assert ended == [session]
@@ -0,0 +1,148 @@
+"""Tests for ConversionCache."""
+
+import os
+
+import pytest
+
+from vt_voice_translation_poc import conversion_cache
+from vt_voice_translation_poc.conversion_cache import CONVERTER_VERSION, ConversionCache
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Replace the decoder with one that copies the source bytes and records calls."""
+    calls = []
+
+    def fake_decode(source_path, target_path, *, sample_rate, channels):
+        calls.append(source_path)
+        target_path.write_bytes(source_path.read_bytes())
+
+    monkeypatch.setattr(conversion_cache, "_decode_to_wav", fake_decode)
+    return calls
+
+
+def test_entry_is_keyed_on_content_and_format(tmp_path):
+    cache = ConversionCache(tmp_path / "cache")
+    first = tmp_path / "first.m4a"
+    copy = tmp_path / "renamed.m4a"
+    other = tmp_path / "other.m4a"
+    first.write_bytes(b"clip")
+    copy.write_bytes(b"clip")
+    other.write_bytes(b"different clip")
+
+    entry = cache.entry_path(first, sample_rate=16000, channels=1)
+
+    assert entry == cache.entry_path(copy, sample_rate=16000, channels=1)
+    assert entry.name.endswith(f"-16000hz-1ch-v{CONVERTER_VERSION}.wav")
+    assert "first" not in entry.name
+    assert entry != cache.entry_path(other, sample_rate=16000, channels=1)
+    assert entry != cache.entry_path(first, sample_rate=24000, channels=1)
+    assert entry != cache.entry_path(first, sample_rate=16000, channels=2)
+
+
+def test_identical_content_is_converted_once(tmp_path, decodes):
+    cache = ConversionCache(tmp_path / "cache")
+    first = tmp_path / "first.m4a"
+    copy = tmp_path / "nested" / "copy.m4a"
+    copy.parent.mkdir()
+    first.write_bytes(b"clip")
+    copy.write_bytes(b"clip")
+
+    converted = cache.get_or_convert(first, sample_rate=16000, channels=1, quiet=True)
+    reused = cache.get_or_convert(copy, sample_rate=16000, channels=1, quiet=True)
+
+    assert converted == reused
+    assert converted.read_bytes() == b"clip"
+    assert decodes == [first]
+
+
+def test_failed_conversion_leaves_no_entry_or_temp_file(tmp_path, monkeypatch):
+    cache = ConversionCache(tmp_path / "cache")
+    source = tmp_path / "clip.m4a"
+    source.write_bytes(b"clip")
+
+    def failing_decode(source_path, target_path, *, sample_rate, channels):
+        target_path.write_bytes(b"partial")
+        raise RuntimeError("decoder crashed")
+
+    monkeypatch.setattr(conversion_cache, "_decode_to_wav", failing_decode)
+
+    with pytest.raises(RuntimeError, match="decoder crashed"):
+        cache.get_or_convert(source, sample_rate=16000, channels=1, quiet=True)
+
+    assert not cache.entry_path(source, sample_rate=16000, channels=1).exists()
+    assert list(cache.directory.glob("*.wav")) == []
+
+
+def test_conversion_replaces_the_entry_atomically(tmp_path, monkeypatch):
+    cache = ConversionCache(tmp_path / "cache")
+    source = tmp_path / "clip.m4a"
+    source.write_bytes(b"clip")
+    target = cache.entry_path(source, sample_rate=16000, channels=1)
+    written_to = []
+
+    def fake_decode(source_path, target_path, *, sample_rate, channels):
+        # The decoder writes beside the entry, never the entry itself
+        assert not target.exists()
+        written_to.append(target_path)
+        target_path.write_bytes(b"converted")
+
+    monkeypatch.setattr(conversion_cache, "_decode_to_wav", fake_decode)
+
+    assert cache.get_or_convert(source, sample_rate=16000, channels=1, quiet=True) == target
+    assert written_to[0].parent == cache.directory
+    assert written_to[0] != target
+    assert not written_to[0].exists()
+    assert target.read_bytes() == b"converted"
+
+
+def test_eviction_removes_least_recently_used_entries(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    cache = ConversionCache(directory, max_bytes=25)
+    entries = []
+    for index in range(4):
+        entry = directory / f"entry{index}.wav"
+        entry.write_bytes(b"x" * 10)
+        os.utime(entry, (1000 + index, 1000 + index))
+        entries.append(entry)
+    temp = directory / ".tmp-in-progress.wav"
+    temp.write_bytes(b"x" * 10)
+
+    freed = cache.evict(keep=entries[0])
+
+    assert freed == 20
+    assert [entry.exists() for entry in entries] == [True, False, False, True]
+    assert temp.exists()
+
+
+def test_cache_hit_refreshes_recency(tmp_path, decodes):
+    cache = ConversionCache(tmp_path / "cache")
+    source = tmp_path / "clip.m4a"
+    source.write_bytes(b"clip")
+
+    entry = cache.get_or_convert(source, sample_rate=16000, channels=1, quiet=True)
+    os.utime(entry, (1000, 1000))
+    assert cache.get_or_convert(source, sample_rate=16000, channels=1, quiet=True) == entry
+
+    assert entry.stat().st_mtime > 1000
+    assert decodes == [source]
+
+
+@pytest.mark.parametrize("raw", ["lots", "1.5", "-1"])
+def test_invalid_max_size_is_rejected(monkeypatch, tmp_path, raw):
+    monkeypatch.setenv("AUDIO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AUDIO_CACHE_MAX_MB", raw)
+
+    with pytest.raises(RuntimeError, match="AUDIO_CACHE_MAX_MB"):
+        ConversionCache.from_env()
+
+
+def test_max_size_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIO_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AUDIO_CACHE_MAX_MB", "3")
+
+    cache = ConversionCache.from_env()
+
+    assert cache.directory == tmp_path
+    assert cache.max_bytes == 3 * 1024 * 1024
@@ -0,0 +1,133 @@
+"""Tests for LiveInterpreterTranslator session setup."""
+
+from types import SimpleNamespace
+
+import azure.cognitiveservices.speech as speechsdk
+import pytest
+
+from vt_voice_translation_poc import live_interpreter
+from vt_voice_translation_poc.config import SpeechServiceSettings
+from vt_voice_translation_poc.live_interpreter import LiveInterpreterTranslator
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.handlers = []
+
+    def connect(self, handler) -> None:
+        self.handlers.append(handler)
+
+    def fire(self, evt) -> None:
+        for handler in self.handlers:
+            handler(evt)
+
+
+class FakeTranslationConfig:
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.properties = {}
+        self.target_languages = []
+        self.voice_name = None
+
+    def set_property(self, property_id, value) -> None:
+        self.properties[property_id] = value
+
+    def add_target_language(self, language) -> None:
+        self.target_languages.append(language)
+
+
+class FakeAutoDetectConfig:
+    def __init__(self, languages) -> None:
+        self.languages = languages
+
+
+class FakeRecognizer:
+    def __init__(self, translation_config, audio_config, auto_detect_source_language_config) -> None:
+        self.translation_config = translation_config
+        self.audio_config = audio_config
+        self.auto_detect_config = auto_detect_source_language_config
+        self.recognizing = FakeSignal()
+        self.recognized = FakeSignal()
+        self.synthesizing = FakeSignal()
+        self.canceled = FakeSignal()
+        self.session_stopped = FakeSignal()
+
+
+@pytest.fixture
+def stub_sdk(monkeypatch):
+    """Replace the SDK classes that talk to the service; enums stay real."""
+    monkeypatch.setattr(speechsdk.translation, "SpeechTranslationConfig", FakeTranslationConfig)
+    monkeypatch.setattr(speechsdk.translation, "TranslationRecognizer", FakeRecognizer)
+    monkeypatch.setattr(speechsdk.languageconfig, "AutoDetectSourceLanguageConfig", FakeAutoDetectConfig)
+    live_interpreter._translation_configs.cache_clear()
+    yield
+    live_interpreter._translation_configs.cache_clear()
+
+
+def _translator(**kwargs) -> LiveInterpreterTranslator:
+    settings = SpeechServiceSettings(
+        subscription_key="key",
+        service_region="westus",
+        endpoint="wss://example.invalid/speech",
+    )
+    return LiveInterpreterTranslator(settings, quiet=True, **kwargs)
+
+
+def test_start_recognition_wires_the_shared_configs(stub_sdk):
+    audio_input = SimpleNamespace(config=object())
+
+    session = _translator()._start_recognition(audio_input, on_event=None)
+    recognizer = session.recognizer
+
+    assert isinstance(recognizer, FakeRecognizer)
+    assert recognizer.audio_config is audio_input.config
+    assert recognizer.translation_config.target_languages == ["en-US", "es-ES"]
+    assert recognizer.auto_detect_config.languages == ("en-US", "es-ES")
+    # A voice is auto-selected, so synthesis is wired up
+    assert recognizer.translation_config.voice_name == "en-US-JennyNeural"
+    assert len(recognizer.synthesizing.handlers) == 1
+    assert all(
+        len(signal.handlers) == 1
+        for signal in (recognizer.recognizing, recognizer.recognized, recognizer.canceled, recognizer.session_stopped)
+    )
+
+
+def test_recognized_event_emits_the_opposite_language(stub_sdk):
+    events = []
+    session = _translator()._start_recognition(SimpleNamespace(config=object()), on_event=events.append)
+    result = SimpleNamespace(
+        text="Hello there",
+        translations={"en": "Hello there", "es": "Hola"},
+        properties={speechsdk.PropertyId.SpeechServiceConnection_AutoDetectSourceLanguageResult: "en-US"},
+        reason=speechsdk.ResultReason.TranslatedSpeech,
+    )
+
+    session.recognizer.recognized.fire(SimpleNamespace(result=result))
+
+    assert events[-1] == {
+        "type": "translation.complete",
+        "language": "es",
+        "text": "Hola",
+        "recognized_text": "Hello there",
+        "detected_source_language": "en-US",
+    }
+    assert list(session.all_recognized_text) == ["Hello there"]
+    assert session.final_reason == speechsdk.ResultReason.TranslatedSpeech
+
+
+def test_config_notes_follow_the_translator_console(stub_sdk, monkeypatch, capsys):
+    class EndpointlessConfig(FakeTranslationConfig):
+        def __init__(self, **kwargs) -> None:
+            if "endpoint" in kwargs:
+                raise ValueError("endpoint rejected")
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(speechsdk.translation, "SpeechTranslationConfig", EndpointlessConfig)
+
+    # The quiet translator takes the cache miss, so nothing may leak to stdout
+    _translator()._start_recognition(SimpleNamespace(config=object()), on_event=None)
+    assert capsys.readouterr().out == ""
+
+    settings = _translator().settings
+    LiveInterpreterTranslator(settings)._start_recognition(SimpleNamespace(config=object()), on_event=None)
+    assert "endpoint rejected" in capsys.readouterr().out
@@ -0,0 +1,111 @@
+"""Tests for the per-session outbound queue."""
+
+import asyncio
+
+import pytest
+
+from vt_voice_translation_poc.outbound import (
+    KIND_AUDIO,
+    KIND_CONTROL,
+    KIND_TEXT,
+    OutboundDropPolicy,
+    OutboundQueue,
+)
+
+
+class GatedWebSocket:
+    """Records sent payloads; sends block while the gate is closed."""
+
+    def __init__(self, open_gate: bool = True) -> None:
+        self.sent = []
+        self.gate = asyncio.Event()
+        if open_gate:
+            self.gate.set()
+
+    async def send(self, payload):
+        await self.gate.wait()
+        self.sent.append(payload)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_messages_are_sent_in_order():
+    ws = GatedWebSocket()
+    queue = OutboundQueue(ws)
+    for index in range(5):
+        queue.put(f"m{index}", KIND_TEXT)
+    await queue.close()
+
+    assert ws.sent == [f"m{index}" for index in range(5)]
+    assert queue.stats.sent == 5
+    assert queue.stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_text_is_shed_above_high_watermark_until_below_low():
+    ws = GatedWebSocket(open_gate=False)
+    queue = OutboundQueue(ws, high_watermark=4, low_watermark=1, max_size=10)
+    await _settle()  # the writer holds the first message while the gate is closed
+
+    queue.put("c0", KIND_CONTROL)
+    await _settle()
+    queue.put("t1", KIND_TEXT)
+    for index in range(2, 6):
+        queue.put(f"c{index}", KIND_CONTROL)
+
+    # Depth reached the high watermark: queued text is purged, new text is shed
+    queue.put("t6", KIND_TEXT)
+    queue.put("a7", KIND_AUDIO)
+    assert queue.stats.shedding_episodes == 1
+    assert queue.stats.dropped == 2
+
+    ws.gate.set()
+    await _settle()
+    assert queue.depth <= queue.low_watermark
+
+    # Drained below the low watermark: text is accepted again
+    queue.put("t8", KIND_TEXT)
+    await queue.close()
+
+    assert ws.sent == ["c0", "c2", "c3", "c4", "c5", "a7", "t8"]
+
+
+@pytest.mark.asyncio
+async def test_none_policy_keeps_text_and_max_size_caps_the_queue():
+    ws = GatedWebSocket(open_gate=False)
+    queue = OutboundQueue(ws, high_watermark=2, low_watermark=1, max_size=3, drop_policy=OutboundDropPolicy.NONE)
+    await _settle()
+
+    for index in range(5):
+        queue.put(f"t{index}", KIND_TEXT)
+
+    assert queue.stats.dropped == 0
+    assert queue.depth == 3
+    assert queue.stats.overflowed == 2
+
+    ws.gate.set()
+    await queue.close()
+    assert ws.sent == ["t0", "t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_put_from_another_thread_is_delivered():
+    ws = GatedWebSocket()
+    queue = OutboundQueue(ws)
+    await asyncio.to_thread(queue.put, "from-thread", KIND_AUDIO)
+    await _settle()
+    await queue.close()
+
+    assert ws.sent == ["from-thread"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_watermarks_are_rejected():
+    with pytest.raises(ValueError):
+        OutboundQueue(GatedWebSocket(), high_watermark=10, low_watermark=10)
+    with pytest.raises(ValueError):
+        OutboundQueue(GatedWebSocket(), high_watermark=10, low_watermark=1, max_size=5)
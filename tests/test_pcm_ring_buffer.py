@@ -0,0 +1,65 @@
+"""Tests for PcmRingBuffer."""
+
+import pytest
+
+from vt_voice_translation_poc.audio import PcmRingBuffer
+
+
+def test_frames_are_regrouped_into_equal_chunks():
+    ring = PcmRingBuffer(chunk_bytes=4, slots=4)
+
+    assert ring.write(b"abc") == []
+    chunks = ring.write(b"defghij")
+
+    assert [bytes(chunk) for chunk in chunks] == [b"abcd", b"efgh"]
+    assert ring.pending == 2
+    assert bytes(ring.drain_partial()) == b"ij"
+    assert ring.pending == 0
+    assert ring.drain_partial() is None
+
+
+def test_frames_wrap_around_the_end_of_the_ring():
+    ring = PcmRingBuffer(chunk_bytes=4, slots=3)
+    data = bytes(range(40))
+    received = []
+    for offset in range(0, len(data), 5):
+        received.extend(bytes(chunk) for chunk in ring.write(data[offset : offset + 5]))
+
+    assert b"".join(received) == data
+
+
+def test_slots_are_reused_after_max_outstanding_chunks():
+    ring = PcmRingBuffer(chunk_bytes=2, slots=4)
+    held = []
+    for value in range(ring.max_outstanding_chunks):
+        held.extend(ring.write(bytes([value, value])))
+
+    # Chunks within the outstanding limit still hold their own data
+    assert [bytes(chunk) for chunk in held] == [b"\x00\x00", b"\x01\x01"]
+
+    # Writing past the limit reuses the oldest slot: chunk N shares memory with
+    # chunk N + slots, which overwrites it in place
+    later = []
+    for value in range(2, 2 + ring.slots):
+        later.extend(ring.write(bytes([value, value])))
+    reused = later[ring.slots - len(held)]
+    assert bytes(reused) == b"\x04\x04"
+    assert bytes(held[0]) == bytes(reused)
+
+
+def test_chunks_are_writable_views_over_one_buffer():
+    ring = PcmRingBuffer(chunk_bytes=2, slots=3)
+    first, second = ring.write(b"abcd")
+
+    assert isinstance(first, memoryview)
+    assert not first.readonly
+    assert first.obj is second.obj
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        PcmRingBuffer(chunk_bytes=0)
+    with pytest.raises(ValueError):
+        PcmRingBuffer(chunk_bytes=4, slots=2)
+    with pytest.raises(ValueError):
+        PcmRingBuffer(chunk_bytes=4, slots=3).write(b"x" * 9)
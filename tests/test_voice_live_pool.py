@@ -0,0 +1,204 @@
+"""Tests for the Voice Live connection pool against a local fake Voice Live server."""
+
+import asyncio
+import json
+import time
+
+import pytest
+import websockets
+
+from vt_voice_translation_poc.config import SpeechServiceSettings
+from vt_voice_translation_poc.voice_live import VoiceLiveConfig, VoiceLiveTranslator
+from vt_voice_translation_poc.voice_live_pool import VoiceLiveConnectionPool
+
+
+class FakeVoiceLiveServer:
+    """Accepts sessions and records the session.update each one sends."""
+
+    def __init__(self) -> None:
+        self.connections = []
+        self.session_updates = []
+        self._server = None
+
+    async def __aenter__(self) -> "FakeVoiceLiveServer":
+        self._server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        port = next(iter(self._server.sockets)).getsockname()[1]
+        return f"ws://127.0.0.1:{port}/openai/realtime"
+
+    @property
+    def open_connections(self) -> int:
+        return sum(1 for connection in self.connections if connection.open)
+
+    async def _handle(self, websocket, path=None) -> None:
+        self.connections.append(websocket)
+        async for message in websocket:
+            self.session_updates.append(json.loads(message)["type"])
+
+
+def _translator() -> VoiceLiveTranslator:
+    return VoiceLiveTranslator(
+        SpeechServiceSettings(subscription_key="key", service_region="region"),
+        from_language="en-US",
+        to_languages=["es"],
+        voice_name=None,
+        output_audio_path=None,
+    )
+
+
+def _config(url: str, to_language: str = "es") -> VoiceLiveConfig:
+    return VoiceLiveConfig(
+        websocket_url=url,
+        api_key="key",
+        from_language="en-US",
+        to_languages=[to_language],
+        voice_name=None,
+        sample_rate_hz=16000,
+        channels=1,
+        deployment=None,
+        output_sample_rate_hz=24000,
+        commit_interval=10,
+        silence_chunks=5,
+        force_commit_chunks=50,
+    )
+
+
+async def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached in time")
+        await asyncio.sleep(0.01)
+
+
+def _pool(**options) -> VoiceLiveConnectionPool:
+    # Maintenance is driven by the tests through _check_sessions()
+    options.setdefault("health_check_interval_s", 3600)
+    return VoiceLiveConnectionPool(**options)
+
+
+@pytest.mark.asyncio
+async def test_acquire_hits_warm_session_and_misses_cold_key():
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=2)
+        translator = _translator()
+        pool.register(translator, _config(server.url), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 2)
+        # Warm sessions were configured before any call asked for them
+        await _wait_for(lambda: len(server.session_updates) == 2)
+        assert server.session_updates == ["session.update", "session.update"]
+
+        websocket = pool.acquire(translator, _config(server.url))
+        assert websocket is not None and websocket.open
+        assert pool.acquire(translator, _config(server.url, to_language="fr")) is None
+        assert (pool.stats.hits, pool.stats.misses) == (1, 1)
+
+        # Both keys are topped back up in the background
+        await _wait_for(lambda: pool.idle_count == 4)
+        await websocket.close()
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_closed_and_replaced():
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=2, idle_timeout_s=0)
+        pool.register(_translator(), _config(server.url), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 2)
+        await asyncio.sleep(0.01)
+
+        await pool._check_sessions()
+
+        assert pool.stats.expired == 2
+        await _wait_for(lambda: pool.stats.opened == 4 and server.open_connections == 2)
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_sessions_are_evicted():
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=2)
+        pool.register(_translator(), _config(server.url), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 2)
+
+        await server.connections[0].close()
+        await _wait_for(lambda: any(not idle.websocket.open for state in pool._keys.values() for idle in state.idle))
+        await pool._check_sessions()
+
+        assert pool.stats.unhealthy == 1
+        assert pool.stats.expired == 0
+        await _wait_for(lambda: pool.idle_count == 2 and pool.stats.opened == 3)
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_stay_available_while_pinged(monkeypatch):
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=3)
+        translator = _translator()
+        pool.register(translator, _config(server.url), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 3)
+
+        async def slow_ping(websocket):
+            await asyncio.sleep(0.2)
+            return True
+
+        monkeypatch.setattr(pool, "_healthy", slow_ping)
+        started = time.monotonic()
+        check = asyncio.create_task(pool._check_sessions())
+        await asyncio.sleep(0.05)
+
+        websocket = pool.acquire(translator, _config(server.url))
+        await check
+
+        assert websocket is not None
+        assert pool.stats.hits == 1
+        assert time.monotonic() - started < 0.5  # pinged concurrently, not 3 x 0.2 s
+        await websocket.close()
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_max_total_caps_sessions_across_keys():
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=2, max_total=3)
+        translator = _translator()
+        pool.register(translator, _config(server.url), pinned=True)
+        pool.register(translator, _config(server.url, to_language="fr"), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 3)
+        await asyncio.sleep(0.05)
+
+        assert pool.stats.opened == 3
+        assert server.open_connections == 3
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_sessions_and_stops_refilling():
+    async with FakeVoiceLiveServer() as server:
+        pool = _pool(size=2)
+        translator = _translator()
+        pool.register(translator, _config(server.url), pinned=True)
+        await _wait_for(lambda: pool.idle_count == 2)
+
+        await pool.close()
+
+        assert pool.idle_count == 0
+        await _wait_for(lambda: server.open_connections == 0)
+        assert pool.acquire(translator, _config(server.url)) is None
+        await asyncio.sleep(0.05)
+        assert pool.stats.opened == 2
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        VoiceLiveConnectionPool(size=0)
+    with pytest.raises(ValueError):
+        VoiceLiveConnectionPool(size=3, max_total=2)
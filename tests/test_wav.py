@@ -0,0 +1,150 @@
+"""Tests for WavFile."""
+
+import struct
+import wave
+
+import pytest
+
+from vt_voice_translation_poc.wav import (
+    WAVE_FORMAT_EXTENSIBLE,
+    WAVE_FORMAT_PCM,
+    WavFile,
+    WavFormatError,
+    downmix_to_mono,
+    read_wav_format,
+)
+
+# KSDATAFORMAT_SUBTYPE_PCM: the PCM tag followed by the fixed GUID suffix
+PCM_SUBFORMAT = struct.pack("<H", WAVE_FORMAT_PCM) + bytes.fromhex("000000001000800000aa00389b71")
+
+
+def _chunk(chunk_id: bytes, body: bytes, *, size=None) -> bytes:
+    padding = b"\x00" if len(body) % 2 else b""
+    return chunk_id + struct.pack("<I", len(body) if size is None else size) + body + padding
+
+
+def _fmt(*, sample_rate=16000, channels=1, bits=16, extensible=False, sub_format=PCM_SUBFORMAT) -> bytes:
+    block_align = channels * bits // 8
+    tag = WAVE_FORMAT_EXTENSIBLE if extensible else WAVE_FORMAT_PCM
+    body = struct.pack("<HHIIHH", tag, channels, sample_rate, sample_rate * block_align, block_align, bits)
+    if extensible:
+        body += struct.pack("<HHI", 22, bits, 0) + sub_format
+    return _chunk(b"fmt ", body)
+
+
+def _write_riff(path, *chunks: bytes) -> None:
+    payload = b"WAVE" + b"".join(chunks)
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(payload)) + payload)
+
+
+def _write_with_wave(path, pcm: bytes, *, sample_rate=16000, channels=1, sample_width=2) -> None:
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(sample_rate)
+        writer.writeframes(pcm)
+
+
+def test_reads_format_and_data_written_by_wave(tmp_path):
+    path = tmp_path / "clip.wav"
+    pcm = bytes(range(256)) * 4
+    _write_with_wave(path, pcm, sample_rate=24000, channels=2)
+
+    with WavFile(path) as wav:
+        assert (wav.format.sample_rate, wav.format.channels, wav.format.sample_width) == (24000, 2, 2)
+        assert wav.num_frames == len(pcm) // 4
+        assert bytes(wav.data) == pcm
+        assert wav.duration_s == pytest.approx(len(pcm) / 4 / 24000)
+    assert read_wav_format(path) == wav.format
+
+
+@pytest.mark.parametrize("frames_per_chunk", [1, 7, 160, 10_000])
+def test_chunks_match_wave_readframes(tmp_path, frames_per_chunk):
+    path = tmp_path / "clip.wav"
+    # 1001 stereo frames, so most chunk sizes leave a short final chunk
+    _write_with_wave(path, bytes(i % 251 for i in range(1001 * 4)), channels=2)
+
+    expected = []
+    with wave.open(str(path), "rb") as reader:
+        while frames := reader.readframes(frames_per_chunk):
+            expected.append(frames)
+
+    with WavFile(path) as wav:
+        assert [bytes(chunk) for chunk in wav.chunks(frames_per_chunk)] == expected
+        assert bytes(wav.frames(10, 5)) == b"".join(expected)[10 * 4 : 15 * 4]
+
+
+def test_extensible_pcm_header(tmp_path):
+    path = tmp_path / "extensible.wav"
+    pcm = b"\x01\x00\x02\x00\x03\x00\x04\x00"
+    _write_riff(path, _fmt(channels=2, extensible=True), _chunk(b"data", pcm))
+
+    with WavFile(path) as wav:
+        assert (wav.format.channels, wav.format.sample_width) == (2, 2)
+        assert bytes(wav.data) == pcm
+
+
+def test_extensible_non_pcm_is_rejected(tmp_path):
+    path = tmp_path / "float.wav"
+    float_subformat = struct.pack("<H", 0x0003) + PCM_SUBFORMAT[2:]
+    _write_riff(path, _fmt(bits=32, extensible=True, sub_format=float_subformat), _chunk(b"data", b"\x00" * 8))
+
+    with pytest.raises(WavFormatError, match="not PCM"):
+        WavFile(path)
+
+
+def test_odd_sized_chunks_are_skipped_with_padding(tmp_path):
+    path = tmp_path / "padded.wav"
+    pcm = b"\x10\x00\x20\x00"
+    _write_riff(path, _chunk(b"LIST", b"odd"), _fmt(), _chunk(b"junk", b"x"), _chunk(b"data", pcm))
+
+    with WavFile(path) as wav:
+        assert bytes(wav.data) == pcm
+
+
+def test_truncated_data_is_clamped_to_whole_frames(tmp_path):
+    path = tmp_path / "truncated.wav"
+    # The header claims more data than the file holds, ending mid-frame
+    _write_riff(path, _fmt(channels=2), _chunk(b"data", b"\x01" * 10, size=4000))
+
+    with WavFile(path) as wav:
+        assert wav.num_frames == 2
+        assert bytes(wav.data) == b"\x01" * 8
+
+
+def test_data_before_fmt_is_rejected(tmp_path):
+    path = tmp_path / "reversed.wav"
+    _write_riff(path, _chunk(b"data", b"\x00\x00"), _fmt())
+
+    with pytest.raises(WavFormatError, match="before its fmt chunk"):
+        WavFile(path)
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [(b"", "empty"), (b"not a wav file", "not a RIFF/WAVE"), (b"RIFF\x04\x00\x00\x00WAVE", "no data chunk")],
+)
+def test_invalid_files_are_rejected(tmp_path, content, message):
+    path = tmp_path / "broken.wav"
+    path.write_bytes(content)
+
+    with pytest.raises(WavFormatError, match=message):
+        WavFile(path)
+
+
+def test_chunks_stay_valid_after_close(tmp_path):
+    path = tmp_path / "clip.wav"
+    _write_with_wave(path, b"\x01\x02" * 100)
+
+    wav = WavFile(path)
+    chunk = next(wav.chunks(10))
+    wav.close()
+
+    assert bytes(chunk) == b"\x01\x02" * 10
+
+
+def test_stereo_is_downmixed_like_integer_division():
+    left, right = -3, 4
+    pcm = struct.pack("<hh", left, right)
+
+    assert downmix_to_mono(pcm, 2) == struct.pack("<h", (left + right) // 2)